@@ -0,0 +1,9 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Throughput benchmarks for the MDF pipeline, upload workflow, search and export.
+
+corpus.py generates a deterministic synthetic MDF corpus; run.py times the
+hot paths against it (database ones on a throwaway pgserver) and writes JSON;
+compare.py diffs two result files. See run.py for usage.
+"""
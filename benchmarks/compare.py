@@ -0,0 +1,69 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+compare.py — Compare two benchmarks/run.py result files.
+
+Prints the median time of every benchmark in both files and the ratio
+new/old. Results from different corpus settings are not comparable, so a
+corpus mismatch is reported first.
+
+Usage:
+    uv run python -m benchmarks.compare OLD.json NEW.json [--threshold 1.10]
+
+Exits 1 if any benchmark got slower than --threshold (default 1.10, i.e. 10%).
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def compare(old: dict, new: dict) -> list[tuple[str, float | None, float | None, float | None]]:
+    """(name, old median s, new median s, new/old) for every benchmark in either file."""
+    rows = []
+    for name in [*old["results"], *(n for n in new["results"] if n not in old["results"])]:
+        before = old["results"].get(name, {}).get("median_s")
+        after = new["results"].get(name, {}).get("median_s")
+        ratio = after / before if before and after is not None else None
+        rows.append((name, before, after, ratio))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("old", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument("--threshold", type=float, default=1.10, help="new/old ratio counted as a regression")
+    args = parser.parse_args()
+
+    old = json.loads(args.old.read_text(encoding="utf-8"))
+    new = json.loads(args.new.read_text(encoding="utf-8"))
+    if old["corpus"] != new["corpus"]:
+        print(f"WARNING: corpus settings differ\n  old: {old['corpus']}\n  new: {new['corpus']}")
+
+    print(f"old: {old['commit'][:12]}{' (dirty)' if old['dirty'] else ''}  {old['timestamp']}")
+    print(f"new: {new['commit'][:12]}{' (dirty)' if new['dirty'] else ''}  {new['timestamp']}\n")
+    print(f"{'benchmark':<26} {'old (ms)':>10} {'new (ms)':>10} {'new/old':>8}")
+
+    def ms(seconds):
+        return f"{seconds * 1000:>10.1f}" if seconds is not None else f"{'-':>10}"
+
+    regressions = []
+    for name, before, after, ratio in compare(old, new):
+        flag = ""
+        if ratio is not None and ratio > args.threshold:
+            flag = "  SLOWER"
+            regressions.append(name)
+        elif ratio is not None and ratio < 1 / args.threshold:
+            flag = "  faster"
+        print(f"{name:<26} {ms(before)} {ms(after)} {f'{ratio:.2f}' if ratio else '-':>8}{flag}")
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than {args.threshold:.2f}x: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
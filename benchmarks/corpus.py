@@ -0,0 +1,130 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Deterministic synthetic MDF corpus in the shape of the SNEA dictionaries.
+
+Headwords are built from Algonquian-style syllables, with diacritics (ô, â,
+ê, û) and the ∞ letter at configurable rates. Records carry homonym numbers,
+\\so lines with [iso] language tags, subentries with their own glosses and
+tags, and \\nt Record: ids. The same CorpusSpec always yields the same text,
+so timings are comparable across commits.
+"""
+
+import random
+from dataclasses import asdict, dataclass
+
+_ONSETS = ["", "k", "m", "n", "p", "s", "t", "w", "y", "ch", "sh", "h", "kw", "mw", "sk"]
+_VOWELS = ["a", "e", "i", "o", "u", "aa", "ee"]
+_MARKED_VOWELS = ["ô", "â", "ê", "û", "í"]
+_CODAS = ["", "", "", "n", "s", "k", "m", "sh", "t"]
+_LANGUAGES = [
+    ("Mohegan-Pequot", "xpq"),
+    ("Wampanoag", "wam"),
+    ("Narragansett", "xnt"),
+    ("Mohican", "mjy"),
+    ("Munsee", "umu"),
+    ("English", "eng"),
+]
+_CITATIONS = ["Prince-Speck 1904", "Trumbull 1903", "Fielding 2006", "Williams 1643", "Eliot 1663"]
+_PARTS_OF_SPEECH = ["n", "na", "ni", "vai", "vii", "vta", "vti", "adv", "pn", "particle"]
+_GLOSS_WORDS = [
+    "corn", "river", "canoe", "fish", "deer", "house", "fire", "water", "stone", "bird",
+    "snow", "wind", "child", "mother", "basket", "shell", "path", "moon", "sun", "berry",
+    "walk", "see", "eat", "speak", "carry", "run", "sleep", "give", "make", "hear",
+    "big", "small", "white", "red", "old", "new", "far", "near", "quickly", "again",
+]  # fmt: skip
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    records: int = 1000
+    homonym_rate: float = 0.08
+    diacritic_rate: float = 0.35
+    infinity_rate: float = 0.05
+    lang_tag_rate: float = 0.6
+    subentry_rate: float = 0.3
+    record_ids: bool = True
+    seed: int = 20260101
+    # Bumps glosses and definitions but keeps headwords, for re-upload matching
+    revision: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class _Generator:
+    def __init__(self, spec: CorpusSpec):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        # Glosses drift per revision without disturbing the headword stream
+        self.text_rng = random.Random(f"{spec.seed}:{spec.revision}")
+
+    def syllable(self) -> str:
+        rng = self.rng
+        if rng.random() < self.spec.infinity_rate:
+            vowel = "∞"
+        elif rng.random() < self.spec.diacritic_rate:
+            vowel = rng.choice(_MARKED_VOWELS)
+        else:
+            vowel = rng.choice(_VOWELS)
+        return rng.choice(_ONSETS) + vowel + rng.choice(_CODAS)
+
+    def word(self) -> str:
+        return "".join(self.syllable() for _ in range(self.rng.randint(2, 4)))
+
+    def gloss(self) -> str:
+        return " ".join(self.text_rng.sample(_GLOSS_WORDS, self.text_rng.randint(1, 3)))
+
+    def source_line(self) -> str | None:
+        if self.rng.random() >= self.spec.lang_tag_rate:
+            return None
+        name, code = self.rng.choice(_LANGUAGES)
+        return f"\\so {name} [{code}]; {self.rng.choice(_CITATIONS)}"
+
+    def headwords(self) -> list[tuple[str, int]]:
+        """(lx, hm) per record; homonyms reuse an earlier headword with the next hm."""
+        result = []
+        counts: dict[str, int] = {}
+        for _ in range(self.spec.records):
+            if result and self.rng.random() < self.spec.homonym_rate:
+                lx = self.rng.choice(result)[0]
+            else:
+                lx = self.word()
+            counts[lx] = counts.get(lx, 0) + 1
+            result.append((lx, counts[lx]))
+        return result
+
+    def record(self, lx: str, hm: int, record_id: int) -> str:
+        rng = self.rng
+        lines = [f"\\lx {lx}", f"\\hm {hm}", f"\\ps {rng.choice(_PARTS_OF_SPEECH)}", f"\\ge {self.gloss()}"]
+        lines.append(f"\\de {self.gloss()}; {self.gloss()} (rev {self.spec.revision})")
+        source = self.source_line()
+        if source:
+            lines.append(source)
+        if rng.random() < 0.2:
+            lines.append(f"\\va {self.word()}")
+        roll = rng.random()
+        # A third of the records with subentries have two
+        subentries = 2 if roll < self.spec.subentry_rate / 3 else 1 if roll < self.spec.subentry_rate else 0
+        for _ in range(subentries):
+            lines += ["", f"\\se {lx}{self.syllable()}", f"\\ge {self.gloss()}"]
+            source = self.source_line()
+            if source:
+                lines.append(source)
+        if rng.random() < 0.25:
+            lines += ["", f"\\xv {lx} {self.word()}", f"\\xe {self.gloss()}"]
+        if self.spec.record_ids:
+            lines += ["", f"\\nt Record: {record_id}"]
+        lines.append("\\dt 01/Jan/2026")
+        return "\n".join(lines)
+
+
+def generate_records(spec: CorpusSpec) -> list[str]:
+    """One MDF text per record; record i carries \\nt Record: i (1-based)."""
+    generator = _Generator(spec)
+    return [generator.record(lx, hm, i) for i, (lx, hm) in enumerate(generator.headwords(), 1)]
+
+
+def generate_corpus(spec: CorpusSpec) -> str:
+    """The records as a single upload file."""
+    return "\n\n".join(generate_records(spec)) + "\n"
@@ -0,0 +1,466 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+loadtest.py — Concurrent editors, searchers and uploaders against the service layer.
+
+Loads the synthetic corpus into a throwaway pgserver (as benchmarks/run.py
+does), then for each --users level runs that many threads for --duration
+seconds through the app's own get_engine() pool. Each virtual user takes a
+role from --mix:
+
+    search  search_records in a random mode, get_record, load_preferences
+    edit    get_record and update_record on one of --hot-records records,
+            save_preferences, log_activity
+    upload  stage_entries of a revised slice, suggest_matches,
+            approve_all_by_record_match, then rollback_session with
+            probability --rollback-rate
+
+Per level it reports throughput, latency percentiles per operation, pool
+checkout times (waiting for a slot plus opening a connection), failures by
+cause (stale_data, deadlock, pool_timeout, lock_timeout, too_many_clients,
+other) and, sampled from pg_stat_activity, peak connections and lock
+waiters. Services that catch and log their errors still count: the error
+logs are classified against the operation that emitted them. Results go to
+tmp/loadtest/<commit>.json (or --output).
+
+Usage:
+    uv run python -m benchmarks.loadtest [--users 5 10 20 40] [--duration 30] [--mix search=6,edit=3,upload=1]
+                                         [--hot-records 50] [--think-ms 100] [--records 2000]
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import shutil
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import UTC, datetime
+from pathlib import Path
+
+from benchmarks.corpus import CorpusSpec, generate_corpus
+from benchmarks.run import DB_PATH, Context, git_commit, seed_identity, start_database
+
+project_root = Path(__file__).parent.parent
+RESULTS_DIR = project_root / "tmp" / "loadtest"
+ROLES = ("search", "edit", "upload")
+UPLOAD_SLICE = 20
+UPLOAD_REVISIONS = 5
+MONITOR_INTERVAL = 0.5
+
+_ERROR_PATTERNS = [
+    ("stale_data", re.compile(r"expected to (update|delete) \d+ row|StaleDataError", re.IGNORECASE)),
+    ("deadlock", re.compile(r"deadlock detected", re.IGNORECASE)),
+    ("pool_timeout", re.compile(r"QueuePool limit|connection timed out, timeout", re.IGNORECASE)),
+    ("lock_timeout", re.compile(r"lock timeout|could not obtain lock", re.IGNORECASE)),
+    ("too_many_clients", re.compile(r"too many clients|remaining connection slots", re.IGNORECASE)),
+]
+
+_current = threading.local()
+
+
+def classify(text: str) -> str | None:
+    for cause, pattern in _ERROR_PATTERNS:
+        if pattern.search(text):
+            return cause
+    return None
+
+
+def percentile(ordered: list[float], q: float) -> float | None:
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class _ErrorLogClassifier(logging.Handler):
+    """Attributes errors that services log (and swallow) to the running operation."""
+
+    def emit(self, record):
+        causes = getattr(_current, "causes", None)
+        if causes is None:
+            return
+        cause = classify(record.getMessage()) or (classify(str(record.exc_info[1])) if record.exc_info else None)
+        if cause:
+            causes.add(cause)
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = {}
+        self.failures: dict[str, Counter] = {}
+        self.checkouts: list[float] = []
+
+    def record(self, op: str, seconds: float, ok: bool, causes: set[str]) -> None:
+        with self._lock:
+            self.latencies.setdefault(op, []).append(seconds)
+            failures = self.failures.setdefault(op, Counter())
+            if not ok:
+                failures["failed"] += 1
+            failures.update(causes)
+
+    def checkout(self, seconds: float) -> None:
+        with self._lock:
+            self.checkouts.append(seconds)
+
+    def timed(self, op: str, func, *args, **kwargs):
+        """Run one service call; returns its result, or None if it raised."""
+        _current.causes = causes = set()
+        ok, result = True, None
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            ok = result is not False
+        except Exception as e:
+            ok = False
+            causes.add(classify(f"{type(e).__name__}: {e}") or "other")
+        finally:
+            self.record(op, time.perf_counter() - start, ok, causes)
+            _current.causes = None
+        return result
+
+
+class Monitor(threading.Thread):
+    """Samples server-side connections and lock waiters outside the app's pool."""
+
+    def __init__(self, url: str, pool):
+        super().__init__(name="snea-loadtest-monitor", daemon=True)
+        from sqlalchemy import create_engine
+        from sqlalchemy.pool import NullPool
+
+        self._engine = create_engine(url, poolclass=NullPool)
+        self._pool = pool
+        self._done = threading.Event()
+        self.peak_connections = self.peak_lock_waits = self.peak_checked_out = 0
+
+    def deadlocks(self) -> int:
+        from sqlalchemy import text
+
+        with self._engine.connect() as conn:
+            return conn.execute(
+                text("SELECT deadlocks FROM pg_stat_database WHERE datname = current_database()")
+            ).scalar()
+
+    def run(self):
+        from sqlalchemy import text
+
+        sample = text(
+            "SELECT count(*), count(*) FILTER (WHERE wait_event_type = 'Lock') FROM pg_stat_activity "
+            "WHERE datname = current_database() AND pid <> pg_backend_pid()"
+        )
+        with self._engine.connect() as conn:
+            while not self._done.wait(MONITOR_INTERVAL):
+                connections, lock_waits = conn.execute(sample).one()
+                conn.rollback()
+                self.peak_connections = max(self.peak_connections, connections)
+                self.peak_lock_waits = max(self.peak_lock_waits, lock_waits)
+                self.peak_checked_out = max(self.peak_checked_out, self._pool.checkedout())
+
+    def stop(self):
+        self._done.set()
+        self.join()
+        self._engine.dispose()
+
+
+def instrument_pool(engine, recorders: list) -> None:
+    """Time every pool checkout; recorders[0] is the level currently running."""
+    pool = engine.pool
+    connect = pool.connect
+
+    def timed_connect():
+        start = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            recorders[0].checkout(time.perf_counter() - start)
+
+    pool.connect = timed_connect
+
+
+class Workload:
+    """Shared inputs for the virtual users."""
+
+    def __init__(self, ctx: Context, hot_records: int, rollback_rate: float):
+        from src.database.connection import get_session
+        from src.database.models.core import Record
+        from src.mdf.parser import parse_mdf
+
+        self.ctx = ctx
+        self.rollback_rate = rollback_rate
+        with get_session() as session:
+            ids = [
+                rid for (rid,) in session.query(Record.id).filter(Record.source_id == ctx.source_id).order_by(Record.id)
+            ]
+        self.record_ids = ids
+        self.hot_ids = ids[:hot_records]
+        self.terms = {mode: ctx.search_terms(mode) for mode in ("Lexeme", "FTS", "Headword", "Gloss")}
+        self.revisions = [
+            parse_mdf(generate_corpus(CorpusSpec(**{**ctx.spec.as_dict(), "revision": 100 + r})))
+            for r in range(UPLOAD_REVISIONS)
+        ]
+
+
+def search(rec: Recorder, work: Workload, rng: random.Random, email: str) -> None:
+    from src.services.linguistic_service import LinguisticService
+    from src.services.preference_service import PreferenceService
+
+    mode = rng.choice(list(work.terms))
+    result = rec.timed(
+        f"search_{mode.lower()}",
+        LinguisticService.search_records,
+        source_id=work.ctx.source_id,
+        search_term=rng.choice(work.terms[mode]),
+        search_mode=mode,
+    )
+    hits = [r["id"] for r in result.records] if result else []
+    rec.timed("get_record", LinguisticService.get_record, rng.choice(hits or work.record_ids))
+    rec.timed("load_preferences", PreferenceService.load_preferences, email, ["records"])
+
+
+def edit(rec: Recorder, work: Workload, rng: random.Random, email: str) -> None:
+    from src.services.audit_service import AuditService
+    from src.services.linguistic_service import LinguisticService
+    from src.services.preference_service import PreferenceService
+
+    record_id = rng.choice(work.hot_ids)
+    record = rec.timed("get_record", LinguisticService.get_record, record_id)
+    if not record:
+        return
+    gloss = f"edited by {email.split('@')[0]} {rng.randrange(10**6)}"
+    mdf = re.sub(r"^\\ge .*$", lambda _: f"\\ge {gloss}", record["mdf_data"], count=1, flags=re.MULTILINE)
+    rec.timed(
+        "update_record",
+        LinguisticService.update_record,
+        record_id,
+        email,
+        session_id=str(uuid.uuid4()),
+        change_summary="Load test edit",
+        mdf_data=mdf,
+        ge=gloss,
+    )
+    rec.timed(
+        "save_preferences", PreferenceService.save_preferences, email, {("records", "last_record"): str(record_id)}
+    )
+    rec.timed("log_activity", AuditService.log_activity, email, "record_update", f"Load test edit of {record_id}")
+
+
+def upload(rec: Recorder, work: Workload, rng: random.Random, email: str) -> None:
+    from src.services.upload_service import UploadService
+
+    entries = rng.choice(work.revisions)
+    start = rng.randrange(max(1, len(entries) - UPLOAD_SLICE))
+    batch_id = rec.timed(
+        "stage_entries", UploadService.stage_entries, email, work.ctx.source_id, entries[start : start + UPLOAD_SLICE]
+    )
+    if not batch_id:
+        return
+    session_id = str(uuid.uuid4())
+    try:
+        if rec.timed("suggest_matches", UploadService.suggest_matches, batch_id) is None:
+            return
+        rec.timed("apply_matched", UploadService.approve_all_by_record_match, batch_id, email, session_id)
+    finally:
+        rec.timed("discard_batch", UploadService.discard_all, batch_id)
+    if rng.random() < work.rollback_rate:
+        rec.timed("rollback_session", UploadService.rollback_session, session_id, email)
+
+
+ACTIONS = {"search": search, "edit": edit, "upload": upload}
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        role, _, weight = part.partition("=")
+        if role not in ROLES or not weight.isdigit():
+            raise argparse.ArgumentTypeError(f"Expected role=weight with roles {', '.join(ROLES)}: {part!r}")
+        mix[role] = int(weight)
+    return mix
+
+
+def seed_users(count: int) -> list[str]:
+    from src.database.connection import get_session
+    from src.database.models.identity import User
+
+    emails = [f"loadtest{i}@example.com" for i in range(count)]
+    with get_session() as session:
+        existing = {e for (e,) in session.query(User.email).filter(User.email.in_(emails))}
+        session.add_all(
+            User(email=email, username=email.split("@")[0], github_id=10_000 + i)
+            for i, email in enumerate(emails)
+            if email not in existing
+        )
+        session.commit()
+    return emails
+
+
+def run_level(
+    users: int, args, work: Workload, mix: dict[str, int], rec: Recorder, monitor: Monitor, emails: list[str]
+) -> dict:
+    roles = random.Random(args.seed).choices(list(mix), weights=list(mix.values()), k=users)
+    stop = threading.Event()
+    think = args.think_ms / 1000
+
+    def virtual_user(i: int, role: str):
+        rng = random.Random(args.seed * 1000 + i)
+        while not stop.is_set():
+            ACTIONS[role](rec, work, rng, emails[i])
+            if think:
+                stop.wait(rng.uniform(0.5, 1.5) * think)
+
+    deadlocks_before = monitor.deadlocks()
+    threads = [threading.Thread(target=virtual_user, args=(i, role), daemon=True) for i, role in enumerate(roles)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    stop.wait(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    operations = {}
+    for op, latencies in sorted(rec.latencies.items()):
+        ordered = sorted(latencies)
+        failures = rec.failures.get(op, Counter())
+        operations[op] = {
+            "count": len(ordered),
+            "per_s": len(ordered) / elapsed,
+            "p50_ms": percentile(ordered, 0.50) * 1000,
+            "p95_ms": percentile(ordered, 0.95) * 1000,
+            "p99_ms": percentile(ordered, 0.99) * 1000,
+            "max_ms": ordered[-1] * 1000,
+            "failures": dict(failures),
+        }
+    checkouts = sorted(rec.checkouts)
+    causes = Counter()
+    for failures in rec.failures.values():
+        causes.update({k: v for k, v in failures.items() if k != "failed"})
+    return {
+        "users": users,
+        "roles": dict(Counter(roles)),
+        "seconds": elapsed,
+        "operations_total": sum(len(v) for v in rec.latencies.values()),
+        "operations_per_s": sum(len(v) for v in rec.latencies.values()) / elapsed,
+        "failed_total": sum(f["failed"] for f in rec.failures.values()),
+        "failure_causes": dict(causes),
+        "pool_checkout": {
+            "count": len(checkouts),
+            "p50_ms": (percentile(checkouts, 0.50) or 0) * 1000,
+            "p95_ms": (percentile(checkouts, 0.95) or 0) * 1000,
+            "max_ms": (checkouts[-1] if checkouts else 0) * 1000,
+        },
+        "server_deadlocks": monitor.deadlocks() - deadlocks_before,
+        "operations": operations,
+    }
+
+
+def print_level(result: dict) -> None:
+    print(
+        f"\n{result['users']} users {result['roles']}: {result['operations_per_s']:.1f} ops/s, "
+        f"{result['failed_total']} failed {result['failure_causes'] or ''}"
+    )
+    pool = result["pool_checkout"]
+    print(
+        f"  pool checkout p50 {pool['p50_ms']:.1f} ms, p95 {pool['p95_ms']:.1f} ms, max {pool['max_ms']:.0f} ms; "
+        f"peak {result['peak_checked_out']} checked out, {result['peak_connections']} server connections, "
+        f"{result['peak_lock_waits']} lock waiters; {result['server_deadlocks']} deadlocks"
+    )
+    print(f"  {'operation':<20} {'count':>7} {'/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'failed':>7}")
+    for op, s in result["operations"].items():
+        print(
+            f"  {op:<20} {s['count']:>7} {s['per_s']:>7.1f} {s['p50_ms']:>8.1f} {s['p95_ms']:>8.1f} "
+            f"{s['p99_ms']:>8.1f} {s['failures'].get('failed', 0):>7}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, nargs="+", default=[5, 10, 20, 40], help="Concurrency levels to run")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds per level")
+    parser.add_argument("--mix", type=parse_mix, default="search=6,edit=3,upload=1", help="Role weights")
+    parser.add_argument("--hot-records", type=int, default=50, help="Records the editors contend for")
+    parser.add_argument("--rollback-rate", type=float, default=0.3, help="Share of uploads rolled back")
+    parser.add_argument("--think-ms", type=float, default=100, help="Mean pause between a user's actions")
+    parser.add_argument("--records", type=int, default=2000, help="Synthetic records loaded before the run")
+    parser.add_argument("--seed", type=int, default=CorpusSpec.seed)
+    parser.add_argument("--verbose", action="store_true", help="Keep the services' debug logging")
+    parser.add_argument("--output", type=Path, help="JSON results path (default tmp/loadtest/<commit>.json)")
+    args = parser.parse_args()
+
+    ctx = Context(CorpusSpec(records=args.records, seed=args.seed))
+    print("Starting throwaway pgserver and running migrations...")
+    server = start_database()
+    try:
+        from src.database.connection import get_db_url, get_engine
+
+        seed_identity(ctx)
+        print(f"Loading {args.records:,} records...")
+        ctx.ensure_loaded()
+        work = Workload(ctx, args.hot_records, args.rollback_rate)
+        emails = seed_users(max(args.users))
+
+        classifier = _ErrorLogClassifier(level=logging.WARNING)
+        for name in list(logging.Logger.manager.loggerDict):
+            if name.startswith("snea"):
+                logger = logging.getLogger(name)
+                logger.addHandler(classifier)
+                if not args.verbose:
+                    logger.setLevel(logging.WARNING)
+                    for handler in logger.handlers:
+                        if handler is not classifier:
+                            handler.setLevel(logging.ERROR)
+
+        engine = get_engine()
+        recorders = [Recorder()]
+        instrument_pool(engine, recorders)
+        levels = []
+        for users in args.users:
+            recorders[0] = Recorder()
+            monitor = Monitor(get_db_url(), engine.pool)
+            monitor.start()
+            print(f"Running {users} users for {args.duration:.0f}s...", flush=True)
+            try:
+                result = run_level(users, args, work, args.mix, recorders[0], monitor, emails)
+            finally:
+                monitor.stop()
+            result.update(
+                peak_connections=monitor.peak_connections,
+                peak_lock_waits=monitor.peak_lock_waits,
+                peak_checked_out=monitor.peak_checked_out,
+            )
+            print_level(result)
+            levels.append(result)
+    finally:
+        server.cleanup()
+        shutil.rmtree(DB_PATH, ignore_errors=True)
+
+    sha, dirty = git_commit()
+    report = {
+        "commit": sha,
+        "dirty": dirty,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "settings": {
+            "duration": args.duration,
+            "mix": args.mix,
+            "hot_records": args.hot_records,
+            "rollback_rate": args.rollback_rate,
+            "think_ms": args.think_ms,
+            "records": args.records,
+            "seed": args.seed,
+        },
+        "levels": levels,
+    }
+    output = args.output or RESULTS_DIR / f"{sha[:12]}{'-dirty' if dirty else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"\nResults written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
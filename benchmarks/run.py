@@ -0,0 +1,386 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+run.py — Throughput benchmarks over a synthetic MDF corpus.
+
+Pure-Python benchmarks (parsing, formatting, sort keys) need nothing else.
+The rest run the real services against a throwaway pgserver database under
+tmp/benchmarks_db, created from the ORM models plus every migration and
+removed afterwards. Each benchmark is repeated; setup (resetting tables,
+staging a batch to apply) is not timed.
+
+Results go to tmp/benchmarks/<commit>.json (or --output) for
+benchmarks/compare.py.
+
+Usage:
+    uv run python -m benchmarks.run [--records 1000] [--repeat 3] [--only parse_mdf search_fts]
+                                    [--no-db] [--output FILE] [--seed N]
+    uv run python -m benchmarks.run --list
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from benchmarks.corpus import CorpusSpec, generate_corpus, generate_records
+
+project_root = Path(__file__).parent.parent
+DB_PATH = project_root / "tmp" / "benchmarks_db"
+RESULTS_DIR = project_root / "tmp" / "benchmarks"
+BENCH_USER = "benchmark@example.com"
+BENCH_SOURCE = "Benchmark Corpus"
+SEARCH_QUERIES = 20
+
+# Everything a benchmark writes; CASCADE also empties the search and language tables
+_RESET_SQL = (
+    "TRUNCATE records, matchup_queue, edit_history, dirty_records, user_activity_log, source_record_counts "
+    "RESTART IDENTITY CASCADE"
+)
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # Called once per repeat; does untimed setup and returns (timed callable, items processed)
+    prepare: Callable[["Context"], tuple[Callable[[], object], int]]
+    needs_db: bool
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, needs_db: bool = True):
+    def register(prepare):
+        BENCHMARKS.append(Benchmark(name, prepare, needs_db))
+        return prepare
+
+    return register
+
+
+class Context:
+    """Corpus plus the database state the benchmarks share."""
+
+    def __init__(self, spec: CorpusSpec):
+        from src.mdf.parser import parse_mdf
+
+        self.spec = spec
+        self.records = generate_records(spec)
+        self.corpus = generate_corpus(spec)
+        self.entries = parse_mdf(self.corpus)
+        self.source_id: int | None = None
+        self.loaded = False
+        self.revision = 0
+
+    # ── Database ─────────────────────────────────────────────────
+    def reset(self) -> None:
+        from sqlalchemy import text
+
+        from src.database.connection import get_engine
+
+        with get_engine().begin() as conn:
+            conn.execute(text(_RESET_SQL))
+        self.loaded = False
+
+    def stage(self, revision: int = 0) -> str:
+        from src.mdf.parser import parse_mdf
+        from src.services.upload_service import UploadService
+
+        spec = CorpusSpec(**{**self.spec.as_dict(), "revision": revision})
+        entries = self.entries if revision == 0 else parse_mdf(generate_corpus(spec))
+        return UploadService.stage_entries(BENCH_USER, self.source_id, entries, f"benchmark-r{revision}.mdf")
+
+    def ensure_loaded(self) -> None:
+        """Make the corpus the source's records, applied the way a new-source upload is."""
+        from src.services.upload_service import UploadService
+
+        if self.loaded:
+            return
+        self.reset()
+        UploadService.approve_all_new_source(self.stage(), BENCH_USER, str(uuid.uuid4()))
+        self.loaded = True
+
+    def next_revision(self) -> int:
+        """A revision not yet applied, so matched updates always change the record."""
+        self.revision += 1
+        return self.revision
+
+    def search_terms(self, mode: str) -> list[str]:
+        entries = self.entries[:: max(1, len(self.entries) // SEARCH_QUERIES)][:SEARCH_QUERIES]
+        if mode in ("Lexeme", "Headword"):
+            return [entry["lx"][:3] for entry in entries]
+        return [entry["ge"].split()[0] for entry in entries if entry["ge"]]
+
+
+def start_database() -> object:
+    """Start a throwaway pgserver and point the app's get_engine()/get_session() at it."""
+    import pgserver
+    from sqlalchemy import text
+
+    from src.database import connection
+    from src.database.base import Base
+    from src.database.migrations import MigrationManager
+    from src.database.models import core, identity, iso639, meta, search, workflow  # noqa: F401
+
+    if DB_PATH.exists():
+        shutil.rmtree(DB_PATH)
+    DB_PATH.mkdir(parents=True, exist_ok=True)
+    server = pgserver.get_server(str(DB_PATH))
+    # Must be set before the first get_engine() call, which caches the engine
+    connection._db_url_cache = server.get_uri()
+    engine = connection.get_engine()
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
+        conn.commit()
+    Base.metadata.create_all(engine)
+    MigrationManager(engine).run_all()
+    return server
+
+
+def seed_identity(ctx: Context) -> None:
+    from src.database.connection import get_session
+    from src.database.models.core import Source
+    from src.database.models.identity import User
+
+    with get_session() as session:
+        session.add(User(email=BENCH_USER, username="benchmark", github_id=1))
+        source = Source(name=BENCH_SOURCE, short_name="BENCH")
+        session.add(source)
+        session.commit()
+        ctx.source_id = source.id
+
+
+# ── Pure Python ──────────────────────────────────────────────────
+@benchmark("parse_mdf", needs_db=False)
+def bench_parse_mdf(ctx):
+    from src.mdf.parser import parse_mdf
+
+    return lambda: parse_mdf(ctx.corpus), len(ctx.records)
+
+
+@benchmark("format_mdf_record", needs_db=False)
+def bench_format_mdf_record(ctx):
+    from src.mdf.parser import format_mdf_record
+
+    return lambda: [format_mdf_record(text) for text in ctx.records], len(ctx.records)
+
+
+@benchmark("generate_sort_lx", needs_db=False)
+def bench_generate_sort_lx(ctx):
+    from src.services.linguistic_service import LinguisticService
+
+    headwords = [entry["lx"] for entry in ctx.entries]
+    return lambda: [LinguisticService.generate_sort_lx(lx) for lx in headwords], len(headwords)
+
+
+# ── Upload workflow ──────────────────────────────────────────────
+@benchmark("stage_entries")
+def bench_stage_entries(ctx):
+    ctx.reset()
+    return ctx.stage, len(ctx.entries)
+
+
+@benchmark("bulk_apply_new")
+def bench_bulk_apply_new(ctx):
+    from src.services.upload_service import UploadService
+
+    ctx.reset()
+    batch_id = ctx.stage()
+
+    def run():
+        UploadService.approve_all_new_source(batch_id, BENCH_USER, str(uuid.uuid4()))
+        ctx.loaded = True
+
+    return run, len(ctx.entries)
+
+
+@benchmark("suggest_matches")
+def bench_suggest_matches(ctx):
+    from src.services.upload_service import UploadService
+
+    ctx.ensure_loaded()
+    batch_id = ctx.stage(ctx.next_revision())
+
+    def run():
+        UploadService.suggest_matches(batch_id)
+        UploadService.discard_all(batch_id)
+
+    return run, len(ctx.entries)
+
+
+@benchmark("bulk_apply_matched")
+def bench_bulk_apply_matched(ctx):
+    from src.services.upload_service import UploadService
+
+    ctx.ensure_loaded()
+    batch_id = ctx.stage(ctx.next_revision())
+    UploadService.suggest_matches(batch_id)
+
+    def run():
+        UploadService.approve_all_by_record_match(batch_id, BENCH_USER, str(uuid.uuid4()))
+        UploadService.discard_all(batch_id)
+
+    return run, len(ctx.entries)
+
+
+@benchmark("populate_search_entries")
+def bench_populate_search_entries(ctx):
+    from src.database.connection import get_session
+    from src.database.models.core import Record
+    from src.services.upload_service import UploadService
+
+    ctx.ensure_loaded()
+    with get_session() as session:
+        record_ids = [rid for (rid,) in session.query(Record.id).filter(Record.source_id == ctx.source_id)]
+    return lambda: UploadService.populate_search_entries(record_ids), len(record_ids)
+
+
+# ── Search and export ────────────────────────────────────────────
+def _search_benchmark(mode: str):
+    def prepare(ctx):
+        from src.services.linguistic_service import LinguisticService
+
+        ctx.ensure_loaded()
+        terms = ctx.search_terms(mode)
+
+        def run():
+            for term in terms:
+                LinguisticService.search_records(source_id=ctx.source_id, search_term=term, search_mode=mode)
+
+        return run, len(terms)
+
+    return prepare
+
+
+for _mode in ("Lexeme", "FTS", "Headword", "Gloss"):
+    benchmark(f"search_{_mode.lower()}")(_search_benchmark(_mode))
+
+
+def _export_benchmark(engine: str):
+    def prepare(ctx):
+        from src.services.linguistic_service import LinguisticService
+
+        ctx.ensure_loaded()
+
+        def run():
+            os.remove(LinguisticService.stream_records_to_temp_file(source_id=ctx.source_id, engine=engine))
+
+        return run, len(ctx.entries)
+
+    return prepare
+
+
+for _engine in ("cursor", "copy"):
+    benchmark(f"export_{_engine}")(_export_benchmark(_engine))
+
+
+# ── Runner ───────────────────────────────────────────────────────
+def measure(bench: Benchmark, ctx: Context, repeat: int) -> dict:
+    seconds = []
+    items = 0
+    for _ in range(repeat):
+        run, items = bench.prepare(ctx)
+        start = time.perf_counter()
+        run()
+        seconds.append(time.perf_counter() - start)
+    median = statistics.median(seconds)
+    return {
+        "items": items,
+        "repeat": repeat,
+        "min_s": min(seconds),
+        "median_s": median,
+        "mean_s": statistics.fmean(seconds),
+        "items_per_s": items / median if median else None,
+        "runs_s": seconds,
+    }
+
+
+def git_commit() -> tuple[str, bool]:
+    """(HEAD sha or 'unknown', whether the work tree has uncommitted changes)."""
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=project_root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=project_root, capture_output=True, text=True
+        ).stdout.strip()
+        return sha, bool(dirty)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=CorpusSpec.records, help="Synthetic records in the corpus")
+    parser.add_argument("--seed", type=int, default=CorpusSpec.seed, help="Corpus seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="Run only these benchmarks")
+    parser.add_argument("--no-db", action="store_true", help="Skip benchmarks that need a database")
+    parser.add_argument("--output", type=Path, help="JSON results path (default tmp/benchmarks/<commit>.json)")
+    parser.add_argument("--list", action="store_true", help="List benchmark names and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for bench in BENCHMARKS:
+            print(f"{bench.name}{'' if bench.needs_db else '  (no database)'}")
+        return 0
+
+    selected = [b for b in BENCHMARKS if (not args.only or b.name in args.only) and not (args.no_db and b.needs_db)]
+    unknown = set(args.only or []) - {b.name for b in BENCHMARKS}
+    if unknown:
+        parser.error(f"Unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    spec = CorpusSpec(records=args.records, seed=args.seed)
+    print(f"Generating {spec.records:,} synthetic records...")
+    ctx = Context(spec)
+
+    server = None
+    try:
+        if any(b.needs_db for b in selected):
+            print("Starting throwaway pgserver and running migrations...")
+            server = start_database()
+            seed_identity(ctx)
+
+        results = {}
+        for bench in selected:
+            print(f"  {bench.name:<26}", end="", flush=True)
+            results[bench.name] = measure(bench, ctx, args.repeat)
+            r = results[bench.name]
+            print(f"{r['median_s'] * 1000:>10.1f} ms  {r['items_per_s'] or 0:>12,.0f} items/s")
+    finally:
+        if server is not None:
+            server.cleanup()
+            shutil.rmtree(DB_PATH, ignore_errors=True)
+
+    from src.services.search_index import SEARCH_MAINTENANCE_ENV
+
+    sha, dirty = git_commit()
+    report = {
+        "commit": sha,
+        "dirty": dirty,
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "search_maintenance": os.getenv(SEARCH_MAINTENANCE_ENV, "app"),
+        "corpus": spec.as_dict(),
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"{sha[:12]}{'-dirty' if dirty else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+benchmark_export.py — Peak RSS and wall time for MDF export engines.
+
+Spins up a throwaway pgserver database under tmp/benchmark_export_db (or
+uses --db-url), seeds N synthetic records (default 200,000), then runs
+LinguisticService.stream_records_to_temp_file once per engine, each in a
+fresh subprocess so ru_maxrss reflects only that engine's export.
+
+Usage:
+    uv run python scripts/benchmark_export.py [--records 200000] [--db-url URL] [--engines cursor copy]
+
+Never point --db-url at production: the script inserts and deletes a
+dedicated "Benchmark Export" source and its records.
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+BENCH_SOURCE = "Benchmark Export"
+DB_PATH = project_root / "tmp" / "benchmark_export_db"
+
+
+def seed(engine, n: int) -> int:
+    """Insert n synthetic records under the benchmark source; return its id."""
+    from sqlalchemy import text
+
+    with engine.begin() as conn:
+        conn.execute(
+            text("DELETE FROM records WHERE source_id IN (SELECT id FROM sources WHERE name = :n)"), {"n": BENCH_SOURCE}
+        )
+        conn.execute(text("DELETE FROM sources WHERE name = :n"), {"n": BENCH_SOURCE})
+        source_id = conn.execute(
+            text("INSERT INTO sources (name) VALUES (:n) RETURNING id"), {"n": BENCH_SOURCE}
+        ).scalar()
+        # generate_series keeps seeding server-side and fast
+        conn.execute(
+            text("""
+                INSERT INTO records
+                    (lx, sort_lx, hm, ps, ge, source_id, status, mdf_data, is_locked, is_deleted, current_version)
+                SELECT 'bench' || lpad(g::text, 6, '0'), 'bench' || lpad(g::text, 6, '0'), 1, 'n',
+                       'synthetic gloss ' || g, :sid, 'draft',
+                       E'\\\\lx bench' || lpad(g::text, 6, '0')
+                       || E'\\n\\\\hm 1\\n\\\\ps n\\n\\\\ge synthetic gloss ' || g
+                       || E'\\n\\\\de A synthetic definition for benchmarking export number ' || g || '.'
+                       || E'\\n\\\\nt Record: ' || g || E'\\n\\\\dt 01/Jan/2026',
+                       false, false, 1
+                FROM generate_series(1, :n) AS g
+            """),
+            {"sid": source_id, "n": n},
+        )
+    return source_id
+
+
+def cleanup(engine) -> None:
+    from sqlalchemy import text
+
+    with engine.begin() as conn:
+        conn.execute(
+            text("DELETE FROM records WHERE source_id IN (SELECT id FROM sources WHERE name = :n)"), {"n": BENCH_SOURCE}
+        )
+        conn.execute(text("DELETE FROM sources WHERE name = :n"), {"n": BENCH_SOURCE})
+
+
+def run_engine(db_url: str, source_id: int, engine_name: str) -> dict:
+    """Child-process entry point: run one export and report timing/RSS as JSON."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from src.services.linguistic_service import LinguisticService
+
+    Session = sessionmaker(bind=create_engine(db_url))
+    start = time.perf_counter()
+    with patch("src.services.linguistic_service.get_session", side_effect=lambda: Session()):
+        path = LinguisticService.stream_records_to_temp_file(source_id=source_id, engine=engine_name)
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(path)
+    os.remove(path)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        maxrss //= 1024
+    return {"engine": engine_name, "seconds": elapsed, "peak_rss_mb": maxrss / 1024, "bytes": size}
+
+
+def _start_db() -> tuple[object, str]:
+    import pgserver
+    from sqlalchemy import create_engine, text
+
+    from src.database.base import Base
+    from src.database.models import core, identity, iso639, meta, search, workflow  # noqa: F401
+
+    if DB_PATH.exists():
+        shutil.rmtree(DB_PATH)
+    DB_PATH.mkdir(parents=True, exist_ok=True)
+    server = pgserver.get_server(str(DB_PATH))
+    url = server.get_uri()
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
+        conn.commit()
+    Base.metadata.create_all(engine)
+    return server, url
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--db-url", help="Existing non-production database (default: throwaway pgserver)")
+    parser.add_argument("--engines", nargs="+", default=["cursor", "copy"], choices=["cursor", "copy"])
+    parser.add_argument("--_child", nargs=3, metavar=("DB_URL", "SOURCE_ID", "ENGINE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args._child:
+        db_url, source_id, engine_name = args._child
+        print(json.dumps(run_engine(db_url, int(source_id), engine_name)))
+        return 0
+
+    from sqlalchemy import create_engine
+
+    server = None
+    if args.db_url:
+        db_url = args.db_url
+    else:
+        server, db_url = _start_db()
+    engine = create_engine(db_url)
+
+    try:
+        print(f"Seeding {args.records:,} records...")
+        t0 = time.perf_counter()
+        source_id = seed(engine, args.records)
+        print(f"Seeded in {time.perf_counter() - t0:.1f}s")
+
+        results = []
+        for engine_name in args.engines:
+            out = subprocess.run(
+                [sys.executable, __file__, "--_child", db_url, str(source_id), engine_name],
+                check=True,
+                capture_output=True,
+                text=True,
+                cwd=project_root,
+            )
+            results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+        print(f"\n{'engine':<8} {'wall (s)':>10} {'peak RSS (MB)':>14} {'output (MB)':>12}")
+        for r in results:
+            print(f"{r['engine']:<8} {r['seconds']:>10.2f} {r['peak_rss_mb']:>14.1f} {r['bytes'] / 1_048_576:>12.1f}")
+    finally:
+        if server is not None:
+            server.cleanup()
+            shutil.rmtree(DB_PATH, ignore_errors=True)
+        else:
+            cleanup(engine)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+check_search_triggers.py — Prove the SQL search-row port matches the app.
+
+For every record, compares the rows populate_search_entries() would write
+(search_rows() in Python) with those the SNEA_SEARCH_MAINTENANCE=trigger
+triggers write (snea_search_rows() in PostgreSQL). Run it against the full
+corpus before enabling trigger maintenance, and after any change to the
+parser output, generate_sort_lx or the SQL functions. Read-only.
+
+Usage:
+    uv run python scripts/check_search_triggers.py [--db-url URL] [--batch 1000] [--show 20] [--no-fts]
+
+Exits 1 if any record differs.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+
+def _format_rows(counter) -> str:
+    return "; ".join(f"{row.kind}/{row.entry_type or '-'} {row.term!r} -> {row.normalized_term!r}" for row in counter)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-url", help="Database URL (defaults to the app's configured database)")
+    parser.add_argument("--batch", type=int, default=1000, help="Records compared per query")
+    parser.add_argument("--show", type=int, default=20, help="Mismatching records to print")
+    parser.add_argument("--no-fts", action="store_true", help="Skip the fts_entries text comparison")
+    args = parser.parse_args()
+
+    from src.database.models.core import Record
+    from src.services.search_index import cross_check_search_rows
+
+    if args.db_url:
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        session = sessionmaker(bind=create_engine(args.db_url))()
+    else:
+        from src.database.connection import get_session
+
+        session = get_session()
+    try:
+        record_ids = [rid for (rid,) in session.query(Record.id).order_by(Record.id)]
+        mismatches = {}
+        for i in range(0, len(record_ids), args.batch):
+            mismatches.update(
+                cross_check_search_rows(session, record_ids[i : i + args.batch], with_fts=not args.no_fts)
+            )
+            print(f"\rChecked {min(i + args.batch, len(record_ids))}/{len(record_ids)} records", end="", flush=True)
+        print()
+    finally:
+        session.close()
+
+    if not mismatches:
+        print(f"OK: SQL and Python search rows match for all {len(record_ids)} records.")
+        return 0
+
+    print(f"MISMATCH: {len(mismatches)} of {len(record_ids)} records differ.")
+    for rid, (only_python, only_sql) in list(mismatches.items())[: args.show]:
+        print(f"  record {rid}")
+        if only_python:
+            print(f"    only in Python: {_format_rows(only_python)}")
+        if only_sql:
+            print(f"    only in SQL:    {_format_rows(only_sql)}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
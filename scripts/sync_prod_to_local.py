@@ -18,15 +18,42 @@ handled by the migration system (MigrationManager), NOT by this script.
 
 Strategy
 --------
-Introspects production's actual schema via pg_catalog and replicates it
-faithfully — including generated columns, all indexes — then copies
-production data while skipping generated columns in INSERT statements.
+Introspects production's actual schema via pg_catalog (a few batched
+catalog queries) and replicates it faithfully — including generated
+columns, all indexes, functions and triggers — then copies production data
+while skipping generated columns.
+
+Data is streamed table by table from COPY ... TO STDOUT on production into
+COPY ... FROM STDIN locally through a bounded in-memory pipe, so no table
+is ever held in Python memory. Tables are grouped by foreign-key level and
+the tables of one level load in parallel; indexes and triggers are created
+after the load. Each table reports its row count and MB/s.
+
+Incremental mode (--incremental)
+--------------------------------
+After a full sync, a watermark file records prod's clock, the highest
+edit_history / user_activity_log ids and the schema it saw. The next
+incremental run merges only records changed since then (by updated_at), the
+history of those records and log rows past those ids, detects deletes and missed inserts by comparing id
+sets, merges the small remaining tables in full and rebuilds the derived
+search tables (and record_languages) for the touched records only. It falls
+back to a full sync when there is no watermark, or when prod's schema or
+schema version changed. Local triggers stay off while the merge applies,
+since prod's rows already reflect its own triggers. Rebuilt derived rows carry local surrogate ids;
+run a full sync when an exact replica of those is needed.
 """
 
+import argparse
+import hashlib
+import json
 import os
+import queue
 import sys
+import threading
+import time
 import traceback
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from pathlib import Path
 
 if sys.version_info >= (3, 11):
@@ -86,124 +113,642 @@ def load_secrets():
     return prod_url, local_url
 
 
-def get_table_metadata(conn, table_name: str) -> dict:
-    """Return column names, generated column names, and CREATE TABLE DDL."""
-    # Get non-generated column names for INSERT
-    regular_cols = []
-    generated_cols = []
-    all_cols = []
-    type_map = {}
-
-    rows = conn.execute(text(f"""
-        SELECT
-            a.attname,
-            t.typname,
-            a.attgenerated
-        FROM pg_attribute a
-        JOIN pg_type t ON t.oid = a.atttypid
-        WHERE a.attrelid = quote_ident('{table_name}')::regclass
-          AND a.attnum > 0
-          AND NOT a.attisdropped
-        ORDER BY a.attnum
-    """)).fetchall()
-
-    for name, typname, generated in rows:
-        all_cols.append(name)
-        type_map[name] = typname
-        if generated == 's':
-            generated_cols.append(name)
-        else:
-            regular_cols.append(name)
-
-    # Build CREATE TABLE DDL
-    ddl_parts = []
-    for name in all_cols:
-        info = conn.execute(text(f"""
-            SELECT
-                CASE
-                    WHEN t.typname = 'vector' THEN 'vector'
-                    WHEN t.typname = 'tsvector' THEN 'tsvector'
-                    WHEN t.typname = 'bool' THEN 'boolean'
-                    WHEN t.typname = 'int4' THEN 'integer'
-                    WHEN t.typname = 'int8' THEN 'bigint'
-                    WHEN t.typname = 'float8' THEN 'double precision'
-                    WHEN t.typname = 'numeric' THEN 'numeric'
-                    WHEN t.typname = 'varchar' THEN 'character varying'
-                    WHEN t.typname = 'text' THEN 'text'
-                    WHEN t.typname = 'timestamptz' THEN 'timestamp with time zone'
-                    ELSE t.typname
-                END AS dtype,
-                a.atttypmod,
-                a.attnotnull,
-                a.attgenerated
-            FROM pg_attribute a
-            JOIN pg_type t ON t.oid = a.atttypid
-            WHERE a.attrelid = quote_ident('{table_name}')::regclass
-              AND a.attname = '{name}'
-              AND a.attnum > 0
-        """)).first()
-        if not info:
-            continue
-        dtype, typmod, notnull, generated = info
-
-        if generated == 's':
-            expr = conn.execute(text(f"""
-                SELECT pg_get_expr(d.adbin, d.adrelid)::text
-                FROM pg_attrdef d
-                JOIN pg_class c ON c.oid = d.adrelid
-                WHERE c.relname = '{table_name}'
-                  AND d.adnum = (SELECT a.attnum FROM pg_attribute a
-                                 WHERE a.attrelid = c.oid AND a.attname = '{name}')
-            """)).scalar()
-            ddl_parts.append(f"  {name} {dtype} GENERATED ALWAYS AS ({expr}) STORED")
-        else:
-            line = f"  {name} {dtype}"
-            if dtype == 'character varying' and typmod and typmod > -1:
-                line = f"  {name} character varying({typmod - 4})"
-            if notnull:
-                line += " NOT NULL"
-            if info_default := conn.execute(text(f"""
-                SELECT pg_get_expr(d.adbin, d.adrelid)::text
-                FROM pg_attrdef d
-                JOIN pg_class c ON c.oid = d.adrelid
-                WHERE c.relname = '{table_name}'
-                  AND d.adnum = (SELECT a.attnum FROM pg_attribute a
-                                 WHERE a.attrelid = c.oid AND a.attname = '{name}')
-            """)).scalar():
-                if "nextval" not in info_default:
-                    line += f" DEFAULT {info_default}"
-            ddl_parts.append(line)
+_COLUMNS_SQL = """
+    SELECT
+        c.relname,
+        a.attname,
+        CASE
+            WHEN t.typname = 'vector' THEN 'vector'
+            WHEN t.typname = 'tsvector' THEN 'tsvector'
+            WHEN t.typname = 'bool' THEN 'boolean'
+            WHEN t.typname = 'int4' THEN 'integer'
+            WHEN t.typname = 'int8' THEN 'bigint'
+            WHEN t.typname = 'float8' THEN 'double precision'
+            WHEN t.typname = 'numeric' THEN 'numeric'
+            WHEN t.typname = 'varchar' THEN 'character varying'
+            WHEN t.typname = 'text' THEN 'text'
+            WHEN t.typname = 'timestamptz' THEN 'timestamp with time zone'
+            ELSE t.typname
+        END AS dtype,
+        a.atttypmod,
+        a.attnotnull,
+        a.attgenerated,
+        pg_get_expr(d.adbin, d.adrelid)::text AS default_expr
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_attribute a ON a.attrelid = c.oid
+    JOIN pg_type t ON t.oid = a.atttypid
+    LEFT JOIN pg_attrdef d ON d.adrelid = c.oid AND d.adnum = a.attnum
+    WHERE n.nspname = 'public'
+      AND c.relkind IN ('r', 'p')
+      AND a.attnum > 0
+      AND NOT a.attisdropped
+    ORDER BY c.relname, a.attnum
+"""
 
-    # Add constraints (primary key, foreign keys, unique, check)
-    constraints = conn.execute(text(f"""
-        SELECT pg_get_constraintdef(oid) AS condef
-        FROM pg_constraint
-        WHERE conrelid = quote_ident('{table_name}')::regclass
-          AND contype IN ('p', 'f', 'u', 'c')
-        ORDER BY CASE contype
+_CONSTRAINTS_SQL = """
+    SELECT
+        c.relname,
+        con.contype,
+        pg_get_constraintdef(con.oid) AS condef,
+        ref.relname AS ref_table,
+        ARRAY(
+            SELECT a.attname::text
+            FROM unnest(con.conkey) WITH ORDINALITY AS k(attnum, ord)
+            JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+            ORDER BY k.ord
+        ) AS key_cols
+    FROM pg_constraint con
+    JOIN pg_class c ON c.oid = con.conrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_class ref ON ref.oid = con.confrelid
+    WHERE n.nspname = 'public'
+      AND con.contype IN ('p', 'f', 'u', 'c')
+    ORDER BY c.relname,
+        CASE con.contype
             WHEN 'p' THEN 1
             WHEN 'u' THEN 2
             WHEN 'f' THEN 3
             WHEN 'c' THEN 4
-        END
-    """)).fetchall()
-    for (condef,) in constraints:
-        ddl_parts.append(f"  {condef}")
+        END,
+        con.conname
+"""
+
+# Non-unique secondary indexes (PKs and unique constraints are baked into CREATE TABLE)
+_INDEXES_SQL = """
+    SELECT c.relname, pg_get_indexdef(idx.indexrelid) AS idx_def
+    FROM pg_index idx
+    JOIN pg_class i ON i.oid = idx.indexrelid
+    JOIN pg_class c ON c.oid = idx.indrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public'
+      AND i.relname NOT LIKE '%_pkey'
+      AND NOT idx.indisunique
+    ORDER BY c.relname, i.relname
+"""
+
+# User-defined triggers; constraint triggers behind foreign keys are internal
+_TRIGGERS_SQL = """
+    SELECT c.relname, pg_get_triggerdef(t.oid) AS trigger_def
+    FROM pg_trigger t
+    JOIN pg_class c ON c.oid = t.tgrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public'
+      AND NOT t.tgisinternal
+    ORDER BY c.relname, t.tgname
+"""
+
+# Functions created by migrations (sort keys, search rows, trigger functions),
+# leaving out those that belong to extensions such as vector
+_FUNCTIONS_SQL = """
+    SELECT pg_get_functiondef(p.oid) AS function_def
+    FROM pg_proc p
+    JOIN pg_namespace n ON n.oid = p.pronamespace
+    WHERE n.nspname = 'public'
+      AND p.prokind = 'f'
+      AND NOT EXISTS (
+          SELECT 1 FROM pg_depend d
+          WHERE d.classid = 'pg_proc'::regclass AND d.objid = p.oid AND d.deptype = 'e'
+      )
+    ORDER BY p.proname, p.oid
+"""
+
+
+def get_schema_metadata(conn) -> dict:
+    """Return, per public table, column names, generated column names, primary key
+    columns, CREATE TABLE DDL, secondary index DDL, trigger DDL and the tables
+    it references by foreign key.
+
+    Four catalog queries cover the whole schema, however many tables and
+    columns it has.
+    """
+    tables = {}
+    for tname, name, dtype, typmod, notnull, generated, default_expr in conn.execute(text(_COLUMNS_SQL)):
+        meta = tables.setdefault(
+            tname,
+            {
+                "regular_cols": [],
+                "generated_cols": [],
+                "all_cols": [],
+                "pk_cols": [],
+                "ddl_parts": [],
+                "indexes": [],
+                "triggers": [],
+                "fk_deps": set(),
+            },
+        )
+        meta["all_cols"].append(name)
+        if generated == 's':
+            meta["generated_cols"].append(name)
+            meta["ddl_parts"].append(f"  {name} {dtype} GENERATED ALWAYS AS ({default_expr}) STORED")
+            continue
+        meta["regular_cols"].append(name)
+        line = f"  {name} {dtype}"
+        if dtype == 'character varying' and typmod and typmod > -1:
+            line = f"  {name} character varying({typmod - 4})"
+        if notnull:
+            line += " NOT NULL"
+        if default_expr and "nextval" not in default_expr:
+            line += f" DEFAULT {default_expr}"
+        meta["ddl_parts"].append(line)
+
+    # Add constraints (primary key, foreign keys, unique, check)
+    for tname, contype, condef, ref_table, key_cols in conn.execute(text(_CONSTRAINTS_SQL)):
+        if tname not in tables:
+            continue
+        tables[tname]["ddl_parts"].append(f"  {condef}")
+        if contype == 'p':
+            tables[tname]["pk_cols"] = list(key_cols)
+        # A self-reference does not constrain the copy order
+        if contype == 'f' and ref_table != tname:
+            tables[tname]["fk_deps"].add(ref_table)
+
+    for tname, idx_def in conn.execute(text(_INDEXES_SQL)):
+        if tname in tables:
+            tables[tname]["indexes"].append(idx_def)
+
+    for tname, trigger_def in conn.execute(text(_TRIGGERS_SQL)):
+        if tname in tables:
+            tables[tname]["triggers"].append(trigger_def)
+
+    for tname, meta in tables.items():
+        meta["ddl"] = f"CREATE TABLE IF NOT EXISTS {tname} (\n" + ",\n".join(meta.pop("ddl_parts")) + "\n);"
+    return tables
+
+
+def get_function_definitions(conn) -> list[str]:
+    """Return CREATE OR REPLACE FUNCTION DDL for every public, non-extension function."""
+    return [function_def for (function_def,) in conn.execute(text(_FUNCTIONS_SQL))]
+
+
+def fk_levels(table_meta: dict) -> list[list[str]]:
+    """Group tables so each group only references tables in earlier groups.
+
+    Tables within a group are independent of each other and can be loaded
+    concurrently. Tables left in a reference cycle form one final group.
+    """
+    levels = []
+    remaining = set(table_meta)
+    while remaining:
+        batch = {t for t in remaining if not (table_meta[t]["fk_deps"] & remaining)}
+        if not batch:
+            batch = remaining.copy()
+        levels.append(sorted(batch))
+        remaining -= batch
+    return levels
+
+
+# Bytes buffered per COPY chunk, and chunks held between the prod reader and
+# the local writer, so at most ~1 MB of a table is in memory at a time.
+COPY_CHUNK_BYTES = 64 * 1024
+COPY_PIPE_CHUNKS = 16
+# Tables of one FK level copied at the same time
+COPY_WORKERS = 4
+
+
+class CopyPipe:
+    """Bounded in-memory pipe between a COPY ... TO STDOUT and a COPY ... FROM STDIN.
+
+    The producer side is the file psycopg2 writes COPY output to; the
+    consumer side is the file it reads COPY input from. abort() unblocks
+    the producer when the consumer fails; end() delivers EOF to the
+    consumer whether or not the producer succeeded.
+    """
+
+    def __init__(self, chunk_bytes: int = COPY_CHUNK_BYTES, max_chunks: int = COPY_PIPE_CHUNKS):
+        self._chunk_bytes = chunk_bytes
+        self._queue = queue.Queue(maxsize=max_chunks)
+        self._pending = bytearray()
+        self._aborted = threading.Event()
+        self.bytes_transferred = 0
+
+    def _put(self, item) -> bool:
+        while not self._aborted.is_set():
+            try:
+                self._queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def write(self, data) -> None:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self._pending += data
+        self.bytes_transferred += len(data)
+        if len(self._pending) >= self._chunk_bytes:
+            if not self._put(bytes(self._pending)):
+                raise RuntimeError("COPY consumer aborted")
+            self._pending.clear()
+
+    def flush(self) -> None:
+        if self._pending and not self._put(bytes(self._pending)):
+            raise RuntimeError("COPY consumer aborted")
+        self._pending.clear()
+
+    def end(self) -> None:
+        self._put(None)
+
+    def abort(self) -> None:
+        self._aborted.set()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._queue.get()
+        if chunk is None:
+            # Keep reporting EOF if psycopg2 reads again
+            self._queue.put(None)
+            return b""
+        return chunk
+
+
+class ProdSnapshot:
+    """One REPEATABLE READ transaction on prod that every copy reads through.
+
+    Each table is copied on its own connection, so without a shared snapshot
+    a child table could hold rows whose parent committed after the parent
+    table was read. The coordinator transaction exports its snapshot with
+    pg_export_snapshot() and stays open for the whole sync; every reader
+    imports it with SET TRANSACTION SNAPSHOT, and the watermark is read from
+    the coordinator itself, so all of them see the same committed state.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.conn = None
+        self.snapshot_id = None
+
+    def __enter__(self):
+        self.conn = self.engine.connect().execution_options(isolation_level="REPEATABLE READ")
+        self.snapshot_id = self.conn.execute(text("SELECT pg_export_snapshot()")).scalar()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.conn.rollback()
+        self.conn.close()
+
+    def raw_connection(self):
+        """A raw prod connection whose open transaction reads the exported snapshot."""
+        raw = self.engine.raw_connection()
+        cursor = raw.cursor()
+        cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+        cursor.execute("SET TRANSACTION SNAPSHOT %s", (self.snapshot_id,))
+        return raw
+
+
+def copy_table(
+    prod: ProdSnapshot,
+    local_engine,
+    tname: str,
+    columns: list[str],
+    where: str | None = None,
+    target: str | None = None,
+) -> tuple[int, int]:
+    """Stream ``columns`` of ``tname`` from prod into the local table with COPY.
+
+    ``where`` optionally restricts the rows copied and ``target`` names a
+    different local table to load (a staging table). A reader thread runs
+    COPY ... TO STDOUT on prod, inside ``prod``'s snapshot, while this thread runs COPY ... FROM STDIN on
+    local, joined by a bounded CopyPipe. The local load only commits if the
+    prod side finished cleanly. Returns (rows, bytes) copied.
+    """
+    cols_str = ", ".join(columns)
+    source = f"SELECT {cols_str} FROM {tname}" + (f" WHERE {where}" if where else "")
+    pipe = CopyPipe()
+    errors = []
+
+    def produce():
+        raw = prod.raw_connection()
+        try:
+            raw.cursor().copy_expert(f"COPY ({source}) TO STDOUT", pipe)
+            pipe.flush()
+            raw.commit()
+        except Exception as e:
+            errors.append(e)
+        finally:
+            pipe.end()
+            raw.close()
+
+    reader = threading.Thread(target=produce, name=f"copy-out-{tname}", daemon=True)
+    reader.start()
+    raw = local_engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.copy_expert(f"COPY {target or tname} ({cols_str}) FROM STDIN", pipe, size=COPY_CHUNK_BYTES)
+        reader.join()
+        if errors:
+            raise errors[0]
+        raw.commit()
+        return cursor.rowcount, pipe.bytes_transferred
+    except Exception:
+        pipe.abort()
+        reader.join()
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+
+def copy_tables(
+    prod: ProdSnapshot,
+    local_engine,
+    table_meta: dict,
+    levels: list[list[str]],
+    where_for=None,
+    target_for=None,
+    columns_for=None,
+) -> None:
+    """Copy every table, one FK level at a time, with the tables of a level in parallel.
+
+    ``where_for(tname)`` may return a row filter for the table,
+    ``target_for(tname)`` the local table to load instead and
+    ``columns_for(tname)`` the columns to copy (default: all non-generated).
+    """
+
+    def copy_one(tname):
+        started = time.perf_counter()
+        rows, nbytes = copy_table(
+            prod,
+            local_engine,
+            tname,
+            columns_for(tname) if columns_for else table_meta[tname]["regular_cols"],
+            where_for(tname) if where_for else None,
+            target_for(tname) if target_for else None,
+        )
+        return rows, nbytes, time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+        for level in levels:
+            futures = {}
+            for tname in level:
+                if not table_meta[tname]["regular_cols"]:
+                    log_message(f"  Skipped: {tname} (all generated)")
+                    continue
+                futures[pool.submit(copy_one, tname)] = tname
+            for future in as_completed(futures):
+                tname = futures[future]
+                rows, nbytes, elapsed = future.result()
+                mb = nbytes / (1024 * 1024)
+                rate = mb / max(elapsed, 1e-6)
+                label = target_for(tname) if target_for else tname
+                log_message(f"  Copied: {label} ({rows} rows, {mb:.2f} MB in {elapsed:.2f}s, {rate:.2f} MB/s)")
+
+
+# ── Incremental sync ──────────────────────────────────────────────
+
+WATERMARK_FILE = project_root / "tmp" / "sync_prod_to_local.watermark.json"
+
+# Tables whose changed rows can be found on prod: records by updated_at, the
+# logs by id. Every other table is small and merged in full.
+TRACKED_TABLES = {"records": "updated_at", "edit_history": "id", "user_activity_log": "id"}
+
+# Logs whose older rows are rewritten along with their record (history deltas
+# re-keyframed by compaction or by deleting their base), keyed to the record
+# column; their rows are restaged for every record the sync picks up
+RECORD_REWRITTEN_TABLES = {"edit_history": "record_id"}
+
+# Derived from records; rebuilt locally for the records the sync touched
+DERIVED_TABLES = (
+    "record_languages",
+    "search_entries",
+    "headword_search_entries",
+    "gloss_search_entries",
+    "fts_entries",
+)
+
+# Re-read rows stamped shortly before the previous sync started, in case
+# they belonged to transactions that had not committed yet
+UPDATED_AT_OVERLAP = timedelta(minutes=5)
+
+
+def schema_hash(table_meta: dict) -> str:
+    """Hash of the replicated DDL; incremental sync requires it unchanged."""
+    ddl = [
+        [tname, table_meta[tname]["ddl"], table_meta[tname]["indexes"], table_meta[tname]["triggers"]]
+        for tname in sorted(table_meta)
+    ]
+    return hashlib.sha256(json.dumps(ddl).encode()).hexdigest()
+
+
+def _local_db_key() -> str:
+    from src.database.connection import _get_local_db_path
+
+    return str(_get_local_db_path())
+
+
+def read_watermark() -> dict | None:
+    if not WATERMARK_FILE.exists():
+        return None
+    try:
+        watermarks = json.loads(WATERMARK_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return watermarks.get(_local_db_key())
+
 
-    ddl = f"CREATE TABLE IF NOT EXISTS {table_name} (\n" + ",\n".join(ddl_parts) + "\n);"
+def _schema_version(conn, table_meta: dict) -> int:
+    if "schema_version" not in table_meta:
+        return 0
+    return conn.execute(text("SELECT COALESCE(MAX(version), 0) FROM schema_version")).scalar()
 
+
+def max_tracked_ids(pc, table_meta: dict) -> dict:
+    """Highest id of each id-tracked table, read on ``pc``."""
     return {
-        "regular_cols": regular_cols,
-        "generated_cols": generated_cols,
-        "all_cols": all_cols,
-        "ddl": ddl,
+        tname: pc.execute(text(f"SELECT COALESCE(MAX(id), 0) FROM {tname}")).scalar()
+        for tname, column in TRACKED_TABLES.items()
+        if column == "id" and tname in table_meta
+    }
+
+
+def write_watermark(table_meta: dict, started_at: datetime, schema_version: int, max_ids: dict) -> None:
+    """Record what the local database now holds, per local database path.
+
+    ``started_at`` and ``max_ids`` must come from the snapshot the data was
+    copied from, or rows committed in between are skipped by the next run.
+    """
+    watermarks = {}
+    if WATERMARK_FILE.exists():
+        try:
+            watermarks = json.loads(WATERMARK_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            watermarks = {}
+    watermarks[_local_db_key()] = {
+        "schema_hash": schema_hash(table_meta),
+        "schema_version": schema_version,
+        "records_updated_at": started_at.isoformat(),
+        "max_ids": max_ids,
+        "synced_at": datetime.now().isoformat(timespec="seconds"),
     }
+    WATERMARK_FILE.parent.mkdir(parents=True, exist_ok=True)
+    WATERMARK_FILE.write_text(json.dumps(watermarks, indent=2), encoding="utf-8")
+
+
+def _stage(tname: str) -> str:
+    return f"_sync_stage_{tname}"
+
+
+def _ids(tname: str) -> str:
+    return f"_sync_ids_{tname}"
+
+
+def _key_match(left: str, right: str, key_cols: list[str]) -> str:
+    return " AND ".join(f"{left}.{col} = {right}.{col}" for col in key_cols)
+
+
+def incremental_sync(prod: ProdSnapshot, local_engine, table_meta: dict, watermark: dict) -> None:
+    """Bring the local copy up to date by merging only what changed on prod.
+
+    Tracked tables copy rows past their watermark, plus any prod id missing
+    locally and the history of every changed record; every other table is staged in full. Staging tables are loaded
+    in parallel, then one local transaction deletes rows gone from prod
+    (children first), upserts the staged rows (parents first) and rebuilds
+    the derived tables for the records it touched.
+    """
+    levels = fk_levels(table_meta)
+    merged = [t for level in levels for t in level if t not in DERIVED_TABLES and table_meta[t]["regular_cols"]]
+    tracked = [t for t in merged if t in TRACKED_TABLES]
+    since = datetime.fromisoformat(watermark["records_updated_at"]) - UPDATED_AT_OVERLAP
+
+    with local_engine.connect() as lc:
+        for tname in merged:
+            cols = ", ".join(table_meta[tname]["regular_cols"])
+            lc.execute(text(f"DROP TABLE IF EXISTS {_stage(tname)}"))
+            lc.execute(text(f"CREATE UNLOGGED TABLE {_stage(tname)} AS SELECT {cols} FROM {tname} WITH NO DATA"))
+        for tname in tracked:
+            lc.execute(text(f"DROP TABLE IF EXISTS {_ids(tname)}"))
+            lc.execute(text(f"CREATE UNLOGGED TABLE {_ids(tname)} AS SELECT id FROM {tname} WITH NO DATA"))
+        lc.commit()
+
+    try:
+        # 1. Prod id sets of the tracked tables: deletes, and inserts the watermark missed
+        log_message("Staging prod ids of tracked tables...")
+        copy_tables(prod, local_engine, table_meta, [tracked], target_for=_ids, columns_for=lambda t: ["id"])
+        missing = {}
+        with local_engine.connect() as lc:
+            for tname in tracked:
+                missing[tname] = [
+                    rid
+                    for (rid,) in lc.execute(
+                        text(f"SELECT id FROM {_ids(tname)} EXCEPT SELECT id FROM {tname} ORDER BY 1")
+                    )
+                ]
+
+        def where_for(tname):
+            column = TRACKED_TABLES.get(tname)
+            if column is None:
+                return None
+            if column == "id":
+                condition = f"id > {int(watermark['max_ids'].get(tname, 0))}"
+            else:
+                condition = f"{column} >= '{since.isoformat()}'"
+            if tname in RECORD_REWRITTEN_TABLES:
+                changed_records = f"SELECT id FROM records WHERE updated_at >= '{since.isoformat()}'"
+                condition += f" OR {RECORD_REWRITTEN_TABLES[tname]} IN ({changed_records})"
+            if missing[tname]:
+                condition += f" OR id IN ({', '.join(str(int(rid)) for rid in missing[tname])})"
+            return condition
+
+        # 2. Changed rows of tracked tables, every row of the rest
+        log_message("Staging changed rows...")
+        copy_tables(prod, local_engine, table_meta, [merged], where_for=where_for, target_for=_stage)
+
+        # 3. Apply in one transaction
+        from src.services.derived_data_queue import rebuild_derived_data
+
+        Session = sessionmaker(bind=local_engine)
+        with Session() as session:
+            # The staged rows already carry the effects of prod's triggers
+            session.execute(text("SET LOCAL session_replication_role = replica"))
+            for tname in reversed(merged):
+                key_cols = table_meta[tname]["pk_cols"]
+                if tname in TRACKED_TABLES:
+                    gone = f"NOT EXISTS (SELECT 1 FROM {_ids(tname)} s WHERE s.id = t.id)"
+                elif key_cols:
+                    gone = f"NOT EXISTS (SELECT 1 FROM {_stage(tname)} s WHERE {_key_match('s', 't', key_cols)})"
+                else:
+                    gone = "TRUE"
+                deleted = session.execute(text(f"DELETE FROM {tname} t WHERE {gone}")).rowcount
+                if deleted:
+                    log_message(f"  Deleted: {tname} ({deleted} rows)")
+
+            for tname in merged:
+                meta = table_meta[tname]
+                cols = ", ".join(meta["regular_cols"])
+                upsert = f"INSERT INTO {tname} ({cols}) SELECT {cols} FROM {_stage(tname)}"
+                if meta["pk_cols"]:
+                    updates = [c for c in meta["regular_cols"] if c not in meta["pk_cols"]]
+                    conflict = f" ON CONFLICT ({', '.join(meta['pk_cols'])}) DO "
+                    upsert += conflict + (
+                        "UPDATE SET " + ", ".join(f"{c} = EXCLUDED.{c}" for c in updates) if updates else "NOTHING"
+                    )
+                upserted = session.execute(text(upsert)).rowcount
+                if tname in TRACKED_TABLES:
+                    log_message(f"  Upserted: {tname} ({upserted} rows)")
+
+            touched = [rid for (rid,) in session.execute(text(f"SELECT id FROM {_stage('records')}"))]
+            if touched:
+                log_message(f"Rebuilding derived tables for {len(touched)} records...")
+                for i in range(0, len(touched), 500):
+                    rebuild_derived_data(session, touched[i : i + 500])
+            session.commit()
+    finally:
+        with local_engine.connect() as lc:
+            for tname in merged:
+                lc.execute(text(f"DROP TABLE IF EXISTS {_stage(tname)}"))
+            for tname in tracked:
+                lc.execute(text(f"DROP TABLE IF EXISTS {_ids(tname)}"))
+            lc.commit()
+
+
+def full_sync(prod: ProdSnapshot, local_engine, table_meta: dict, functions: list[str]) -> None:
+    """Drop and recreate every local table from prod's schema, then copy all rows.
+
+    DROP ... CASCADE takes the tables' triggers with it, so prod's functions
+    and triggers are replayed once the data and indexes are in place.
+    """
+    levels = fk_levels(table_meta)
+    sorted_tables = [tname for level in levels for tname in level]
+
+    with local_engine.connect() as lc:
+        # Drop all local tables (reverse order)
+        for tname in reversed(sorted_tables):
+            lc.execute(text(f"DROP TABLE IF EXISTS {tname} CASCADE"))
+        # Recreate tables in dependency order
+        for tname in sorted_tables:
+            lc.execute(text(table_meta[tname]["ddl"]))
+        lc.commit()
+    log_message(f"  Created {len(sorted_tables)} tables in dependency order")
+
+    # Copy data
+    log_message(f"Copying production data ({len(levels)} FK levels, {COPY_WORKERS} parallel tables)...")
+    started = time.perf_counter()
+    copy_tables(prod, local_engine, table_meta, levels)
+    log_message(f"  Data copied in {time.perf_counter() - started:.1f}s")
+
+    # Indexes are built after the load, which is faster than maintaining them row by row
+    with local_engine.connect() as lc:
+        for tname in sorted_tables:
+            for idx_def in table_meta[tname]["indexes"]:
+                lc.execute(text(idx_def))
+        lc.commit()
+    log_message("  Indexes created")
+
+    # Triggers come last so the copy itself does not fire them
+    with local_engine.connect() as lc:
+        for function_def in functions:
+            lc.execute(text(function_def))
+        for tname in sorted_tables:
+            for trigger_def in table_meta[tname]["triggers"]:
+                lc.execute(text(trigger_def))
+        lc.commit()
+    log_message(f"  Replicated {len(functions)} functions and their triggers")
 
 
-def sync_data():
+def sync_data(incremental: bool = False):
     if LOG_FILE.exists():
         LOG_FILE.unlink()
     log_message("Starting Production to Local Sync...")
+    sync_started = time.perf_counter()
 
     prod_url, local_url = load_secrets()
     if not prod_url:
@@ -221,112 +766,46 @@ def sync_data():
         conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
         conn.commit()
 
-    # Introspect production schema
+    # Introspect production schema and copy everything from one snapshot of it
     log_message("Introspecting production schema...")
-    table_meta = {}
-    sorted_tables = []
-    with prod_engine.connect() as pc:
-        prod_tables = [
-            r[0] for r in pc.execute(
-                text("SELECT tablename FROM pg_catalog.pg_tables WHERE schemaname='public' ORDER BY tablename")
-            ).fetchall()
-        ]
-        log_message(f"  Found {len(prod_tables)} tables")
-
-        # Cache metadata and FK dependencies for all tables
-        fk_deps = {}
-        for tname in prod_tables:
-            table_meta[tname] = get_table_metadata(pc, tname)
-            refs = pc.execute(text(f"""
-                SELECT DISTINCT c.confrelid::regclass::text AS ref_table
-                FROM pg_constraint c
-                WHERE c.conrelid = quote_ident('{tname}')::regclass
-                  AND c.contype = 'f'
-            """)).fetchall()
-            fk_deps[tname] = {r[0].strip('"') for r in refs}
-
-        # Topological sort: tables that are referenced first
-        remaining = set(prod_tables)
-        while remaining:
-            batch = {t for t in remaining if not (fk_deps.get(t, set()) & remaining)}
-            if not batch:
-                batch = remaining.copy()
-            sorted_tables.extend(sorted(batch))
-            remaining -= batch
-
-        # Drop all local tables (reverse order)
-        with local_engine.connect() as lc:
-            for tname in reversed(sorted_tables):
-                lc.execute(text(f"DROP TABLE IF EXISTS {tname} CASCADE"))
-            lc.commit()
-
-        # Recreate tables in dependency order
-        for tname in sorted_tables:
-            with local_engine.connect() as lc:
-                lc.execute(text(table_meta[tname]["ddl"]))
-                lc.commit()
-        log_message(f"  Created {len(sorted_tables)} tables in dependency order")
-
-        # Add indexes (exclude PKs and unique constraints already baked into CREATE TABLE)
-        for tname in prod_tables:
-            indexes = pc.execute(text(f"""
-                SELECT i.relname AS idx_name, pg_get_indexdef(idx.indexrelid) AS idx_def
-                FROM pg_index idx
-                JOIN pg_class i ON i.oid = idx.indexrelid
-                JOIN pg_class c ON c.oid = idx.indrelid
-                WHERE c.relname = '{tname}'
-                  AND i.relname NOT LIKE '%_pkey'
-                  AND NOT idx.indisunique
-            """)).fetchall()
-            with local_engine.connect() as lc:
-                for (idx_name, idx_def) in indexes:
-                    lc.execute(text(idx_def))
-                    lc.commit()
-        log_message("  Indexes created")
-
-    # Copy data
-    log_message("Copying production data...")
-    SessionLocal = sessionmaker(bind=local_engine)
-    SessionProd = sessionmaker(bind=prod_engine)
-
-    with SessionProd() as ps, SessionLocal() as ls:
-        for tname in reversed(sorted_tables):
-            ls.execute(text(f"DELETE FROM {tname}"))
-        ls.commit()
-
-        for tname in sorted_tables:
-            meta = table_meta[tname]
-            if not meta["regular_cols"]:
-                log_message(f"  Skipped: {tname} (all generated)")
-                continue
-
-            cols_str = ", ".join(meta["regular_cols"])
-            placeholders = ", ".join([f":{c}" for c in meta["regular_cols"]])
-            rows = ps.execute(text(f"SELECT {cols_str} FROM {tname}")).fetchall()
-            if rows:
-                data = [dict(r._mapping) for r in rows]
-                for bstart in range(0, len(data), 1000):
-                    batch = data[bstart:bstart + 1000]
-                    ls.execute(
-                        text(f"INSERT INTO {tname} ({cols_str}) VALUES ({placeholders})"),
-                        batch,
-                    )
-                ls.commit()
-            log_message(f"  Copied: {tname} ({len(rows)} rows)")
+    with ProdSnapshot(prod_engine) as prod:
+        pc = prod.conn
+        # Rows changed after this snapshot are picked up by the next incremental sync
+        prod_started_at = pc.execute(text("SELECT now()")).scalar()
+        table_meta = get_schema_metadata(pc)
+        functions = get_function_definitions(pc)
+        schema_version = _schema_version(pc, table_meta)
+        max_ids = max_tracked_ids(pc, table_meta)
+        log_message(f"  Found {len(table_meta)} tables")
+
+        watermark = read_watermark() if incremental else None
+        if incremental and watermark is None:
+            log_message("No watermark for this local database; running a full sync.")
+        elif watermark is not None and watermark.get("schema_hash") != schema_hash(table_meta):
+            log_message("Production schema changed since the last sync; running a full sync.")
+            watermark = None
+        elif watermark is not None and watermark.get("schema_version") != schema_version:
+            # Data migrations rewrite rows without touching the watermark columns
+            log_message("Production ran migrations since the last sync; running a full sync.")
+            watermark = None
+        elif watermark is not None and set(table_meta) - set(inspect(local_engine).get_table_names()):
+            log_message("Local database is missing tables; running a full sync.")
+            watermark = None
+
+        if watermark is not None:
+            log_message(f"Incremental sync since {watermark['synced_at']}...")
+            incremental_sync(prod, local_engine, table_meta, watermark)
+        else:
+            full_sync(prod, local_engine, table_meta, functions)
 
     # Reset sequences
     log_message("Resetting sequences...")
-    with local_engine.connect() as lc:
-        for tname in sorted_tables:
-            seq = lc.execute(text(
-                "SELECT pg_get_serial_sequence(:t, 'id')"
-            ), {"t": tname}).scalar()
-            if seq:
-                max_id = lc.execute(text(f"SELECT COALESCE(MAX(id), 1) FROM {tname}")).scalar()
-                lc.execute(text(f"SELECT setval('{seq}', {max_id})"))
-        lc.commit()
+    from src.database.connection import reset_sequences
+
+    reset_sequences(local_engine)
 
     # Verify
+    SessionLocal = sessionmaker(bind=local_engine)
     log_message("\n=== VERIFICATION ===")
     ins = inspect(local_engine)
     for t in ['records', 'schema_version', 'fts_entries']:
@@ -340,8 +819,15 @@ def sync_data():
         v = s.query(SchemaVersion.version).order_by(SchemaVersion.version.desc()).first()
         log_message(f"  Schema version: {v[0] if v else 0}")
 
-    log_message("\nSync completed successfully.")
+    write_watermark(table_meta, prod_started_at, schema_version, max_ids)
+    log_message(f"\nSync completed successfully in {time.perf_counter() - sync_started:.1f}s.")
 
 
 if __name__ == "__main__":
-    sync_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Copy the production database into the local one.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Merge only rows changed since the last sync (falls back to a full sync when not possible)",
+    )
+    sync_data(incremental=parser.parse_args().incremental)
\ No newline at end of file
@@ -5,8 +5,8 @@ Import from concrete modules:
     from src.database.base import Base
     from src.database.models.core import Record, Source, Language, RecordLanguage
     from src.database.models.search import SearchEntry, HeadwordSearchEntry, GlossSearchEntry
-    from src.database.models.workflow import MatchupQueue, EditHistory
+    from src.database.models.workflow import MatchupQueue, EditHistory, DirtyRecord
     from src.database.models.identity import User, Permission, UserPreference, UserActivityLog
-    from src.database.models.meta import SchemaVersion
+    from src.database.models.meta import SchemaVersion, BackfillProgress, SchemaFingerprint
     from src.database.models.iso639 import ISO639_3
 """
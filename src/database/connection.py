@@ -4,13 +4,14 @@
 import atexit
 import getpass
 import os
+import time
 from pathlib import Path
 
 import streamlit as st
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
-# Base is imported lazily inside functions (see _reset_sequences, init_db) to avoid
+# Base is imported lazily inside functions (see init_db) to avoid
 # circular initialization errors — per project lazy-import standard (05-code-standards.md).
 from src.logging_config import get_logger
 
@@ -624,6 +625,9 @@ def get_engine():
     if not db_url:
         raise ValueError("Database URL not found in secrets or environment.")
 
+    from src.services import query_stats
+
+    query_stats.install()  # per-statement timings for the System Status page
     return create_engine(
         db_url,
         pool_size=0,  # NO permanent warm connections
@@ -633,76 +637,136 @@ def get_engine():
     )
 
 
-def _reset_sequences(engine) -> None:
+# Resets every sequence owned by a column (serial or identity) in the current
+# schema to that column's MAX, in one round trip. Driven by pg_depend, so
+# tables created by raw-SQL migrations are covered as well as ORM tables.
+_RESET_SEQUENCES_SQL = """
+DO $$
+DECLARE
+    r record;
+    v_max bigint;
+BEGIN
+    FOR r IN
+        SELECT seq.oid::regclass AS seq, tbl.oid::regclass AS tbl, att.attname AS col
+        FROM pg_class seq
+        JOIN pg_depend dep
+            ON dep.classid = 'pg_class'::regclass AND dep.objid = seq.oid
+            AND dep.refclassid = 'pg_class'::regclass AND dep.deptype IN ('a', 'i')
+        JOIN pg_class tbl ON tbl.oid = dep.refobjid
+        JOIN pg_attribute att ON att.attrelid = tbl.oid AND att.attnum = dep.refobjsubid
+        JOIN pg_namespace ns ON ns.oid = tbl.relnamespace
+        WHERE seq.relkind = 'S' AND ns.nspname = current_schema()
+    LOOP
+        EXECUTE format('SELECT COALESCE(MAX(%I), 1) FROM %s', r.col, r.tbl) INTO v_max;
+        PERFORM setval(r.seq, GREATEST(v_max, 1));
+    END LOOP;
+END
+$$;
+"""
+
+
+def reset_sequences(engine) -> None:
     """
-    Reset all integer-PK sequences to match the current MAX(id) in each table.
+    Reset every column-owned sequence to match the current MAX of its column.
 
-    Called from init_db() after migrations, before any user INSERTs, to self-heal
-    after any bulk data copy (e.g., prod→local sync) that inserts rows with explicit
-    id values without advancing PostgreSQL sequences. Without this reset, the next
-    INSERT will attempt to use a sequence value that already exists, causing a
+    Called from init_db() after migrations, before any user INSERTs, and by
+    scripts/sync_prod_to_local.py, to self-heal after any bulk data copy
+    (e.g., prod→local sync) that inserts rows with explicit id values without
+    advancing PostgreSQL sequences. Without this reset, the next INSERT will
+    attempt to use a sequence value that already exists, causing a
     UniqueViolation.
 
-    Implementation: iterates Base.metadata.sorted_tables at runtime and resets only
-    tables that have an integer 'id' column with an associated sequence. No table
-    names are hardcoded — new ORM tables are covered automatically.
-
-    Maintenance note: when tables are added, removed, or their PK column renamed away
-    from 'id', re-verify this function still covers all affected sequences. If a table
-    exists outside Base.metadata (e.g., created via raw SQL migration), it will NOT
-    be covered and must be added explicitly here.
+    Implementation: a single server-side DO block (_RESET_SEQUENCES_SQL) that
+    finds the sequences through the catalog's ownership links — the ones
+    pg_get_serial_sequence() reports — so the cost is one round trip however
+    many tables exist, and no table names are hardcoded. Sequences that are
+    not OWNED BY a column are not touched.
 
     Raises on failure — callers must handle the exception. A failed reset means the
     DB has desynced sequences and INSERTs will fail; the app must not start silently
     in this state.
     """
-    from sqlalchemy import Integer
-
-    from .base import Base  # lazy import — avoids circular init
-
     with engine.connect() as conn:
-        for table in Base.metadata.sorted_tables:
-            id_col = table.c.get("id")
-            if id_col is None:
-                continue
-            if not isinstance(id_col.type, Integer):
-                continue
-            seq = conn.execute(text("SELECT pg_get_serial_sequence(:tbl, 'id')"), {"tbl": table.name}).scalar()
-            if not seq:
-                continue
-            conn.execute(text(f"SELECT setval('{seq}', COALESCE((SELECT MAX(id) FROM {table.name}), 1))"))
+        conn.execute(text(_RESET_SEQUENCES_SQL))
         conn.commit()
     _logger.debug("Sequence reset complete.")
 
 
+# Phase durations (seconds) of this process's last init_db(), shown on System Status
+startup_timings: dict[str, float] = {}
+
+
 def init_db():
-    """Initialize the database schema."""
+    """Initialize the database schema.
+
+    A complete initialization ends by recording MigrationManager's startup
+    fingerprint. When one query shows the recorded fingerprint is still
+    current, create_all, migrations, seeding, trigger sync and the sequence
+    reset are all skipped. Either way each phase is timed into
+    startup_timings and logged.
+    """
+    from src.services.search_index import assume_search_triggers_synced, sync_search_triggers
+
     from .base import Base  # lazy import — avoids circular init
+    from .migrations import MigrationManager
     from .models.core import Language, Record, RecordLanguage, Source  # noqa: F401 — register models with Base.metadata
     from .models.identity import Permission, User, UserActivityLog, UserPreference  # noqa
     from .models.iso639 import ISO639_3  # noqa
-    from .models.meta import SchemaVersion  # noqa
+    from .models.meta import BackfillProgress, SchemaFingerprint, SchemaVersion, SourceRecordCount, StatisticsSnapshot  # noqa
     from .models.search import GlossSearchEntry, HeadwordSearchEntry, SearchEntry  # noqa
     from .models.workflow import EditHistory, MatchupQueue  # noqa
 
+    timings: dict[str, float] = {}
+    started = time.perf_counter()
+
+    def timed(phase, step, *args):
+        phase_start = time.perf_counter()
+        result = step(*args)
+        timings[phase] = time.perf_counter() - phase_start
+        return result
+
     engine = get_engine()
+    manager = MigrationManager(engine)
+    fingerprint = timed("fingerprint", manager.startup_fingerprint)
 
-    Base.metadata.create_all(engine)
-    from .migrations import MigrationManager
+    if timed("fingerprint_check", manager.fingerprint_is_current, fingerprint):
+        assume_search_triggers_synced()
+        path = "fast"
+    else:
+        path = "full"
+        timed("create_all", Base.metadata.create_all, engine)
+        manager.run_all(timings)
 
-    MigrationManager(engine).run_all()
-    try:
-        _reset_sequences(engine)
-    except Exception as e:
-        mastodon_url = st.secrets.get("contact", {}).get("mastodon_url")
-        contact = f" Please report this issue: {mastodon_url}" if mastodon_url else ""
-        _logger.error("Database sequence reset failed at startup — app cannot start safely: %s", e)
-        st.error(
-            f"⚠️ **Database startup error**: The database sequence reset failed. "
-            f"The application cannot start safely — INSERTs would fail with duplicate key errors."
-            f"{contact}"
-        )
-        raise
+        # Opt-in trigger maintenance of the search tables (SNEA_SEARCH_MAINTENANCE=trigger)
+        def sync_triggers():
+            with engine.connect() as conn:
+                sync_search_triggers(conn)
+                conn.commit()
+
+        timed("search_triggers", sync_triggers)
+        try:
+            timed("reset_sequences", reset_sequences, engine)
+        except Exception as e:
+            mastodon_url = st.secrets.get("contact", {}).get("mastodon_url")
+            contact = f" Please report this issue: {mastodon_url}" if mastodon_url else ""
+            _logger.error("Database sequence reset failed at startup — app cannot start safely: %s", e)
+            st.error(
+                f"⚠️ **Database startup error**: The database sequence reset failed. "
+                f"The application cannot start safely — INSERTs would fail with duplicate key errors."
+                f"{contact}"
+            )
+            raise
+        timed("record_fingerprint", manager.record_fingerprint, fingerprint)
+
+    timings["total"] = time.perf_counter() - started
+    startup_timings.clear()
+    startup_timings.update(timings)
+    _logger.info(
+        "init_db (%s path) took %.3fs: %s",
+        path,
+        timings["total"],
+        ", ".join(f"{phase}={seconds:.3f}s" for phase, seconds in timings.items() if phase != "total"),
+    )
     return engine
 
 
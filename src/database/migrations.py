@@ -1,13 +1,15 @@
 # Copyright (c) 2026 Brothertown Language
 # <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
 import csv
+import hashlib
 import io
 import json
 import time
 from pathlib import Path
 
 import streamlit as st
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import sessionmaker
 
 from src.logging_config import get_logger
@@ -134,18 +136,203 @@ class MigrationManager:
             "_migrate_backfill_search_entries",
             "Backfill HeadwordSearchEntry and GlossSearchEntry for existing records",
         ),
+        (
+            20261018093012,
+            "_migrate_create_statistics_snapshot",
+            "Create statistics_snapshot table and change-sequence triggers for dashboard statistics",
+        ),
+        (
+            20261018141530,
+            "_migrate_create_source_record_counts",
+            "Create trigger-maintained source_record_counts and the reference-data version sequence",
+        ),
+        (
+            20261018170412,
+            "_migrate_add_records_lx_base_form_index",
+            "Add expression index on the diacritic-folded headword for cross-source lookups",
+        ),
+        (
+            20261018190245,
+            "_migrate_compact_edit_history",
+            "Add edit_history storage columns and compact history into keyframes plus line deltas",
+        ),
+        (
+            20261018203117,
+            "_migrate_add_records_parsed",
+            "Add the persisted parsed-record JSONB cache to records and backfill it",
+        ),
+        (
+            20261018214502,
+            "_migrate_create_dirty_records",
+            "Create the trigger-fed dirty_records queue for background derived-data rebuilds",
+        ),
+        (
+            20261019093214,
+            "_migrate_create_search_functions",
+            "Create snea_sort_key, snea_search_rows and the search-table trigger function",
+        ),
+        (
+            20261019151806,
+            "_migrate_renormalize_case_map",
+            "Re-normalize sort keys with the explicit, locale-independent lowercase mapping",
+        ),
+        (
+            20261019203305,
+            "_migrate_create_change_counters",
+            "Version reference data with committed change_counters rows instead of a sequence",
+        ),
+        (
+            20261019205117,
+            "_migrate_statistics_change_counter",
+            "Version the statistics snapshot with the committed change counter",
+        ),
+        (
+            20261019214536,
+            "_migrate_invalidate_parsed_on_raw_update",
+            "Clear records.parsed_version when mdf_data changes without a fresh parsed value",
+        ),
+    ]
+
+    # Sources created by _seed_default_sources when missing
+    _DEFAULT_SOURCES = [
+        {
+            "name": "Trumbull 1903",
+            "short_name": "Trumbull (1903)",
+            "description": "Wampanoag [wam]",
+            "citation_format": (
+                "Trumbull, James Hammond. (1903). *Natick Dictionary*. Bureau of American Ethnology Bulletin 25. "
+                "Washington: Government Printing Office."
+            ),
+        },
+        {
+            "name": "Fielding 2012",
+            "short_name": "Fielding (2012)",
+            "description": "Mohegan-Pequot [xpq]",
+            "citation_format": (
+                "Fielding, Stephanie. (2013). *A Modern Mohegan Dictionary*. (D. J. Costa, Ed.). "
+                "Uncasville, CT: Mohegan Council of Elders."
+            ),
+        },
+        {
+            "name": "Anonymous 1647",
+            "short_name": None,
+            "description": "Wampanoag [wam]",
+            "citation_format": None,
+        },
+        {"name": "Winslow 1624", "short_name": None, "description": "Wampanoag [wam]", "citation_format": None},
+        {"name": "Wood 1634", "short_name": None, "description": "Wampanoag [wam]", "citation_format": None},
+        {
+            "name": "Prince-Speck 1904",
+            "short_name": None,
+            "description": "Mohegan-Pequot [xpq]",
+            "citation_format": None,
+        },
+        {
+            "name": "Williams 1643",
+            "short_name": None,
+            "description": "Narragansett [xnt]",
+            "citation_format": None,
+        },
     ]
 
     def __init__(self, engine):
         self._engine = engine
+        # Version of the migration being executed; scopes backfill resume points
+        self._running_version = 0
+
+    def run_all(self, timings: dict[str, float] | None = None):
+        """Public entry point. Runs extensions, migrations, and seeds in order.
+
+        When ``timings`` is given, each phase's duration in seconds is stored
+        in it under the phase name.
+        """
+        for phase, step in (
+            ("extensions", self._ensure_extensions),
+            ("migrations", self._run_migrations),
+            ("seed_sources", self._seed_default_sources),
+            ("seed_permissions", self.seed_default_permissions),
+            ("seed_iso639", self.seed_iso_639_data),
+        ):
+            start = time.perf_counter()
+            step()
+            if timings is not None:
+                timings[phase] = time.perf_counter() - start
+
+    # ── Startup Fingerprint ───────────────────────────────────────────
+
+    _SEED_DATA_FILES = ("default_permissions.json", "iso-639-3.tab")
+
+    def startup_fingerprint(self) -> str:
+        """Hash of everything a complete init_db() brings the database in line with.
+
+        Covers every registered migration, every ORM table's columns and
+        indexes, the default sources, the seed data files and the search
+        maintenance mode. Models must already be imported.
+        """
+        from src.services.search_index import search_triggers_requested
+
+        from .base import Base
+
+        schema = [
+            [
+                table.name,
+                [[col.name, str(col.type), col.nullable] for col in table.columns],
+                sorted(index.name for index in table.indexes if index.name),
+            ]
+            for table in Base.metadata.sorted_tables
+        ]
+        digest = hashlib.sha256()
+        digest.update(
+            json.dumps(
+                {
+                    # All of them: a merged branch can register one below the latest
+                    "migrations": sorted([version, method] for version, method, _ in self._MIGRATIONS),
+                    "schema": schema,
+                    "sources": self._DEFAULT_SOURCES,
+                    "search_triggers": search_triggers_requested(),
+                },
+                sort_keys=True,
+            ).encode()
+        )
+        data_dir = Path(__file__).parent / "data"
+        for name in self._SEED_DATA_FILES:
+            path = data_dir / name
+            digest.update(path.read_bytes() if path.exists() else b"")
+        return digest.hexdigest()
+
+    def fingerprint_is_current(self, fingerprint: str) -> bool:
+        """One query: is ``fingerprint`` recorded and are the seeded tables still populated?
+
+        False as well when schema_fingerprint does not exist yet.
+        """
+        query = text("""
+            SELECT f.fingerprint = :fingerprint
+                AND EXISTS (SELECT 1 FROM permissions)
+                AND EXISTS (SELECT 1 FROM iso_639_3)
+                AND (SELECT count(DISTINCT name) FROM sources WHERE name IN :names) = :source_count
+            FROM schema_fingerprint f WHERE f.id = 1
+        """).bindparams(bindparam("names", expanding=True))
+        names = [source["name"] for source in self._DEFAULT_SOURCES]
+        try:
+            with self._engine.connect() as conn:
+                current = conn.execute(
+                    query, {"fingerprint": fingerprint, "names": names, "source_count": len(names)}
+                ).scalar()
+        except ProgrammingError:
+            return False
+        return bool(current)
 
-    def run_all(self):
-        """Public entry point. Runs extensions, migrations, and seeds in order."""
-        self._ensure_extensions()
-        self._run_migrations()
-        self._seed_default_sources()
-        self.seed_default_permissions()
-        self.seed_iso_639_data()
+    def record_fingerprint(self, fingerprint: str) -> None:
+        """Store ``fingerprint`` after a complete init_db()."""
+        with self._engine.connect() as conn:
+            conn.execute(
+                text("""
+                    INSERT INTO schema_fingerprint (id, fingerprint, recorded_at) VALUES (1, :fingerprint, NOW())
+                    ON CONFLICT (id) DO UPDATE SET fingerprint = EXCLUDED.fingerprint, recorded_at = NOW()
+                """),
+                {"fingerprint": fingerprint},
+            )
+            conn.commit()
 
     # ── Extension Management ──────────────────────────────────────────
 
@@ -221,6 +408,7 @@ class MigrationManager:
 
             try:
                 method = getattr(self, method_name)
+                self._running_version = version
                 method()
                 elapsed = time.time() - start_time
                 log_migration_complete(version, description, elapsed)
@@ -229,6 +417,89 @@ class MigrationManager:
                 log_migration_error(version, description, e)
                 raise
 
+    # ── Backfills ─────────────────────────────────────────────────────
+
+    # Keys handed to a backfill's process callback per transaction
+    _BACKFILL_CHUNK = 500
+    # Minimum seconds between backfill progress log lines
+    _BACKFILL_LOG_INTERVAL = 10.0
+
+    def _backfill(self, name: str, key_column, process, where=None, chunk_size: int | None = None, distinct=False):
+        """Run ``process(session, keys)`` over ``key_column`` in keyset-ordered chunks.
+
+        ``key_column`` is an integer Core column (e.g. ``Record.__table__.c.id``)
+        and ``where`` an optional filter on its table; ``distinct`` visits each
+        key once when the column is not unique. Every chunk is processed and
+        committed in its own transaction together with its resume point in
+        schema_backfill_progress, so memory stays bounded and an interrupted
+        migration continues after the last committed chunk instead of starting
+        over. Progress is logged with throughput and ETA. Returns the number
+        of keys processed by this run.
+        """
+        from sqlalchemy import func, select
+
+        from .models.meta import BackfillProgress
+
+        chunk_size = chunk_size or self._BACKFILL_CHUNK
+        version = self._running_version
+        keys = select(key_column).order_by(key_column)
+        if where is not None:
+            keys = keys.where(where)
+        if distinct:
+            keys = keys.distinct()
+
+        Session = sessionmaker(bind=self._engine)
+        session = Session()
+        try:
+            progress = session.get(BackfillProgress, (version, name))
+            last_key = progress.last_key if progress else None
+            done_before = progress.rows_done if progress else 0
+            if last_key is not None:
+                logger.info("Backfill %s: resuming after key %s (%d keys already done)", name, last_key, done_before)
+            remaining = keys if last_key is None else keys.where(key_column > last_key)
+            total = session.execute(select(func.count()).select_from(remaining.subquery())).scalar()
+
+            processed = 0
+            started = last_log = time.monotonic()
+            while True:
+                chunk = keys if last_key is None else keys.where(key_column > last_key)
+                chunk_keys = session.execute(chunk.limit(chunk_size)).scalars().all()
+                if not chunk_keys:
+                    break
+                process(session, chunk_keys)
+                last_key = chunk_keys[-1]
+                processed += len(chunk_keys)
+                session.merge(
+                    BackfillProgress(version=version, name=name, last_key=last_key, rows_done=done_before + processed)
+                )
+                session.commit()
+                # Finished chunks are not needed again; keep the identity map small
+                session.expunge_all()
+
+                now = time.monotonic()
+                if now - last_log >= self._BACKFILL_LOG_INTERVAL or len(chunk_keys) < chunk_size:
+                    last_log = now
+                    rate = processed / max(now - started, 1e-6)
+                    logger.info(
+                        "Backfill %s: %d/%d keys (%.0f keys/s, ETA %.0fs)",
+                        name,
+                        processed,
+                        total,
+                        rate,
+                        max(total - processed, 0) / rate,
+                    )
+
+            session.query(BackfillProgress).filter_by(version=version, name=name).delete()
+            session.commit()
+            logger.info("Backfill %s complete: %d keys in %.1fs", name, processed, time.monotonic() - started)
+            return processed
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Backfill {name} failed: {e}")
+            raise
+        finally:
+            session.close()
+
     # ── Versioned Migrations ──────────────────────────────────────────
 
     def _migrate_cascade_constraints(self):
@@ -375,9 +646,16 @@ class MigrationManager:
             if session.query(RecordLanguage).count() == 0:
                 logger.info("RecordLanguages table is empty, resetting autoincrement value.")
                 session.execute(text("ALTER SEQUENCE record_languages_id_seq RESTART WITH 1"))
+            session.commit()
+        except Exception as e:
+            logger.error(f"Backfill failed: {e}")
+            session.rollback()
+            raise e
+        finally:
+            session.close()
 
-            records = session.query(Record).all()
-            for rec in records:
+        def backfill_chunk(session, record_ids):
+            for rec in session.query(Record).filter(Record.id.in_(record_ids)):
                 # 1. Parse \lg entries from raw mdf_data
                 parsed = parse_mdf(rec.mdf_data)
                 if not parsed:
@@ -418,13 +696,8 @@ class MigrationManager:
                             record_id=rec.id, language_id=lang.id, is_primary=lg.get("is_primary", False)
                         )
                         session.add(rl)
-            session.commit()
-        except Exception as e:
-            logger.error(f"Backfill failed: {e}")
-            session.rollback()
-            raise e
-        finally:
-            session.close()
+
+        self._backfill("record_languages", Record.__table__.c.id, backfill_chunk)
 
     def _migrate_drop_records_language_id(self):
         """Migration 6: Drop redundant language_id from records table."""
@@ -463,31 +736,12 @@ class MigrationManager:
 
     def _migrate_add_normalized_search_entries(self):
         """Migration 2026021585861: Add normalized_term to search_entries table."""
-        from src.services.linguistic_service import LinguisticService
-
-        from .models.search import SearchEntry
-
         with self._engine.connect() as conn:
             conn.execute(text("ALTER TABLE search_entries ADD COLUMN IF NOT EXISTS normalized_term VARCHAR;"))
             conn.commit()
 
-        Session = sessionmaker(bind=self._engine)
-        session = Session()
-        try:
-            # Backfill normalized_term for all entries
-            entries = session.query(SearchEntry).filter(SearchEntry.normalized_term.is_(None)).all()
-            if entries:
-                logger.info(f"Backfilling normalized_term for {len(entries)} search entries...")
-                for entry in entries:
-                    entry.normalized_term = LinguisticService.generate_sort_lx(entry.term)
-                session.commit()
-                logger.info("Normalized_term backfill complete.")
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to backfill normalized_term: {e}")
-            raise e
-        finally:
-            session.close()
+        # Backfill normalized_term for all entries
+        self._renormalize_sort_keys([("search_entries", "normalized_term", "term")], only_missing=True)
 
         with self._engine.connect() as conn:
             # Drop old index if it exists and create new one on normalized_term
@@ -501,78 +755,56 @@ class MigrationManager:
             conn.execute(text("ALTER TABLE search_entries ALTER COLUMN normalized_term SET NOT NULL;"))
             conn.commit()
 
-    def _migrate_renormalize_search_entries(self):
-        """Migration 2026021585862: Re-normalize search_entries.normalized_term."""
-        from src.services.linguistic_service import LinguisticService
+    # (table, sort-key column, source column) pairs normalized by generate_sort_lx
+    _SORT_KEY_COLUMNS = (
+        ("records", "sort_lx", "lx"),
+        ("search_entries", "normalized_term", "term"),
+    )
 
-        from .models.search import SearchEntry
+    def _renormalize_sort_keys(self, columns, only_missing: bool = False):
+        """Recompute sort-key columns in place with snea_sort_key().
 
-        Session = sessionmaker(bind=self._engine)
-        session = Session()
-        try:
-            logger.info("Re-normalizing search_entries (diacritics and quotes)...")
-            # We process in batches if there are many, but here we just do all
-            entries = session.query(SearchEntry).all()
-            for entry in entries:
-                entry.normalized_term = LinguisticService.generate_sort_lx(entry.term)
-            session.commit()
-            logger.info("search_entries re-normalization complete.")
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to re-normalize search_entries: {e}")
-            raise e
-        finally:
-            session.close()
+        One UPDATE per column, touching only rows whose key changes (or is
+        NULL with ``only_missing``), so no row crosses the wire. The function
+        is (re)created first because migrations that predate
+        _migrate_create_search_functions call this too.
+        """
+        from src.services.sort_key import sort_key_function_sql
 
-    def _migrate_renormalize_sort_lx(self):
-        """Migration 2026021585863: Re-normalize records.sort_lx."""
-        from src.services.linguistic_service import LinguisticService
+        with self._engine.connect() as conn:
+            conn.execute(text(sort_key_function_sql()))
+            for table, key_column, source_column in columns:
+                condition = (
+                    f"{key_column} IS NULL"
+                    if only_missing
+                    else f"{key_column} IS DISTINCT FROM snea_sort_key({source_column})"
+                )
+                result = conn.execute(
+                    text(f"UPDATE {table} SET {key_column} = snea_sort_key({source_column}) WHERE {condition};")
+                )
+                logger.info(f"Re-normalized {result.rowcount} rows of {table}.{key_column}.")
+            conn.commit()
 
-        from .models.core import Record
+    def _migrate_renormalize_search_entries(self):
+        """Migration 2026021585862: Re-normalize search_entries.normalized_term."""
+        logger.info("Re-normalizing search_entries (diacritics and quotes)...")
+        self._renormalize_sort_keys([("search_entries", "normalized_term", "term")])
+        logger.info("search_entries re-normalization complete.")
 
-        Session = sessionmaker(bind=self._engine)
-        session = Session()
-        try:
-            logger.info("Re-normalizing records.sort_lx (diacritics and quotes)...")
-            records = session.query(Record).all()
-            for record in records:
-                record.sort_lx = LinguisticService.generate_sort_lx(record.lx)
-            session.commit()
-            logger.info("records.sort_lx re-normalization complete.")
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to re-normalize records.sort_lx: {e}")
-            raise e
-        finally:
-            session.close()
+    def _migrate_renormalize_sort_lx(self):
+        """Migration 2026021585863: Re-normalize records.sort_lx."""
+        logger.info("Re-normalizing records.sort_lx (diacritics and quotes)...")
+        self._renormalize_sort_keys([("records", "sort_lx", "lx")])
+        logger.info("records.sort_lx re-normalization complete.")
 
     def _migrate_add_sort_lx_column(self):
         """Migration 9: Add sort_lx column to records and backfill existing data."""
-        from src.services.linguistic_service import LinguisticService
-
-        from .models.core import Record
-
         with self._engine.connect() as conn:
             conn.execute(text("ALTER TABLE records ADD COLUMN IF NOT EXISTS sort_lx VARCHAR;"))
             conn.commit()
 
-        Session = sessionmaker(bind=self._engine)
-        session = Session()
-        try:
-            # Backfill existing records
-            records = session.query(Record).filter(Record.sort_lx.is_(None)).all()
-            if records:
-                logger.info(f"Backfilling sort_lx for {len(records)} records...")
-                for record in records:
-                    record.sort_lx = LinguisticService.generate_sort_lx(record.lx)
-                session.commit()
-                logger.info("Sort_lx backfill complete.")
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to backfill sort_lx: {e}")
-            raise e
-        finally:
-            session.close()
+        # Backfill existing records
+        self._renormalize_sort_keys([("records", "sort_lx", "lx")], only_missing=True)
 
         with self._engine.connect() as conn:
             # Headword (\lx) -> Homonym (\hm) -> Part of Speech (\ps) -> Gloss (\ge)
@@ -598,110 +830,52 @@ class MigrationManager:
 
     def _migrate_ignore_leading_numerals(self):
         """Migration 2026030206285: Re-normalize records.sort_lx and search_entries.normalized_term to ignore leading numerals."""
-        from src.services.linguistic_service import LinguisticService
-
-        from .models.core import Record
-        from .models.search import SearchEntry
-
-        Session = sessionmaker(bind=self._engine)
-        session = Session()
-        try:
-            logger.info(
-                "Re-normalizing records.sort_lx and search_entries.normalized_term (ignoring leading numerals)..."
-            )
-
-            # 1. Update records.sort_lx
-            records = session.query(Record).all()
-            for record in records:
-                record.sort_lx = LinguisticService.generate_sort_lx(record.lx)
-
-            # 2. Update search_entries.normalized_term
-            entries = session.query(SearchEntry).all()
-            for entry in entries:
-                entry.normalized_term = LinguisticService.generate_sort_lx(entry.term)
-
-            session.commit()
-            logger.info("Re-normalization for leading numerals complete.")
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to re-normalize for leading numerals: {e}")
-            raise e
-        finally:
-            session.close()
+        logger.info("Re-normalizing records.sort_lx and search_entries.normalized_term (ignoring leading numerals)...")
+        self._renormalize_sort_keys(self._SORT_KEY_COLUMNS)
+        logger.info("Re-normalization for leading numerals complete.")
 
     def _migrate_renormalize_infinity_symbol(self):
         """Migration 20260303080520: Re-normalize records.sort_lx and search_entries.normalized_term for ∞ and ✔ symbol sort order."""
-        from src.services.linguistic_service import LinguisticService
-
-        from .models.core import Record
-        from .models.search import SearchEntry
-
-        Session = sessionmaker(bind=self._engine)
-        session = Session()
-        try:
-            logger.info(
-                "Re-normalizing records.sort_lx and search_entries.normalized_term (∞ and ✔ symbol sort order)..."
-            )
-
-            # 1. Update records.sort_lx
-            records = session.query(Record).all()
-            for record in records:
-                record.sort_lx = LinguisticService.generate_sort_lx(record.lx)
-
-            # 2. Update search_entries.normalized_term
-            entries = session.query(SearchEntry).all()
-            for entry in entries:
-                entry.normalized_term = LinguisticService.generate_sort_lx(entry.term)
-
-            session.commit()
-            logger.info("Re-normalization for ∞ and ✔ symbol sort order complete.")
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to re-normalize for ∞ and ✔ symbol sort order: {e}")
-            raise e
-        finally:
-            session.close()
+        logger.info("Re-normalizing records.sort_lx and search_entries.normalized_term (∞ and ✔ symbol sort order)...")
+        self._renormalize_sort_keys(self._SORT_KEY_COLUMNS)
+        logger.info("Re-normalization for ∞ and ✔ symbol sort order complete.")
 
     def _migrate_reprocess_all_records(self):
         """Migration 2026030207140: Reprocess all records to synchronize languages, search entries, and metadata."""
         from src.services.upload_service import UploadService
 
-        # Use the migration's own engine session, not get_session() (which connects to production)
-        Session = sessionmaker(bind=self._engine)
-        session = Session()
-        try:
-            logger.info("Starting global record reprocessing migration...")
-            results = UploadService.reprocess_all_records(session=session)
-            session.commit()
-            logger.info(f"Migration reprocessed {results.get('reprocessed', 0)}/{results.get('total', 0)} records.")
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Migration 2026030207140 failed: {e}")
-            raise
-        finally:
-            session.close()
+        from .models.core import Record
+
+        def reprocess_chunk(session, record_ids):
+            for record in session.query(Record).filter(Record.id.in_(record_ids)):
+                if not UploadService._reprocess_record(session, record):
+                    logger.warning(f"Failed to parse MDF for record {record.id}")
+                # Flush per record to prevent autoflush PK collisions on the next one
+                session.flush()
+
+        # Uses the migration's own engine session, not get_session() (which connects to production)
+        logger.info("Starting global record reprocessing migration...")
+        records = Record.__table__
+        reprocessed = self._backfill(
+            "reprocess_records", records.c.id, reprocess_chunk, where=records.c.is_deleted == False
+        )
+        logger.info(f"Migration reprocessed {reprocessed} records.")
 
     def _migrate_backfill_search_entries(self):
         """Migration 20260615125509: Backfill HeadwordSearchEntry and GlossSearchEntry for existing records."""
         from src.services.upload_service import UploadService
 
-        Session = sessionmaker(bind=self._engine)
-        session = Session()
-        try:
-            from .models.core import Record
+        from .models.core import Record
 
-            records = session.query(Record).filter(Record.is_deleted.isnot(True)).all()
-            all_ids = [r.id for r in records]
-            logger.info(f"Backfilling search entries for {len(all_ids)} records...")
-            UploadService.populate_search_entries(record_ids=all_ids, session=session)
-            session.commit()
-            logger.info("Backfill complete.")
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to backfill search entries: {e}")
-            raise
-        finally:
-            session.close()
+        records = Record.__table__
+        logger.info("Backfilling search entries...")
+        self._backfill(
+            "search_entries",
+            records.c.id,
+            lambda session, record_ids: UploadService.populate_search_entries(record_ids=record_ids, session=session),
+            where=records.c.is_deleted.isnot(True),
+        )
+        logger.info("Backfill complete.")
 
     def _seed_default_sources(self):
         """Seed default sources if table is empty or missing specific entries."""
@@ -724,42 +898,7 @@ class MigrationManager:
                 session.execute(text("ALTER SEQUENCE records_id_seq RESTART WITH 1"))
                 session.commit()
 
-            default_sources = [
-                {
-                    "name": "Trumbull 1903",
-                    "short_name": "Trumbull (1903)",
-                    "description": "Wampanoag [wam]",
-                    "citation_format": "Trumbull, James Hammond. (1903). *Natick Dictionary*. Bureau of American Ethnology Bulletin 25. Washington: Government Printing Office.",
-                },
-                {
-                    "name": "Fielding 2012",
-                    "short_name": "Fielding (2012)",
-                    "description": "Mohegan-Pequot [xpq]",
-                    "citation_format": "Fielding, Stephanie. (2013). *A Modern Mohegan Dictionary*. (D. J. Costa, Ed.). Uncasville, CT: Mohegan Council of Elders.",
-                },
-                {
-                    "name": "Anonymous 1647",
-                    "short_name": None,
-                    "description": "Wampanoag [wam]",
-                    "citation_format": None,
-                },
-                {"name": "Winslow 1624", "short_name": None, "description": "Wampanoag [wam]", "citation_format": None},
-                {"name": "Wood 1634", "short_name": None, "description": "Wampanoag [wam]", "citation_format": None},
-                {
-                    "name": "Prince-Speck 1904",
-                    "short_name": None,
-                    "description": "Mohegan-Pequot [xpq]",
-                    "citation_format": None,
-                },
-                {
-                    "name": "Williams 1643",
-                    "short_name": None,
-                    "description": "Narragansett [xnt]",
-                    "citation_format": None,
-                },
-            ]
-
-            for src_data in default_sources:
+            for src_data in self._DEFAULT_SOURCES:
                 existing = session.query(Source).filter_by(name=src_data["name"]).first()
                 if not existing:
                     new_source = Source(**src_data)
@@ -929,29 +1068,29 @@ class MigrationManager:
         default to nextval().
         """
         with self._engine.connect() as conn:
+            # Only tables with an integer id column: pg_get_serial_sequence raises
+            # on tables keyed otherwise (source_record_counts, dirty_records, ...)
             tables = [
                 r[0]
                 for r in conn.execute(
-                    text("SELECT tablename FROM pg_catalog.pg_tables WHERE schemaname='public'")
+                    text(
+                        "SELECT c.table_name FROM information_schema.columns c "
+                        "JOIN information_schema.tables t "
+                        "ON t.table_schema = c.table_schema AND t.table_name = c.table_name "
+                        "WHERE c.table_schema = 'public' AND t.table_type = 'BASE TABLE' "
+                        "AND c.column_name = 'id' AND c.data_type = 'integer'"
+                    )
                 ).fetchall()
             ]
             for tname in tables:
                 seq = conn.execute(text("SELECT pg_get_serial_sequence(:t, 'id')"), {"t": tname}).scalar()
                 if seq:
                     continue
-                has_int_id = conn.execute(
-                    text(
-                        "SELECT EXISTS (SELECT 1 FROM information_schema.columns "
-                        "WHERE table_name = :t AND column_name = 'id' AND data_type = 'integer')"
-                    ),
-                    {"t": tname},
-                ).scalar()
-                if has_int_id:
-                    seq_name = f"{tname}_id_seq"
-                    conn.execute(text(f"CREATE SEQUENCE IF NOT EXISTS {seq_name}"))
-                    max_id = conn.execute(text(f"SELECT COALESCE(MAX(id), 0) FROM {tname}")).scalar()
-                    conn.execute(text(f"ALTER SEQUENCE {seq_name} RESTART WITH {max_id + 1}"))
-                    conn.execute(text(f"ALTER TABLE {tname} ALTER COLUMN id SET DEFAULT nextval('{seq_name}')"))
+                seq_name = f"{tname}_id_seq"
+                conn.execute(text(f"CREATE SEQUENCE IF NOT EXISTS {seq_name}"))
+                max_id = conn.execute(text(f"SELECT COALESCE(MAX(id), 0) FROM {tname}")).scalar()
+                conn.execute(text(f"ALTER SEQUENCE {seq_name} RESTART WITH {max_id + 1}"))
+                conn.execute(text(f"ALTER TABLE {tname} ALTER COLUMN id SET DEFAULT nextval('{seq_name}')"))
             conn.commit()
 
     def _migrate_create_gloss_search_entries(self):
@@ -998,10 +1137,6 @@ class MigrationManager:
 
     def _migrate_replace_fts_vector(self):
         """Migration 20260613120000: Replace records.fts_vector with fts_entries table."""
-        from src.services.linguistic_service import LinguisticService
-
-        from .models.core import Record
-
         with self._engine.connect() as conn:
             # 1. Create fts_entries table
             conn.execute(
@@ -1016,41 +1151,574 @@ class MigrationManager:
             conn.execute(text("CREATE INDEX IF NOT EXISTS idx_fts_entries_record_id ON fts_entries (record_id);"))
             conn.commit()
 
-        # 2. Populate fts_entries from all records using generate_sort_lx() + to_tsvector('simple')
-        Session = sessionmaker(bind=self._engine)
-        session = Session()
-        try:
+        # 2. Populate fts_entries from all records using snea_sort_key() + to_tsvector('simple')
+        from src.services.sort_key import sort_key_function_sql
+
+        with self._engine.connect() as conn:
             # Truncate first to ensure idempotency — migration may be re-run
             # against a database that already has fts_entries (e.g. after sync).
-            session.execute(text("TRUNCATE fts_entries"))
-            records = session.query(Record).filter(Record.is_deleted == False).all()
-            logger.info(f"Populating fts_entries for {len(records)} records...")
-            for record in records:
-                norm_text = LinguisticService.generate_sort_lx(record.mdf_data)
-                if norm_text:
-                    session.execute(
+            conn.execute(text("TRUNCATE fts_entries"))
+            conn.execute(text(sort_key_function_sql()))
+            result = conn.execute(
+                text(
+                    "INSERT INTO fts_entries (record_id, fts_vector) "
+                    "SELECT id, to_tsvector('simple', snea_sort_key(mdf_data)) FROM records "
+                    "WHERE is_deleted = false AND snea_sort_key(mdf_data) <> ''"
+                )
+            )
+            conn.commit()
+            logger.info(f"Populated fts_entries for {result.rowcount} records.")
+
+        with self._engine.connect() as conn:
+            # 3. Create GIN index on fts_entries.fts_vector
+            conn.execute(
+                text("CREATE INDEX IF NOT EXISTS idx_fts_entries_vector ON fts_entries USING gin (fts_vector);")
+            )
+            # 4. Drop old GIN index on records.fts_vector
+            conn.execute(text("DROP INDEX IF EXISTS idx_records_fts;"))
+            # 5. Drop old generated column
+            conn.execute(text("ALTER TABLE records DROP COLUMN IF EXISTS fts_vector;"))
+            conn.commit()
+
+    # Tables whose writes invalidate StatisticsService's snapshot
+    _STATISTICS_TRACKED_TABLES = ("records", "record_languages", "sources", "edit_history")
+
+    def _migrate_create_statistics_snapshot(self):
+        """Migration 20261018093012: Create statistics_snapshot and statement-level change triggers.
+
+        Each INSERT/UPDATE/DELETE/TRUNCATE statement on a tracked table calls
+        nextval('statistics_change_seq'). StatisticsService compares the
+        sequence with the snapshot's change_seq to decide whether to recompute.
+        """
+        with self._engine.connect() as conn:
+            conn.execute(
+                text("""
+                CREATE TABLE IF NOT EXISTS statistics_snapshot (
+                    id INTEGER PRIMARY KEY,
+                    payload JSON NOT NULL,
+                    change_seq BIGINT NOT NULL DEFAULT 0,
+                    computed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+                );
+            """)
+            )
+            conn.execute(text("CREATE SEQUENCE IF NOT EXISTS statistics_change_seq;"))
+            conn.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION snea_bump_statistics_change_seq() RETURNS trigger AS $$
+                BEGIN
+                    PERFORM nextval('statistics_change_seq');
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+            """)
+            )
+            for table in self._STATISTICS_TRACKED_TABLES:
+                conn.execute(text(f"DROP TRIGGER IF EXISTS trg_{table}_statistics_change ON {table};"))
+                conn.execute(
+                    text(
+                        f"CREATE TRIGGER trg_{table}_statistics_change "
+                        f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+                        "FOR EACH STATEMENT EXECUTE FUNCTION snea_bump_statistics_change_seq();"
+                    )
+                )
+            conn.commit()
+
+    # Tables whose writes bump reference_data_change_seq directly; per-source
+    # counts bump it from snea_apply_source_count_delta() when they change.
+    _REFERENCE_DATA_TABLES = ("sources", "languages", "iso_639_3")
+
+    # Tables counted per source in source_record_counts
+    _SOURCE_COUNTED_TABLES = ("records", "matchup_queue")
+
+    def _migrate_create_source_record_counts(self):
+        """Migration 20261018141530: Create source_record_counts and reference-data change triggers.
+
+        Per-source counts of records and matchup_queue rows are adjusted by
+        statement-level triggers using transition tables, one row per
+        affected source per statement, so LinguisticService no longer runs a
+        GROUP BY over both tables to list sources. The counts are backfilled
+        once under a SHARE lock after the triggers are installed.
+        """
+        with self._engine.connect() as conn:
+            conn.execute(
+                text("""
+                CREATE TABLE IF NOT EXISTS source_record_counts (
+                    source_id INTEGER PRIMARY KEY REFERENCES sources(id) ON DELETE CASCADE,
+                    record_count BIGINT NOT NULL DEFAULT 0,
+                    queue_count BIGINT NOT NULL DEFAULT 0
+                );
+            """)
+            )
+            conn.execute(text("CREATE SEQUENCE IF NOT EXISTS reference_data_change_seq;"))
+            conn.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION snea_bump_reference_data_version() RETURNS trigger AS $$
+                BEGIN
+                    PERFORM nextval('reference_data_change_seq');
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+            """)
+            )
+            # Deltas are applied in source_id order so concurrent writers
+            # lock count rows in the same order.
+            conn.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION snea_apply_source_count_delta() RETURNS trigger AS $$
+                DECLARE
+                    deltas refcursor;
+                    d RECORD;
+                    is_records BOOLEAN := TG_TABLE_NAME = 'records';
+                    changed BOOLEAN := false;
+                BEGIN
+                    IF TG_OP = 'INSERT' THEN
+                        OPEN deltas FOR
+                            SELECT source_id, count(*) AS n FROM new_rows GROUP BY source_id ORDER BY source_id;
+                    ELSIF TG_OP = 'DELETE' THEN
+                        OPEN deltas FOR
+                            SELECT source_id, -count(*) AS n FROM old_rows GROUP BY source_id ORDER BY source_id;
+                    ELSE
+                        OPEN deltas FOR
+                            SELECT source_id, sum(n) AS n FROM (
+                                SELECT source_id, 1 AS n FROM new_rows
+                                UNION ALL
+                                SELECT source_id, -1 AS n FROM old_rows
+                            ) moved
+                            GROUP BY source_id HAVING sum(n) <> 0 ORDER BY source_id;
+                    END IF;
+
+                    LOOP
+                        FETCH deltas INTO d;
+                        EXIT WHEN NOT FOUND;
+                        INSERT INTO source_record_counts AS c (source_id, record_count, queue_count)
+                        VALUES (
+                            d.source_id,
+                            CASE WHEN is_records THEN d.n ELSE 0 END,
+                            CASE WHEN is_records THEN 0 ELSE d.n END
+                        )
+                        ON CONFLICT (source_id) DO UPDATE
+                            SET record_count = c.record_count + EXCLUDED.record_count,
+                                queue_count = c.queue_count + EXCLUDED.queue_count;
+                        changed := true;
+                    END LOOP;
+                    CLOSE deltas;
+
+                    IF changed THEN
+                        PERFORM nextval('reference_data_change_seq');
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+            """)
+            )
+            conn.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION snea_reset_source_counts() RETURNS trigger AS $$
+                BEGIN
+                    IF TG_TABLE_NAME = 'records' THEN
+                        UPDATE source_record_counts SET record_count = 0;
+                    ELSE
+                        UPDATE source_record_counts SET queue_count = 0;
+                    END IF;
+                    PERFORM nextval('reference_data_change_seq');
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+            """)
+            )
+
+            for table in self._REFERENCE_DATA_TABLES:
+                conn.execute(text(f"DROP TRIGGER IF EXISTS trg_{table}_reference_data_change ON {table};"))
+                conn.execute(
+                    text(
+                        f"CREATE TRIGGER trg_{table}_reference_data_change "
+                        f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+                        "FOR EACH STATEMENT EXECUTE FUNCTION snea_bump_reference_data_version();"
+                    )
+                )
+
+            # Transition tables allow only one event per trigger
+            for table in self._SOURCE_COUNTED_TABLES:
+                for event, referencing in (
+                    ("INSERT", "NEW TABLE AS new_rows"),
+                    ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+                    ("DELETE", "OLD TABLE AS old_rows"),
+                ):
+                    trigger = f"trg_{table}_source_counts_{event.lower()}"
+                    conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger} ON {table};"))
+                    conn.execute(
                         text(
-                            "INSERT INTO fts_entries (record_id, fts_vector) "
-                            "VALUES (:rid, to_tsvector('simple', :norm))"
-                        ),
-                        {"rid": record.id, "norm": norm_text},
+                            f"CREATE TRIGGER {trigger} AFTER {event} ON {table} "
+                            f"REFERENCING {referencing} "
+                            "FOR EACH STATEMENT EXECUTE FUNCTION snea_apply_source_count_delta();"
+                        )
                     )
-            session.commit()
-            logger.info("fts_entries population complete.")
+                conn.execute(text(f"DROP TRIGGER IF EXISTS trg_{table}_source_counts_truncate ON {table};"))
+                conn.execute(
+                    text(
+                        f"CREATE TRIGGER trg_{table}_source_counts_truncate AFTER TRUNCATE ON {table} "
+                        "FOR EACH STATEMENT EXECUTE FUNCTION snea_reset_source_counts();"
+                    )
+                )
+
+            # Backfill with writers blocked so no delta is lost or double-counted
+            conn.execute(text("LOCK TABLE records, matchup_queue IN SHARE MODE;"))
+            conn.execute(
+                text("""
+                INSERT INTO source_record_counts (source_id, record_count, queue_count)
+                SELECT s.id,
+                       (SELECT count(*) FROM records r WHERE r.source_id = s.id),
+                       (SELECT count(*) FROM matchup_queue m WHERE m.source_id = s.id)
+                FROM sources s
+                ON CONFLICT (source_id) DO UPDATE
+                    SET record_count = EXCLUDED.record_count,
+                        queue_count = EXCLUDED.queue_count;
+            """)
+            )
+            conn.execute(text("SELECT nextval('reference_data_change_seq');"))
+            conn.commit()
+
+    def _migrate_add_records_lx_base_form_index(self):
+        """Migration 20261018170412: Index records by diacritic-folded, lowercased headword.
+
+        The upload review page resolves cross-source matches for a whole page
+        with one lookup on this expression; without the index it is a
+        sequential scan of records.
+        """
+        # Frozen copy of review_page_loader.LX_BASE_FORM_FROM/TO as of this migration
+        with self._engine.connect() as conn:
+            conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS idx_records_lx_base_form ON records "
+                    "(lower(translate(lx, 'áàâäãåāéèêëēíìîïīóòôöõøōúùûüū', 'aaaaaaaeeeeeiiiiiooooooouuuuu')));"
+                )
+            )
+            conn.commit()
+
+    # Records whose history chains are rewritten per transaction
+    _HISTORY_COMPACTION_BATCH = 200
+
+    def _migrate_compact_edit_history(self):
+        """Migration 20261018190245: Store edit_history as periodic keyframes plus line deltas.
+
+        Adds the storage/base_id columns, then rewrites existing history one
+        batch of records per transaction so the migration can be interrupted
+        and re-run; already compacted chains are left untouched.
+        """
+        from src.services.history_store import compact_record_history
+
+        from .models.workflow import EditHistory
+
+        with self._engine.connect() as conn:
+            conn.execute(
+                text("ALTER TABLE edit_history ADD COLUMN IF NOT EXISTS storage TEXT NOT NULL DEFAULT 'full';")
+            )
+            conn.execute(
+                text("ALTER TABLE edit_history ADD COLUMN IF NOT EXISTS base_id INTEGER REFERENCES edit_history(id);")
+            )
+            # Referencing-row lookups when history rows are deleted
+            conn.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS idx_edit_history_base_id ON edit_history (base_id) "
+                    "WHERE base_id IS NOT NULL;"
+                )
+            )
+            conn.commit()
+
+        rewritten = 0
+
+        def compact_chunk(session, record_ids):
+            nonlocal rewritten
+            rewritten += compact_record_history(session, record_ids)
+
+        compacted = self._backfill(
+            "edit_history",
+            EditHistory.__table__.c.record_id,
+            compact_chunk,
+            chunk_size=self._HISTORY_COMPACTION_BATCH,
+            distinct=True,
+        )
+        logger.info(f"Compacted edit_history for {compacted} records ({rewritten} rows rewritten).")
+
+    # Records re-parsed per transaction when backfilling records.parsed
+    _PARSED_BACKFILL_BATCH = 500
+
+    def _migrate_add_records_parsed(self):
+        """Migration 20261018203117: Persist parse_mdf() output on records.
+
+        Adds records.parsed/parsed_version and fills them one batch per
+        transaction. Rows left unfilled (or stamped by an older parser) are
+        still re-derived lazily on read.
+        """
+        from src.services.parsed_record import refresh_stale_parsed
+
+        with self._engine.connect() as conn:
+            conn.execute(text("ALTER TABLE records ADD COLUMN IF NOT EXISTS parsed JSONB;"))
+            conn.execute(text("ALTER TABLE records ADD COLUMN IF NOT EXISTS parsed_version INTEGER;"))
+            conn.commit()
+
+        Session = sessionmaker(bind=self._engine)
+        session = Session()
+        try:
+            refreshed, last_id = 0, 0
+            while last_id is not None:
+                count, last_id = refresh_stale_parsed(session, self._PARSED_BACKFILL_BATCH, last_id)
+                session.commit()
+                refreshed += count
+            logger.info(f"Backfilled records.parsed for {refreshed} records.")
         except Exception as e:
             session.rollback()
-            logger.error(f"Failed to populate fts_entries: {e}")
+            logger.error(f"Failed to backfill records.parsed: {e}")
             raise
         finally:
             session.close()
 
+    def _migrate_create_dirty_records(self):
+        """Migration 20261018214502: Queue records for background derived-data rebuilds.
+
+        Statement-level triggers on records enqueue inserted rows and rows
+        whose mdf_data changed (see src/services/derived_data_queue.py). All
+        existing records are enqueued once so edits made before the queue
+        existed become searchable too.
+        """
         with self._engine.connect() as conn:
-            # 3. Create GIN index on fts_entries.fts_vector
             conn.execute(
-                text("CREATE INDEX IF NOT EXISTS idx_fts_entries_vector ON fts_entries USING gin (fts_vector);")
+                text("""
+                CREATE TABLE IF NOT EXISTS dirty_records (
+                    record_id INTEGER PRIMARY KEY REFERENCES records(id) ON DELETE CASCADE,
+                    enqueued_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+                );
+            """)
+            )
+            conn.execute(
+                text("CREATE INDEX IF NOT EXISTS idx_dirty_records_enqueued_at ON dirty_records (enqueued_at);")
+            )
+            conn.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION snea_enqueue_dirty_records() RETURNS trigger AS $$
+                BEGIN
+                    IF TG_OP = 'INSERT' THEN
+                        INSERT INTO dirty_records (record_id)
+                        SELECT id FROM new_rows
+                        ON CONFLICT (record_id) DO UPDATE SET enqueued_at = NOW();
+                    ELSE
+                        INSERT INTO dirty_records (record_id)
+                        SELECT n.id FROM new_rows n JOIN old_rows o ON o.id = n.id
+                        WHERE n.mdf_data IS DISTINCT FROM o.mdf_data
+                        ON CONFLICT (record_id) DO UPDATE SET enqueued_at = NOW();
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+            """)
+            )
+            for event, referencing in (
+                ("INSERT", "NEW TABLE AS new_rows"),
+                ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ):
+                trigger = f"trg_records_dirty_{event.lower()}"
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger} ON records;"))
+                conn.execute(
+                    text(
+                        f"CREATE TRIGGER {trigger} AFTER {event} ON records "
+                        f"REFERENCING {referencing} "
+                        "FOR EACH STATEMENT EXECUTE FUNCTION snea_enqueue_dirty_records();"
+                    )
+                )
+            conn.execute(text("INSERT INTO dirty_records (record_id) SELECT id FROM records ON CONFLICT DO NOTHING;"))
+            conn.commit()
+
+    def _migrate_create_search_functions(self):
+        """Migration 20261019093214: SQL ports of the sort key and search-row derivation.
+
+        Creates snea_sort_key(text), snea_search_rows(jsonb, text) and the
+        trigger function behind SNEA_SEARCH_MAINTENANCE=trigger. The triggers
+        themselves are installed or dropped by init_db to match that setting.
+        """
+        from src.services.search_index import REFRESH_TRIGGER_FUNCTION_SQL, SEARCH_ROWS_FUNCTION_SQL
+        from src.services.sort_key import sort_key_function_sql
+
+        with self._engine.connect() as conn:
+            conn.execute(text(sort_key_function_sql()))
+            conn.execute(text(SEARCH_ROWS_FUNCTION_SQL))
+            conn.execute(text(REFRESH_TRIGGER_FUNCTION_SQL))
+            conn.commit()
+
+    def _migrate_renormalize_case_map(self):
+        """Migration 20261019151806: Re-normalize sort keys for the explicit lowercase mapping.
+
+        snea_sort_key() no longer lowercases non-ASCII text with the
+        database's LC_CTYPE, and both sides now fold final sigma to σ. Only
+        keys that actually change are rewritten.
+        """
+        self._renormalize_sort_keys(
+            self._SORT_KEY_COLUMNS
+            + (
+                ("headword_search_entries", "normalized_term", "term"),
+                ("gloss_search_entries", "normalized_term", "term"),
+            )
+        )
+
+    # Rows per change counter; a writer bumps the one picked by its backend pid
+    _CHANGE_COUNTER_SLOTS = 32
+
+    def _migrate_create_change_counters(self):
+        """Migration 20261019203305: Version reference data with committed counter rows.
+
+        nextval() is not transactional: a reader could see a writer's bump
+        before the writer's rows committed, load the old data and cache it
+        under the new version, where it stayed. change_counters rows are
+        updated inside the writer's transaction, so a version read as
+        sum(value) in the reader's snapshot only counts committed writes.
+        Each backend bumps slot pg_backend_pid() % _CHANGE_COUNTER_SLOTS, so
+        concurrent writers rarely wait on the same row.
+        """
+        with self._engine.connect() as conn:
+            conn.execute(
+                text("""
+                CREATE TABLE IF NOT EXISTS change_counters (
+                    name TEXT NOT NULL,
+                    slot SMALLINT NOT NULL,
+                    value BIGINT NOT NULL DEFAULT 0,
+                    PRIMARY KEY (name, slot)
+                );
+            """)
+            )
+            conn.execute(
+                text(f"""
+                CREATE OR REPLACE FUNCTION snea_bump_change_counter(p_name text) RETURNS void AS $$
+                    INSERT INTO change_counters AS c (name, slot, value)
+                    VALUES (p_name, pg_backend_pid() % {self._CHANGE_COUNTER_SLOTS}, 1)
+                    ON CONFLICT (name, slot) DO UPDATE SET value = c.value + 1;
+                $$ LANGUAGE sql;
+            """)
+            )
+            conn.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION snea_bump_reference_data_version() RETURNS trigger AS $$
+                BEGIN
+                    PERFORM snea_bump_change_counter('reference_data');
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+            """)
+            )
+            conn.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION snea_apply_source_count_delta() RETURNS trigger AS $$
+                DECLARE
+                    deltas refcursor;
+                    d RECORD;
+                    is_records BOOLEAN := TG_TABLE_NAME = 'records';
+                    changed BOOLEAN := false;
+                BEGIN
+                    IF TG_OP = 'INSERT' THEN
+                        OPEN deltas FOR
+                            SELECT source_id, count(*) AS n FROM new_rows GROUP BY source_id ORDER BY source_id;
+                    ELSIF TG_OP = 'DELETE' THEN
+                        OPEN deltas FOR
+                            SELECT source_id, -count(*) AS n FROM old_rows GROUP BY source_id ORDER BY source_id;
+                    ELSE
+                        OPEN deltas FOR
+                            SELECT source_id, sum(n) AS n FROM (
+                                SELECT source_id, 1 AS n FROM new_rows
+                                UNION ALL
+                                SELECT source_id, -1 AS n FROM old_rows
+                            ) moved
+                            GROUP BY source_id HAVING sum(n) <> 0 ORDER BY source_id;
+                    END IF;
+
+                    LOOP
+                        FETCH deltas INTO d;
+                        EXIT WHEN NOT FOUND;
+                        INSERT INTO source_record_counts AS c (source_id, record_count, queue_count)
+                        VALUES (
+                            d.source_id,
+                            CASE WHEN is_records THEN d.n ELSE 0 END,
+                            CASE WHEN is_records THEN 0 ELSE d.n END
+                        )
+                        ON CONFLICT (source_id) DO UPDATE
+                            SET record_count = c.record_count + EXCLUDED.record_count,
+                                queue_count = c.queue_count + EXCLUDED.queue_count;
+                        changed := true;
+                    END LOOP;
+                    CLOSE deltas;
+
+                    IF changed THEN
+                        PERFORM snea_bump_change_counter('reference_data');
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+            """)
+            )
+            conn.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION snea_reset_source_counts() RETURNS trigger AS $$
+                BEGIN
+                    IF TG_TABLE_NAME = 'records' THEN
+                        UPDATE source_record_counts SET record_count = 0;
+                    ELSE
+                        UPDATE source_record_counts SET queue_count = 0;
+                    END IF;
+                    PERFORM snea_bump_change_counter('reference_data');
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+            """)
+            )
+            conn.execute(text("DROP SEQUENCE IF EXISTS reference_data_change_seq;"))
+            conn.commit()
+
+    def _migrate_statistics_change_counter(self):
+        """Migration 20261019205117: Bump the "statistics" change counter instead of a sequence.
+
+        Same race as reference data: statistics_change_seq moved before the
+        writer committed, so a snapshot computed from the old rows could be
+        stored under the new value and served as fresh.
+        """
+        with self._engine.connect() as conn:
+            conn.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION snea_bump_statistics_change_seq() RETURNS trigger AS $$
+                BEGIN
+                    PERFORM snea_bump_change_counter('statistics');
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+            """)
+            )
+            conn.execute(text("DROP SEQUENCE IF EXISTS statistics_change_seq;"))
+            conn.commit()
+
+    def _migrate_invalidate_parsed_on_raw_update(self):
+        """Migration 20261019214536: Mark records.parsed stale when SQL rewrites mdf_data.
+
+        The ORM refreshes parsed and parsed_version with every mdf_data
+        assignment, but a raw UPDATE of mdf_data kept the old parse stamped
+        current. This BEFORE UPDATE trigger clears parsed_version whenever
+        mdf_data changes while parsed does not, so parsed_entry() re-derives
+        the row on its next read. An ORM edit whose parse comes out identical
+        is cleared too, which costs one re-parse.
+        """
+        with self._engine.connect() as conn:
+            conn.execute(
+                text("""
+                CREATE OR REPLACE FUNCTION snea_invalidate_parsed() RETURNS trigger AS $$
+                BEGIN
+                    NEW.parsed_version := NULL;
+                    RETURN NEW;
+                END;
+                $$ LANGUAGE plpgsql;
+            """)
+            )
+            conn.execute(text("DROP TRIGGER IF EXISTS trg_records_invalidate_parsed ON records;"))
+            conn.execute(
+                text(
+                    "CREATE TRIGGER trg_records_invalidate_parsed BEFORE UPDATE OF mdf_data ON records "
+                    "FOR EACH ROW WHEN (NEW.mdf_data IS DISTINCT FROM OLD.mdf_data "
+                    "AND NEW.parsed IS NOT DISTINCT FROM OLD.parsed) "
+                    "EXECUTE FUNCTION snea_invalidate_parsed();"
+                )
             )
-            # 4. Drop old GIN index on records.fts_vector
-            conn.execute(text("DROP INDEX IF EXISTS idx_records_fts;"))
-            # 5. Drop old generated column
-            conn.execute(text("ALTER TABLE records DROP COLUMN IF EXISTS fts_vector;"))
             conn.commit()
@@ -1,10 +1,13 @@
 # Copyright (c) 2026 Brothertown Language
 # <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import TIMESTAMP, Boolean, Column, ForeignKey, Integer, String, Text
+from sqlalchemy import TIMESTAMP, Boolean, Column, ForeignKey, Integer, String, Text, event
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
+from src.mdf.parser import PARSER_VERSION, parse_record
+
 from ..base import Base
 
 
@@ -73,6 +76,8 @@ class Record(Base):
         status (str): Workflow state ('draft', 'edited', 'approved').
         embedding (Vector): 1536-dim semantic vector for cross-reference lookup.
         mdf_data (str): Full raw MDF text block.
+        parsed (dict): parse_record() output for mdf_data; read via parsed_entry().
+        parsed_version (int): PARSER_VERSION that produced parsed; NULL if never parsed.
         current_version (int): Optimistic locking version number.
         is_deleted (bool): Soft delete flag.
         updated_at (datetime): Automated timestamp of last modification.
@@ -94,6 +99,8 @@ class Record(Base):
     status = Column(String, nullable=False, default="draft")  # 'draft', 'edited', 'approved'
     embedding = Column(Vector(1536))  # Semantic cross-reference
     mdf_data = Column(Text, nullable=False)  # Raw MDF body
+    parsed = Column(JSONB(none_as_null=True))  # Structured fields derived from mdf_data
+    parsed_version = Column(Integer)  # Parser version stamp for parsed
 
     # Locking fields
     is_locked = Column(Boolean, nullable=False, default=False)
@@ -123,3 +130,10 @@ class Record(Base):
     __mapper_args__ = {
         "version_id_col": current_version,
     }
+
+
+@event.listens_for(Record.mdf_data, "set")
+def _refresh_parsed(target, value, oldvalue, initiator):
+    """Keep records.parsed in step with every ORM assignment of mdf_data."""
+    target.parsed = parse_record(value)
+    target.parsed_version = PARSER_VERSION
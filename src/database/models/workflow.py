@@ -61,7 +61,27 @@ class EditHistory(Base):
     change_summary = Column(Text)
     prev_data = Column(Text)  # MDF snapshot before change
     current_data = Column(Text, nullable=False)  # MDF snapshot after change
+    # Encoding of prev_data/current_data: full, keyframe or delta (see src/services/history_store.py)
+    storage = Column(String, nullable=False, server_default="full")
+    base_id = Column(Integer, ForeignKey("edit_history.id"))  # Older row a delta applies to
     timestamp = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     record = relationship("Record", back_populates="history")
     user = relationship("User", back_populates="edit_history")
+
+
+class DirtyRecord(Base):
+    """
+    Durable queue of records whose derived data must be rebuilt.
+
+    Filled by row triggers on records whenever a record is inserted or its
+    mdf_data changes (see MigrationManager._migrate_create_dirty_records);
+    drained in batches by the derived-data indexer in
+    src/services/derived_data_queue.py. One row per record: re-enqueueing an
+    already queued record only moves enqueued_at.
+    """
+
+    __tablename__ = "dirty_records"
+    __table_args__ = {"extend_existing": True}  # Required: prevents re-import errors on Streamlit hot-reload
+    record_id = Column(Integer, ForeignKey("records.id", ondelete="CASCADE"), primary_key=True, autoincrement=False)
+    enqueued_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
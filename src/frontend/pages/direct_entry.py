@@ -49,7 +49,7 @@ def direct_entry():
 
     # 2. Number of Fields
     if "num_fields" not in st.session_state and user_email:
-        saved_num = PreferenceService.get_preference(user_email, "direct_entry", "num_fields", "1")
+        saved_num = PreferenceService.get_cached_preference(user_email, "direct_entry", "num_fields", "1")
         st.session_state.num_fields = int(saved_num)
 
     if "num_fields" not in st.session_state:
@@ -62,7 +62,7 @@ def direct_entry():
     if num_fields != st.session_state.num_fields:
         st.session_state.num_fields = num_fields
         if user_email:
-            PreferenceService.set_preference(user_email, "direct_entry", "num_fields", str(num_fields))
+            PreferenceService.set_preference_deferred(user_email, "direct_entry", "num_fields", str(num_fields))
         st.rerun()
 
     # --- Main Input Form ---
@@ -20,12 +20,18 @@ def index():
     # --- Statistics Section ---
     st.markdown("### Database Statistics")
 
+    # One snapshot feeds every section of the page
+    snapshot = StatisticsService.get_snapshot()
+
     # Summary Metrics
-    stats = StatisticsService.get_summary_stats()
+    stats = StatisticsService.get_summary_stats(snapshot)
     col1, col2, col3 = st.columns(3)
     col1.metric("Total Records", stats["records"])
     col2.metric("Sources", stats["sources"])
     col3.metric("Languages", stats["languages"])
+    computed_at = snapshot.get("computed_at")
+    if computed_at:
+        st.caption(f"Statistics as of {computed_at.astimezone().strftime('%Y-%m-%d %H:%M:%S %Z')}")
 
     st.divider()
 
@@ -34,7 +40,7 @@ def index():
 
     with chart_col1:
         st.subheader("Primary Language Distribution")
-        primary_lang_data = StatisticsService.get_language_distribution(primary_only=True)
+        primary_lang_data = StatisticsService.get_language_distribution(primary_only=True, snapshot=snapshot)
         if primary_lang_data:
             df_primary = pd.DataFrame(list(primary_lang_data.items()), columns=["Language", "Count"])
             st.bar_chart(df_primary.set_index("Language"))
@@ -43,7 +49,7 @@ def index():
 
     with chart_col2:
         st.subheader("All Languages Distribution")
-        all_lang_data = StatisticsService.get_language_distribution(primary_only=False)
+        all_lang_data = StatisticsService.get_language_distribution(primary_only=False, snapshot=snapshot)
         if all_lang_data:
             df_all = pd.DataFrame(list(all_lang_data.items()), columns=["Language", "Count"])
             st.bar_chart(df_all.set_index("Language"))
@@ -55,7 +61,7 @@ def index():
             st.info("No language data available.")
 
     st.subheader("Top Parts of Speech")
-    pos_data = StatisticsService.get_top_parts_of_speech()
+    pos_data = StatisticsService.get_top_parts_of_speech(snapshot=snapshot)
     if pos_data:
         df_pos = pd.DataFrame(list(pos_data.items()), columns=["POS", "Count"])
         st.bar_chart(df_pos.set_index("POS"))
@@ -63,7 +69,7 @@ def index():
         st.info("No POS data available.")
 
     st.subheader("Records per Source")
-    source_distribution = StatisticsService.get_source_distribution()
+    source_distribution = StatisticsService.get_source_distribution(snapshot)
     if source_distribution:
         # Get source IDs to create links
         from src.services.linguistic_service import LinguisticService
@@ -89,7 +95,7 @@ def index():
         st.info("No source data available.")
 
     st.subheader("Records by Status")
-    status_data = StatisticsService.get_status_distribution()
+    status_data = StatisticsService.get_status_distribution(snapshot)
     if status_data:
         df_status = pd.DataFrame(list(status_data.items()), columns=["Status", "Count"])
         st.bar_chart(df_status.set_index("Status"))
@@ -100,7 +106,7 @@ def index():
 
     # Recent Activity
     st.subheader("Recent Activity")
-    activity = StatisticsService.get_recent_activity()
+    activity = StatisticsService.get_recent_activity(snapshot=snapshot)
     if activity:
         for i, item in enumerate(activity):
             with st.expander(f"Record {item['record_id']} ({item['lx']}) edited by {item['user']}"):
@@ -1,24 +1,34 @@
 # Copyright (c) 2026 Brothertown Language
 # <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
 import datetime as _dt
-import io
 import json
-import zipfile
+import os
 
 import streamlit as st
 
 
+def _read_export(temp_path: str) -> bytes:
+    """Hand a finished export file to Streamlit, which buffers downloads in memory, and delete it."""
+    try:
+        with open(temp_path, "rb") as f:
+            return f.read()
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
 def records():
     from src.frontend.ui_utils import (
         apply_standard_layout_css,
         compute_mdf_line_diffs,
+        format_mdf_for_display,
         handle_ui_error,
         hide_sidebar_nav,
+        inject_mdf_styles,
         render_back_to_main_button,
         render_mdf_block,
+        render_mdf_record,
     )
-    from src.mdf.parser import format_mdf_record
-    from src.mdf.validator import MDFValidator
     from src.services.identity_service import IdentityService
     from src.services.linguistic_service import LinguisticService
     from src.services.navigation_service import NavigationService
@@ -44,12 +54,14 @@ def records():
 
     # Load persistence preferences
     if user_email:
+        # One query for every preference this page reads
+        PreferenceService.prefetch_preferences(user_email, ("records", "global"))
         if "page_size" not in st.session_state:
-            saved_size = PreferenceService.get_preference(user_email, "records", "page_size", "25")
+            saved_size = PreferenceService.get_cached_preference(user_email, "records", "page_size", "25")
             st.session_state.page_size = int(saved_size) if saved_size is not None else 25
 
         if "structural_highlighting" not in st.session_state:
-            saved_hl = PreferenceService.get_preference(user_email, "records", "structural_highlighting", "True")
+            saved_hl = PreferenceService.get_cached_preference(user_email, "records", "structural_highlighting", "True")
             st.session_state.structural_highlighting = saved_hl == "True"
 
     # Defaults if still missing
@@ -85,19 +97,14 @@ def records():
         # Try to load selection from persistence
         st.session_state.selection = []
         if user_email:
-            selection_json = PreferenceService.get_preference(user_email, "global", "selection_contents", "[]")
+            selection_json = PreferenceService.get_cached_preference(user_email, "global", "selection_contents", "[]")
             if selection_json is None:
                 selection_ids = []
             else:
                 try:
                     selection_ids = json.loads(selection_json)
                     if selection_ids:
-                        loaded_records = []
-                        for rid in selection_ids:
-                            rec = LinguisticService.get_record(rid)
-                            if rec:
-                                loaded_records.append(rec)
-                        st.session_state.selection = loaded_records
+                        st.session_state.selection = LinguisticService.get_records(selection_ids)
                 except Exception as e:
                     handle_ui_error(e, f"Failed to load selection for {user_email}", logger_name="snea.pages.records")
 
@@ -323,7 +330,7 @@ def records():
             st.session_state.page_size = new_page_size
             st.session_state.current_page = 1
             if user_email:
-                PreferenceService.set_preference(user_email, "records", "page_size", str(new_page_size))
+                PreferenceService.set_preference_deferred(user_email, "records", "page_size", str(new_page_size))
             st.rerun()
 
         # Moved Editing Controls here
@@ -341,10 +348,14 @@ def records():
                 if col_e2.button("Save All", icon="💾", type="primary", use_container_width=True):
                     save_errors = []
                     skipped_locked = []
+                    # Explicit check for locked records during bulk save
+                    locked_ids = {
+                        rec["id"]
+                        for rec in LinguisticService.get_records(list(st.session_state.pending_edits))
+                        if rec.get("is_locked")
+                    }
                     for rid, mdf in st.session_state.pending_edits.items():
-                        # Explicit check for locked records during bulk save
-                        rec = LinguisticService.get_record(rid)
-                        if rec and rec.get("is_locked"):
+                        if rid in locked_ids:
                             skipped_locked.append(rid)
                             continue
 
@@ -387,7 +398,7 @@ def records():
         if structural_highlighting != st.session_state.structural_highlighting:
             st.session_state.structural_highlighting = structural_highlighting
             if user_email:
-                PreferenceService.set_preference(
+                PreferenceService.set_preference_deferred(
                     user_email, "records", "structural_highlighting", str(structural_highlighting)
                 )
             st.rerun()
@@ -435,7 +446,7 @@ def records():
             if selection_col3.button("🗑️", use_container_width=True, help="Discard selection"):
                 st.session_state.selection = []
                 if user_email:
-                    PreferenceService.set_preference(user_email, "global", "selection_contents", "[]")
+                    PreferenceService.set_preference_deferred(user_email, "global", "selection_contents", "[]")
                 st.session_state.view_selection_only = False
                 st.rerun()
         else:
@@ -449,50 +460,54 @@ def records():
         export_search_term = search_term
         export_record_ids = selection_record_ids
 
-        # Prepare export data
-        all_matching_records = LinguisticService.get_all_records_for_export(
+        # Prepare export summary (per-source counts only; MDF is streamed on demand)
+        export_summary = LinguisticService.get_export_summary(
             source_id=export_source_id,
             search_term=export_search_term,
             search_mode=st.session_state.search_mode,
             record_ids=export_record_ids,
         )
+        export_total = sum(s["count"] for s in export_summary)
+        distinct_sources = sorted({s["source_name"] for s in export_summary if s.get("source_name")})
 
-        distinct_sources = sorted({r["source_name"] for r in all_matching_records if r.get("source_name")})
-
-        if all_matching_records:
+        if export_total:
             github_username = IdentityService.get_github_username(user_email)
+            # Read now: the deferred builders run on another thread, outside the script run
+            search_mode = st.session_state.search_mode
 
             if len(distinct_sources) > 1:
-                # Multiple sources: Zip file
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, "a", zipfile.ZIP_DEFLATED, False) as zip_file:
-                    for src_name in distinct_sources:
-                        src_records = [r for r in all_matching_records if r["source_name"] == src_name]
-                        if not src_records:
-                            continue
-
-                        mdf_content = LinguisticService.bundle_records_to_mdf(src_records)
+                # Multiple sources: Zip file streamed to disk, one MDF entry per source
+                def _entry_name(src_name: str) -> str:
+                    return UploadService.generate_mdf_filename(
+                        prefix="export",
+                        source_name=src_name,
+                        timestamp=_dt.datetime.now(),
+                        github_username=github_username,
+                    )
 
-                        # Generate individual filename for the entry in zip
-                        entry_fname = UploadService.generate_mdf_filename(
-                            prefix="export",
-                            source_name=src_name,
-                            timestamp=_dt.datetime.now(),
-                            github_username=github_username,
+                def _build_zip():
+                    return _read_export(
+                        LinguisticService.stream_records_to_archive(
+                            entry_name=_entry_name,
+                            source_id=export_source_id,
+                            search_term=export_search_term,
+                            search_mode=search_mode,
+                            record_ids=export_record_ids,
+                            compression="zip",
                         )
-                        zip_file.writestr(entry_fname, mdf_content)
+                    )
 
                 zip_filename = f"snea_export_{_dt.datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
 
+                # Built on click, not on every rerun
                 st.download_button(
                     label="Download All (Zip)",
-                    data=zip_buffer.getvalue(),
+                    data=_build_zip,
                     file_name=zip_filename,
                     mime="application/zip",
                     use_container_width=True,
                     help=(
-                        f"Download {len(all_matching_records)} records"
-                        f" from {len(distinct_sources)} sources as a ZIP of MDF files"
+                        f"Download {export_total} records from {len(distinct_sources)} sources as a ZIP of MDF files"
                     ),
                 )
             else:
@@ -506,30 +521,25 @@ def records():
                     github_username=github_username,
                 )
 
-                # Use streaming to temp file for better memory management
-                temp_path = LinguisticService.stream_records_to_temp_file(
-                    source_id=export_source_id,
-                    search_term=export_search_term,
-                    search_mode=st.session_state.search_mode,
-                    record_ids=export_record_ids,
-                )
-
-                try:
-                    with open(temp_path, "rb") as f:
-                        file_bytes = f.read()
-                        st.download_button(
-                            label="Download Source (MDF)",
-                            data=file_bytes,
-                            file_name=fname,
-                            mime="text/plain",
-                            use_container_width=True,
-                            help=f"Download {len(all_matching_records)} records from {source_name} as MDF (Streamed)",
+                def _build_mdf():
+                    return _read_export(
+                        LinguisticService.stream_records_to_temp_file(
+                            source_id=export_source_id,
+                            search_term=export_search_term,
+                            search_mode=search_mode,
+                            record_ids=export_record_ids,
                         )
-                finally:
-                    import os
+                    )
 
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
+                # Streamed to a temp file on click, not on every rerun
+                st.download_button(
+                    label="Download Source (MDF)",
+                    data=_build_mdf,
+                    file_name=fname,
+                    mime="text/plain",
+                    use_container_width=True,
+                    help=f"Download {export_total} records from {source_name} as MDF (Streamed)",
+                )
         else:
             st.button("Download (Empty)", disabled=True, use_container_width=True)
 
@@ -540,10 +550,10 @@ def records():
     if not records_batch:
         st.info("No records found matching your criteria.")
     else:
+        inject_mdf_styles()
         for record in records_batch:
             record_id = record["id"]
-            mdf_data = format_mdf_record(record["mdf_data"])
-            mdf_lines = mdf_data.split("\n")
+            mdf_data = format_mdf_for_display(record["mdf_data"])
 
             with st.container(border=True):
                 is_locked = bool(record.get("is_locked", False))
@@ -613,11 +623,9 @@ def records():
                     if is_locked and st.session_state.global_edit_mode:
                         st.warning("🔒 Record is locked and cannot be edited in global edit mode.")
 
-                    diagnostics = None
-                    if st.session_state.structural_highlighting:
-                        diagnostics = MDFValidator.diagnose_record(mdf_lines)
-
-                    render_mdf_block(mdf_data, diagnostics=diagnostics, key=f"render_{record_id}")
+                    render_mdf_record(
+                        record["mdf_data"], st.session_state.structural_highlighting, key=f"render_{record_id}"
+                    )
 
                     # Action Toolbar
                     toolbar_cols = [1, 1]
@@ -643,7 +651,7 @@ def records():
 
                         if user_email:
                             selection_ids = [r["id"] for r in st.session_state.selection]
-                            PreferenceService.set_preference(
+                            PreferenceService.set_preference_deferred(
                                 user_email, "global", "selection_contents", json.dumps(selection_ids)
                             )
                         st.rerun()
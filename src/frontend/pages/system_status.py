@@ -163,6 +163,20 @@ def system_status():
         for key, value in env_info.items():
             st.text(f"{key}: {value}")
 
+        st.divider()
+        st.subheader("Startup Timing")
+        from src.database.connection import startup_timings
+
+        if startup_timings:
+            st.text(f"init_db total: {startup_timings['total']:.3f}s")
+            for phase, seconds in startup_timings.items():
+                if phase != "total":
+                    st.text(f"  {phase}: {seconds:.3f}s")
+            if "create_all" not in startup_timings:
+                st.caption("Fast path: the schema fingerprint was current, so migrations and seeding were skipped.")
+        else:
+            st.write("No database initialization has run in this process.")
+
         st.divider()
         st.subheader("Hardware Inspection")
         hw_info = InfrastructureService.get_hardware_info()
@@ -187,6 +201,85 @@ def system_status():
                 writable_str = "✅ Writable" if details["Writable"] else "❌ Read-only"
                 cols[1].text(f"Access: {writable_str}")
 
+    # Full width: the statement column needs the room
+    if st.session_state.get("user_role") == "admin":
+        import time
+
+        from src.services.query_stats import SLOW_QUERY_ENV, query_stats, slow_query_ms
+
+        st.divider()
+        st.subheader("Query Statistics")
+        st.caption(
+            f"SQL statements issued by this server process since "
+            f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(query_stats.since))}, grouped by statement, "
+            f"calling function and page. Statements over {slow_query_ms():.0f} ms ({SLOW_QUERY_ENV}) are also logged."
+        )
+        rows = query_stats.snapshot()
+        if rows:
+            st.dataframe(rows, width="stretch", height=400)
+        else:
+            st.write("No statements recorded yet.")
+        if st.button("Reset statistics", key="reset_query_stats"):
+            query_stats.reset()
+            st.rerun()
+
+        from src.services import render_profiler
+
+        st.divider()
+        st.subheader("Render Profiling")
+        enabled = st.toggle(
+            "Profile page reruns (all sessions)",
+            value=render_profiler.is_enabled(),
+            help=f"Also enabled at startup by {render_profiler.PROFILE_ENV}=1. Adds a sampler thread to every rerun.",
+        )
+        if enabled != render_profiler.is_enabled():
+            render_profiler.set_enabled(enabled)
+
+        profiles = render_profiler.recent_profiles()
+        if profiles:
+            st.dataframe(
+                [
+                    {
+                        "time": time.strftime("%H:%M:%S", time.localtime(p.started)),
+                        "page": p.page,
+                        "wall_ms": round(p.wall_ms, 1),
+                        "cpu_ms": round(p.cpu_ms, 1),
+                        "db_ms": round(p.db_ms, 1),
+                        "queries": p.queries,
+                        **{
+                            f"{area} %": round(100 * p.areas[area] / p.samples) if p.samples else 0
+                            for area in render_profiler.AREAS
+                        },
+                    }
+                    for p in profiles
+                ],
+                width="stretch",
+            )
+            pages = sorted({p.page for p in profiles})
+            selected = st.selectbox("Flame summary for", ["All pages", *pages], key="profile_page")
+            chosen = [p for p in profiles if selected == "All pages" or p.page == selected]
+            flame = render_profiler.flame_summary(chosen)
+            if flame:
+                st.code(
+                    "\n".join(
+                        f"{share:6.1%} {count:6d}  {'  ' * depth}{label}" for depth, label, count, share in flame
+                    ),
+                    language=None,
+                )
+                st.download_button(
+                    "Download collapsed stacks",
+                    render_profiler.collapsed_stacks(chosen),
+                    file_name="snea-reruns.folded",
+                    help="Folded stack format for flamegraph.pl or speedscope.",
+                )
+            else:
+                st.write("No samples: the selected reruns finished within one sampling interval.")
+            if st.button("Clear profiles", key="clear_render_profiles"):
+                render_profiler.clear_profiles()
+                st.rerun()
+        elif enabled:
+            st.write("No reruns profiled yet. Use the app, then come back here.")
+
 
 if __name__ == "__main__":
     system_status()
@@ -14,6 +14,7 @@ def upload_mdf():
     )
     from src.logging_config import get_logger
     from src.services.identity_service import IdentityService
+    from src.services.upload_parse_cache import parse_cache
     from src.services.upload_service import UploadService
 
     logger = get_logger("snea.upload_mdf")
@@ -53,7 +54,8 @@ def upload_mdf():
         )
 
         # Persistence: If a file is uploaded, store it. If not, check if we have one in state.
-        if uploaded_file is not None:
+        # Only decode when the upload itself changed, not on every rerun.
+        if uploaded_file is not None and uploaded_file.file_id != st.session_state.get("pending_upload_file_id"):
             st.session_state["pending_upload_content"] = uploaded_file.getvalue().decode("utf-8")
             st.session_state["pending_upload_name"] = uploaded_file.name
             st.session_state["pending_upload_file_id"] = uploaded_file.file_id
@@ -299,25 +301,38 @@ def upload_mdf():
     has_pending_batches = bool(batches)
 
     if active_content:
+        # Parsed once per distinct file content and reused across reruns.
+        # Cached entries are shared between sessions and must not be mutated.
+        parsed = parse_cache.get_or_parse(active_content, UploadService.parse_upload)
+        PREVIEW_PAGE_LINES = 200
+
         with st.expander("Raw file preview", expanded=False):
-            st.code(active_content, language=None)
+            # Render one page of lines at a time instead of the whole file
+            page = 0
+            page_count = max(1, -(-parsed.line_count // PREVIEW_PAGE_LINES))
+            if page_count > 1:
+                page = (
+                    st.number_input(
+                        f"Page (of {page_count}, {PREVIEW_PAGE_LINES} lines each)",
+                        min_value=1,
+                        max_value=page_count,
+                        value=1,
+                        step=1,
+                        key="upload_preview_page",
+                    )
+                    - 1
+                )
+            st.code(parsed.preview_page(active_content, page, PREVIEW_PAGE_LINES), language=None)
 
         # C-5: Parse and display upload summary
         try:
-            entries = UploadService.parse_upload(active_content)
+            if parsed.error is not None:
+                raise ValueError(parsed.error)
+            entries = parsed.entries
             st.success(f"**{len(entries)}** entries found in `{active_name}`.")
 
             # Build summary table
-            rows = []
-            for e in entries:
-                rows.append(
-                    {
-                        "lx": e.get("lx", ""),
-                        "ps": e.get("ps", ""),
-                        "ge": e.get("ge", ""),
-                    }
-                )
-            st.dataframe(rows, width="stretch", height=300)
+            st.dataframe(parsed.summary_rows, width="stretch", height=300)
 
             # Store parsed data in session state for later phases
             st.session_state["upload_entries"] = entries
@@ -464,9 +479,10 @@ def _render_review_table(batch_id, session_deps):
     from src.database.connection import get_session
     from src.database.models.core import Record, Source
     from src.database.models.workflow import MatchupQueue
-    from src.frontend.ui_utils import compute_mdf_line_diffs, handle_ui_error, render_mdf_block
+    from src.frontend.ui_utils import compute_mdf_line_diffs, handle_ui_error, inject_mdf_styles, render_mdf_block
     from src.logging_config import get_logger
     from src.services.preference_service import PreferenceService
+    from src.services.review_page_loader import load_review_page_context
     from src.services.upload_service import UploadService
 
     logger = get_logger("snea.upload_mdf.review")
@@ -487,40 +503,43 @@ def _render_review_table(batch_id, session_deps):
 
     # ── Sidebar Controls ───────────────────────────────────────────
     with st.sidebar:
-        # Locked Conflict Global Warning
-        with get_session() as session:
-            locked_conflict_count = (
-                session.query(MatchupQueue).filter_by(batch_id=batch_id, status="locked_conflict").count()
-            )
-            if locked_conflict_count > 0:
-                st.error(f"⚠️ {locked_conflict_count} locked conflicts detected!")
-                if st.button(
-                    "Discard All Locked Conflicts",
-                    use_container_width=True,
-                    help="Remove all entries that conflict with locked records",
-                    disabled=review_bulk_in_progress,
-                ):
-                    discarded = UploadService.discard_locked_conflicts(batch_id)
-                    st.success(f"Discarded {discarded} entries.")
-                    st.rerun()
+        # Locked Conflict Global Warning (count cached until statuses change)
+        review_cache = _review_batch_cache(batch_id)
+        if review_cache["locked_conflict_count"] is None:
+            with get_session() as session:
+                review_cache["locked_conflict_count"] = (
+                    session.query(MatchupQueue).filter_by(batch_id=batch_id, status="locked_conflict").count()
+                )
+        locked_conflict_count = review_cache["locked_conflict_count"]
+        if locked_conflict_count > 0:
+            st.error(f"⚠️ {locked_conflict_count} locked conflicts detected!")
+            if st.button(
+                "Discard All Locked Conflicts",
+                use_container_width=True,
+                help="Remove all entries that conflict with locked records",
+                disabled=review_bulk_in_progress,
+            ):
+                discarded = UploadService.discard_locked_conflicts(batch_id)
+                _invalidate_review_cache()
+                st.success(f"Discarded {discarded} entries.")
+                st.rerun()
 
-                fragment = UploadService.download_locked_conflicts(batch_id)
-                if fragment:
-                    st.download_button(
-                        label="Download Locked Conflicts",
-                        data=fragment,
-                        file_name=f"locked_conflicts_{batch_id[:8]}.mdf",
-                        mime="text/plain",
-                        use_container_width=True,
-                        help="Download conflicting records as an MDF fragment for manual review",
-                        disabled=review_bulk_in_progress,
-                    )
-                st.divider()
+            # The fragment is built only when the button is clicked
+            st.download_button(
+                label="Download Locked Conflicts",
+                data=lambda: UploadService.download_locked_conflicts(batch_id) or "",
+                file_name=f"locked_conflicts_{batch_id[:8]}.mdf",
+                mime="text/plain",
+                use_container_width=True,
+                help="Download conflicting records as an MDF fragment for manual review",
+                disabled=review_bulk_in_progress,
+            )
+            st.divider()
 
         # ── Page Size ─────────────────────────────────────────────────
         page_size_options = [1, 5, 10, 25, 50]
         if "review_page_size" not in st.session_state:
-            saved_pref = PreferenceService.get_preference(
+            saved_pref = PreferenceService.get_cached_preference(
                 user_email,
                 "upload_review",
                 "page_size",
@@ -540,7 +559,7 @@ def _render_review_table(batch_id, session_deps):
         )
         if new_page_size != page_size:
             st.session_state["review_page_size"] = new_page_size
-            PreferenceService.set_preference(user_email, "upload_review", "page_size", str(new_page_size))
+            PreferenceService.set_preference_deferred(user_email, "upload_review", "page_size", str(new_page_size))
             st.rerun()
 
         # ── Status Filter ──────────────────────────────────────────────
@@ -617,12 +636,14 @@ def _render_review_table(batch_id, session_deps):
             existing_record_count = session.query(Record).filter_by(source_id=source_id, is_deleted=False).count()
         is_new_source = existing_record_count == 0
 
-        # Pre-fetch suggested records for comparison view
-        suggested_ids = [r.suggested_record_id for r in rows if r.suggested_record_id]
-        suggested_records = {}
-        if suggested_ids:
-            recs = session.query(Record).filter(Record.id.in_(suggested_ids)).all()
-            suggested_records = {r.id: r for r in recs}
+        # Suggested records, cross-source info and record-id conflicts for the
+        # whole page, reused across reruns until a row on the page changes
+        page_key = tuple((r.id, r.status, r.suggested_record_id, r.match_type) for r in rows)
+        page_context = review_cache["pages"].get(page_key)
+        if page_context is None:
+            page_context = load_review_page_context(session, rows, source_id)
+            review_cache["pages"] = {page_key: page_context}
+        suggested_records = page_context.suggested_records
 
         # Get source name for cross-source info
         source_name = "Unknown"
@@ -789,6 +810,7 @@ def _render_review_table(batch_id, session_deps):
             st.session_state.pop("review_bulk_in_progress", None)
             st.session_state.pop("review_bulk_label", None)
             st.session_state.pop("review_bulk_action", None)
+            _invalidate_review_cache()
         import time as _time
 
         _time.sleep(0.5)
@@ -798,25 +820,34 @@ def _render_review_table(batch_id, session_deps):
     # D-1: Render each entry (paginated)
     # Note: page_rows already contains only the current page due to SQL LIMIT/OFFSET
     page_rows = rows
+    # Page-level styles are emitted once, not once per entry
+    inject_mdf_styles()
+    # D-1b: column padding for the side-by-side comparisons
+    st.html(
+        """
+        <style>
+        /* Target only columns inside the bordered container to avoid affecting sidebar or headers */
+        [data-testid="stElementContainer"] [data-testid="stVerticalBlockBorderWrapper"] [data-testid="column"] {
+            padding-left: 0rem !important;
+            padding-right: 0rem !important;
+        }
+        /* Add back spacing between columns EXCEPT the first one in any row */
+        [data-testid="stElementContainer"] [data-testid="stVerticalBlockBorderWrapper"] [data-testid="column"] + [data-testid="column"] {
+            padding-left: 1rem !important;
+        }
+        </style>
+        """
+    )
     for row in page_rows:
         # Compute default status based on D-1 logic
         # Re-run suggest_matches data from the DB row itself
         has_suggestion = row.suggested_record_id is not None
         match_type = row.match_type or ""
 
-        # Cross-source info would require re-querying; use stored match_type
-        # record_id_conflict is detected by checking if suggested_record belongs to different source
-        record_id_conflict = False
-        conflict_sources = []
-
-        # Parse record_id from mdf_data for conflict check
-        uploaded_record_id = None
-        for line in row.mdf_data.split("\n"):
-            stripped = line.lstrip()
-            if stripped.startswith("\\nt Record:"):
-                val = stripped[len("\\nt Record:") :].strip()
-                if val.isdigit():
-                    uploaded_record_id = int(val)
+        # Record-id conflict: the uploaded \\nt Record: id belongs to another source
+        uploaded_record_id = page_context.uploaded_record_ids.get(row.id)
+        conflict_sources = page_context.record_id_conflicts.get(row.id, [])
+        record_id_conflict = bool(conflict_sources)
 
         # Determine default status
         if row.status not in ("pending",):
@@ -933,6 +964,7 @@ def _render_review_table(batch_id, session_deps):
                             session_id=session_id,
                             override_status=selected_status,
                         )
+                        _invalidate_review_cache()
                         # Populate search entries (skip for discards)
                         if result.get("record_id"):
                             UploadService.populate_search_entries([result["record_id"]])
@@ -944,7 +976,7 @@ def _render_review_table(batch_id, session_deps):
                         handle_ui_error(e, "Failed to apply entry.", logger_name="snea.upload_mdf.review")
 
             # Dynamic cross-source informational note
-            cross_sources = UploadService.get_cross_source_info(row.lx, source_id)
+            cross_sources = page_context.cross_sources.get(row.id, [])
             if cross_sources:
                 st.caption(f"Also in: {', '.join(cross_sources)}")
 
@@ -995,21 +1027,6 @@ def _render_review_table(batch_id, session_deps):
                         st.info("No matching records found.")
 
             # D-1b: Full-width side-by-side comparison (always visible)
-            st.html(
-                """
-                <style>
-                /* Target only columns inside the bordered container to avoid affecting sidebar or headers */
-                [data-testid="stElementContainer"] [data-testid="stVerticalBlockBorderWrapper"] [data-testid="column"] {
-                    padding-left: 0rem !important;
-                    padding-right: 0rem !important;
-                }
-                /* Add back spacing between columns EXCEPT the first one in any row */
-                [data-testid="stElementContainer"] [data-testid="stVerticalBlockBorderWrapper"] [data-testid="column"] + [data-testid="column"] {
-                    padding-left: 1rem !important;
-                }
-                </style>
-                """
-            )
             # Compute line-level diffs when an existing record is available
             existing_diags = None
             new_diags = None
@@ -1097,6 +1114,27 @@ def _render_review_table(batch_id, session_deps):
                     st.rerun()
 
 
+_REVIEW_CACHE_KEY = "review_page_cache"
+
+
+def _review_batch_cache(batch_id):
+    """Return the session's review cache for batch_id, resetting it when the batch changes."""
+    import streamlit as st
+
+    cache = st.session_state.get(_REVIEW_CACHE_KEY)
+    if not cache or cache.get("batch_id") != batch_id:
+        cache = {"batch_id": batch_id, "locked_conflict_count": None, "pages": {}}
+        st.session_state[_REVIEW_CACHE_KEY] = cache
+    return cache
+
+
+def _invalidate_review_cache():
+    """Drop cached review data after queue statuses change."""
+    import streamlit as st
+
+    st.session_state.pop(_REVIEW_CACHE_KEY, None)
+
+
 def _set_queue_status(queue_id, status):
     """Directly set a matchup_queue row's status."""
     from src.database.connection import get_session
@@ -5,6 +5,7 @@ UI utilities for Streamlit components.
 """
 
 import time
+from functools import lru_cache
 
 import streamlit as st
 import streamlit.components.v1 as components
@@ -148,6 +149,9 @@ def ensure_db_alive():
 
 # ── MDF Display Utilities ──────────────────────────────────────────────
 
+# Rendered records kept across reruns and sessions (least recently used evicted)
+_MDF_RENDER_CACHE_SIZE = 1024
+
 
 def _arrow_svg(color: str) -> str:
     """Return a percent-encoded SVG arrow glyph for use in CSS url()."""
@@ -160,50 +164,10 @@ def _arrow_svg(color: str) -> str:
     return quote(svg, safe="")
 
 
-def render_mdf_block(mdf_text: str, key: str = "", diagnostics: list[dict] | None = None) -> None:
-    """Render MDF data in a soft-wrapped <pre> block with structural highlighting.
-
-    Lines that wrap display a continuation marker (↩) via a hanging indent.
-    If 'diagnostics' is provided, lines are highlighted based on their status
-    (error, warning, ok).
-    """
-    import html as _html
-
-    from src.mdf.parser import format_mdf_record
-
-    mdf_text = format_mdf_record(mdf_text)
-    lines = mdf_text.split("\n")
-
-    line_html_parts = []
-    for i, line in enumerate(lines):
-        diag = diagnostics[i] if diagnostics and i < len(diagnostics) else {"status": "ok"}
-        status_cls = f"status-{diag['status']}"
-        msg = diag.get("message", "")
-
-        # Build inner HTML: use span-level markup when intra-line spans are available
-        spans = diag.get("spans")
-        if spans:
-            inner_html = (
-                "".join(
-                    f'<mark class="diff-token">{_html.escape(s["text"])}</mark>'
-                    if s["changed"]
-                    else _html.escape(s["text"])
-                    for s in spans
-                )
-                or "&nbsp;"
-            )
-        else:
-            inner_html = _html.escape(line) if line else "&nbsp;"
-
-        # Build line with optional tooltip/highlight
-        title_attr = f'title="{_html.escape(msg)}"' if msg else ""
-        line_html_parts.append(f'<div class="mdf-line {status_cls}" {title_attr}>{inner_html}</div>')
-
-    line_divs = "".join(line_html_parts)
-    # st.html() renders inside an iframe that does NOT inherit Streamlit's
-    # CSS custom properties.  We must read the theme colours from the parent
-    # frame via JavaScript and apply them to the block.
-    st.html(f"""
+@lru_cache(maxsize=1)
+def _mdf_block_css() -> str:
+    """Stylesheet shared by every MDF block on a page (see inject_mdf_styles)."""
+    return f"""
         <style>
         .mdf-wrap-block {{
             border: 1px solid #ccc;
@@ -271,27 +235,89 @@ def render_mdf_block(mdf_text: str, key: str = "", diagnostics: list[dict] | Non
             .mdf-line {{ background-image: url("data:image/svg+xml,{_arrow_svg("#e8943a")}"); }}
         }}
         </style>
-        <div class="mdf-wrap-block" id="mdf-block">{line_divs}</div>
-        <script>
-        (function() {{
-            // Try to read actual Streamlit theme colors from parent frame
-            var el = document.getElementById('mdf-block');
-            try {{
-                var parentEl = window.parent.document.querySelector('[data-testid="stAppViewContainer"]');
-                if (parentEl) {{
-                    var cs = window.parent.getComputedStyle(parentEl);
-                    var bg = cs.backgroundColor;
-                    var fg = cs.color;
-                    if (bg && fg) {{
-                        el.style.color = fg;
-                        el.style.backgroundColor = bg;
-                        el.style.borderColor = fg;
-                    }}
-                }}
-            }} catch(e) {{}}
-        }})();
-        </script>
-    """)
+    """
+
+
+def inject_mdf_styles() -> None:
+    """Emit the shared MDF block stylesheet once for the current page run.
+
+    Call before rendering MDF blocks. st.html() is not iframed, so one style
+    element applies to every block; a style-only body goes to the event
+    container and takes no layout space.
+    """
+    st.html(_mdf_block_css())
+
+
+def _mdf_block_html(mdf_text: str, diagnostics: list[dict] | None) -> str:
+    """Build the HTML fragment for an already formatted MDF record."""
+    import html as _html
+
+    lines = mdf_text.split("\n")
+
+    line_html_parts = []
+    for i, line in enumerate(lines):
+        diag = diagnostics[i] if diagnostics and i < len(diagnostics) else {"status": "ok"}
+        status_cls = f"status-{diag['status']}"
+        msg = diag.get("message", "")
+
+        # Build inner HTML: use span-level markup when intra-line spans are available
+        spans = diag.get("spans")
+        if spans:
+            inner_html = (
+                "".join(
+                    f'<mark class="diff-token">{_html.escape(s["text"])}</mark>'
+                    if s["changed"]
+                    else _html.escape(s["text"])
+                    for s in spans
+                )
+                or "&nbsp;"
+            )
+        else:
+            inner_html = _html.escape(line) if line else "&nbsp;"
+
+        # Build line with optional tooltip/highlight
+        title_attr = f'title="{_html.escape(msg)}"' if msg else ""
+        line_html_parts.append(f'<div class="mdf-line {status_cls}" {title_attr}>{inner_html}</div>')
+
+    return f'<div class="mdf-wrap-block">{"".join(line_html_parts)}</div>'
+
+
+@lru_cache(maxsize=_MDF_RENDER_CACHE_SIZE)
+def format_mdf_for_display(mdf_text: str) -> str:
+    """format_mdf_record() memoized by content for display paths."""
+    from src.mdf.parser import format_mdf_record
+
+    return format_mdf_record(mdf_text)
+
+
+@lru_cache(maxsize=_MDF_RENDER_CACHE_SIZE)
+def _mdf_record_html(mdf_text: str, structural_highlighting: bool) -> str:
+    """Finished HTML for a stored record, keyed by content and highlighting mode."""
+    from src.mdf.validator import MDFValidator
+
+    formatted = format_mdf_for_display(mdf_text)
+    diagnostics = MDFValidator.diagnose_record(formatted.split("\n")) if structural_highlighting else None
+    return _mdf_block_html(formatted, diagnostics)
+
+
+def render_mdf_record(mdf_text: str, structural_highlighting: bool, key: str = "") -> None:
+    """Render a stored MDF record, optionally with structural diagnostics.
+
+    Formatting, diagnosis and HTML generation are memoized by record content,
+    so unchanged records cost a cache lookup on later reruns. Requires
+    inject_mdf_styles() earlier in the page run.
+    """
+    st.html(_mdf_record_html(mdf_text, structural_highlighting))
+
+
+def render_mdf_block(mdf_text: str, key: str = "", diagnostics: list[dict] | None = None) -> None:
+    """Render MDF data in a soft-wrapped <pre> block with structural highlighting.
+
+    Lines that wrap display a continuation marker (↩) via a hanging indent.
+    If 'diagnostics' is provided, lines are highlighted based on their status
+    (error, warning, ok). Requires inject_mdf_styles() earlier in the page run.
+    """
+    st.html(_mdf_block_html(format_mdf_for_display(mdf_text), diagnostics))
 
 
 def _is_diff_ignored_line(line: str) -> bool:
@@ -4,6 +4,10 @@ import re
 
 from .tag_loader import get_valid_tags
 
+# Bump whenever parse_mdf() output changes for the same input. Stored
+# records.parsed values stamped with an older version are re-derived on read.
+PARSER_VERSION = 1
+
 
 def _extract_tag(line, tag):
     """If line starts with \\tag (optionally indented), return the value after it, else None."""
@@ -221,6 +225,25 @@ def parse_mdf(content):
     return parsed_records
 
 
+def parse_record(mdf_text) -> dict | None:
+    """
+    Parses a single stored record into the structure persisted in records.parsed.
+    Returns the first parse_mdf() entry without its raw mdf_data, or None when
+    the text is empty or rejected by parse_mdf().
+    """
+    if not isinstance(mdf_text, str):
+        return None
+    try:
+        parsed = parse_mdf(mdf_text)
+    except ValueError:
+        return None
+    if not parsed:
+        return None
+    entry = dict(parsed[0])
+    entry.pop("mdf_data", None)
+    return entry
+
+
 def format_mdf_record(mdf_text: str) -> str:
     """
     Normalize formatting of an MDF record for storage:
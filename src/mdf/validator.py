@@ -14,6 +14,8 @@ class MDFValidator:
     See: docs/mdf/original/MDFields19a_UTF8.txt (Order_of_Fields)
     """
 
+    _TAG_PATTERN = re.compile(r"^\s*\\([a-z0-9]+)")
+
     REQUIRED_HIERARCHY = [
         "lx",  # lexical entry — always first
         "hm",  # homonym number
@@ -85,7 +87,6 @@ class MDFValidator:
         """
         diagnostics = []
         found_req_tags = []
-        tag_pattern = re.compile(r"^\s*\\([a-z0-9]+)")
         valid_tags = get_valid_tags()
 
         # 1. First pass: Identify tags and check basic formatting
@@ -95,7 +96,7 @@ class MDFValidator:
                 diagnostics.append({"status": "ok", "message": ""})
                 continue
 
-            match = tag_pattern.match(line_content)
+            match = MDFValidator._TAG_PATTERN.match(line_content)
             if not match:
                 diagnostics.append(
                     {
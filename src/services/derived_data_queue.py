@@ -0,0 +1,178 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Background maintenance of data derived from records.mdf_data.
+
+Statement-level triggers on records enqueue a record into dirty_records
+whenever it is inserted or its mdf_data changes, so every write path -- ORM,
+raw SQL or another process -- is covered by the same transaction that made
+the edit.
+The indexer drains the queue in batches and rebuilds, from the persisted
+parse, the headword columns (lx, hm, ps, ge, sort_lx), record_languages and
+the search tables.
+
+Claiming a batch locks the queued records themselves with FOR UPDATE SKIP
+LOCKED and only then deletes their queue rows, inside the rebuild
+transaction. Locks are taken in the same order as an edit (records row, then
+the trigger's queue row), so the indexer never deadlocks with a writer:
+records being edited are skipped and picked up by a later batch, concurrent
+drainers never pick the same record, a failed rebuild rolls the rows back
+into the queue, and an edit waiting on a record being rebuilt re-enqueues it
+once the rebuild commits.
+
+Upload paths still rebuild their records synchronously; the queued rebuild
+that follows is idempotent.
+"""
+
+import threading
+
+from sqlalchemy import bindparam, text, update
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.database.connection import get_session
+from src.database.models.core import Record
+from src.logging_config import get_logger
+from src.services.parsed_record import parsed_entry
+
+logger = get_logger("snea.derived_data")
+
+# Records rebuilt per transaction
+DERIVED_DATA_BATCH = 200
+
+# Idle re-check of the queue; writers in this process wake the indexer directly
+SWEEP_INTERVAL = 60.0
+
+# Record locks first, queue rows second: the order an edit and its trigger take them
+_CLAIM_SQL = text("""
+    WITH candidates AS MATERIALIZED (
+        SELECT record_id FROM dirty_records
+        ORDER BY enqueued_at
+        LIMIT :limit
+    ), locked AS MATERIALIZED (
+        SELECT id FROM records
+        WHERE id IN (SELECT record_id FROM candidates)
+        ORDER BY id
+        FOR UPDATE SKIP LOCKED
+    )
+    DELETE FROM dirty_records
+    WHERE record_id IN (SELECT id FROM locked)
+    RETURNING record_id
+""")
+
+_records = Record.__table__
+
+# Headword columns are derived data: refreshing them must not bump the
+# optimistic-lock version, touch updated_at or re-fire the queue trigger.
+_refresh_headword = (
+    update(_records)
+    .where(_records.c.id == bindparam("_id"))
+    .values(
+        lx=bindparam("_lx"),
+        hm=bindparam("_hm"),
+        ps=bindparam("_ps"),
+        ge=bindparam("_ge"),
+        sort_lx=bindparam("_sort_lx"),
+        updated_at=_records.c.updated_at,
+    )
+)
+
+
+def claim_dirty_records(session, limit: int = DERIVED_DATA_BATCH) -> list[int]:
+    """Remove up to ``limit`` of the oldest queued record ids and return them.
+
+    The claimed records stay row-locked, and the removal is only final, until
+    the caller's transaction ends. Records another transaction holds locked
+    are left queued.
+    """
+    return [rid for (rid,) in session.execute(_CLAIM_SQL, {"limit": limit})]
+
+
+def rebuild_derived_data(session, record_ids: list[int]) -> int:
+    """Rebuild headword columns, languages and search entries for ``record_ids``.
+
+    Returns the number of records rebuilt. Changes are left in the session
+    for the caller to commit.
+    """
+    from src.services.linguistic_service import LinguisticService
+    from src.services.upload_service import UploadService
+
+    records = session.query(Record).filter(Record.id.in_(record_ids)).all()
+    changed = []
+    for record in records:
+        entry = parsed_entry(record) or {}
+        lx = entry.get("lx") or record.lx
+        derived = {
+            "lx": lx,
+            "hm": entry.get("hm", 1),
+            "ps": entry.get("ps", ""),
+            "ge": entry.get("ge", ""),
+            "sort_lx": LinguisticService.generate_sort_lx(lx),
+        }
+        if any(getattr(record, key) != value for key, value in derived.items()):
+            changed.append({"_id": record.id, **{f"_{key}": value for key, value in derived.items()}})
+            for key, value in derived.items():
+                set_committed_value(record, key, value)
+        UploadService._update_record_languages(session, record, entry.get("lg", []))
+    if changed:
+        session.execute(_refresh_headword, changed)
+    UploadService.populate_search_entries([r.id for r in records], session=session)
+    return len(records)
+
+
+def drain_once(batch_size: int = DERIVED_DATA_BATCH) -> int:
+    """Claim and rebuild one batch in its own transaction. Returns the batch size."""
+    with get_session() as session:
+        try:
+            record_ids = claim_dirty_records(session, batch_size)
+            if record_ids:
+                rebuild_derived_data(session, record_ids)
+            session.commit()
+            return len(record_ids)
+        except Exception:
+            session.rollback()
+            raise
+
+
+class DerivedDataIndexer:
+    """Daemon thread that drains dirty_records until the queue is empty, then waits."""
+
+    def __init__(self, batch_size: int = DERIVED_DATA_BATCH, sweep_interval: float = SWEEP_INTERVAL):
+        self._batch_size = batch_size
+        self._sweep_interval = sweep_interval
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the worker thread once per process; later calls are no-ops."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="derived-data-indexer", daemon=True)
+            self._thread.start()
+
+    def notify(self) -> None:
+        """Wake the worker after a write has committed queue rows."""
+        self._wake.set()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                while not self._stop.is_set() and drain_once(self._batch_size) == self._batch_size:
+                    pass
+            except Exception as e:
+                logger.warning(f"Derived-data indexer batch failed: {e}")
+            self._wake.wait(self._sweep_interval)
+
+
+# Shared by every session in this Streamlit server process
+derived_data_indexer = DerivedDataIndexer()
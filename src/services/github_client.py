@@ -0,0 +1,119 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Pooled, concurrent GitHub API reads with conditional-request caching.
+
+All sessions in the server process share one requests.Session (keep-alive
+connections to api.github.com) and one small thread pool, so the identity
+calls made at login run side by side. JSON responses are cached per access
+token and URL with their ETag; later reads send If-None-Match, and a 304
+(which GitHub does not count against the rate limit) reuses the cached body.
+Reads given a TTL skip the request entirely while the cached body is
+younger than the TTL.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.logging_config import get_logger
+
+logger = get_logger("snea.github_client")
+
+REQUEST_TIMEOUT = 10
+_WORKERS = 8
+_CACHE_SIZE = 512
+
+
+@dataclass
+class _CachedResponse:
+    etag: str | None
+    body: Any
+    fetched_at: float
+
+
+class GitHubClient:
+    def __init__(self, workers: int = _WORKERS, cache_size: int = _CACHE_SIZE):
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=workers)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="snea-github")
+        self._cache: OrderedDict[tuple[str, str], _CachedResponse] = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(access_token: str, url: str) -> tuple[str, str]:
+        # Responses are per user; key by a digest rather than holding raw tokens
+        return hashlib.sha256(access_token.encode()).hexdigest(), url
+
+    def _cached(self, key: tuple[str, str]) -> _CachedResponse | None:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+            return entry
+
+    def _store(self, key: tuple[str, str], entry: _CachedResponse) -> None:
+        with self._lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def get_json(self, access_token: str, url: str, ttl: float = 0) -> Any:
+        """GET url as the token's user; raises requests.HTTPError on error statuses."""
+        key = self._key(access_token, url)
+        cached = self._cached(key)
+        now = time.monotonic()
+        if cached is not None and ttl and now - cached.fetched_at < ttl:
+            return cached.body
+
+        headers = {"Authorization": f"token {access_token}", "Accept": "application/vnd.github.v3+json"}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        response = self._session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached is not None:
+            logger.debug("GitHub %s not modified", url)
+            self._store(key, _CachedResponse(cached.etag, cached.body, now))
+            return cached.body
+        response.raise_for_status()
+
+        body = response.json()
+        etag = response.headers.get("ETag")
+        if etag or ttl:
+            self._store(key, _CachedResponse(etag, body, now))
+        return body
+
+    def get_many(self, access_token: str, requests_by_name: dict[str, tuple[str, float]]) -> dict[str, Any]:
+        """
+        Run get_json for every {name: (url, ttl)} concurrently.
+
+        Returns {name: body}; the first failure (in the given order) is raised
+        once all requests have finished.
+        """
+        futures = {
+            name: self._executor.submit(self.get_json, access_token, url, ttl)
+            for name, (url, ttl) in requests_by_name.items()
+        }
+        errors = [future.exception() for future in futures.values()]
+        for error in errors:
+            if error is not None:
+                raise error
+        return {name: future.result() for name, future in futures.items()}
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+# Shared by every session in this Streamlit server process
+github_client = GitHubClient()
@@ -4,10 +4,10 @@
 Identity Service for managing GitHub user identity and database synchronization.
 """
 
+import os
 from datetime import datetime
 from typing import Any
 
-import requests
 import streamlit as st
 from sqlalchemy.sql import func
 
@@ -16,9 +16,21 @@ from src.database.models.core import Source
 from src.database.models.identity import User
 from src.logging_config import get_logger
 from src.services.audit_service import AuditService
+from src.services.github_client import github_client
 
 logger = get_logger("snea.identity")
 
+TEAMS_TTL_ENV = "SNEA_GITHUB_TEAMS_TTL"
+DEFAULT_TEAMS_TTL = 300.0
+
+
+def _teams_ttl() -> float:
+    """Seconds a cached team list authorizes logins without asking GitHub again (0 = always revalidate)."""
+    try:
+        return max(0.0, float(os.getenv(TEAMS_TTL_ENV, DEFAULT_TEAMS_TTL)))
+    except ValueError:
+        return DEFAULT_TEAMS_TTL
+
 
 class IdentityService:
     """
@@ -40,33 +52,28 @@ class IdentityService:
         Returns True if successful and authorized, False otherwise.
         """
         logger.debug("Fetching GitHub user info")
-        headers = {"Authorization": f"token {access_token}", "Accept": "application/vnd.github.v3+json"}
         base_url = st.secrets["github_oauth"]["user_info_url"]
 
         try:
-            # Fetch user profile
-            user_response = requests.get(base_url, headers=headers, timeout=10)
-            user_response.raise_for_status()
-            user_info = user_response.json()
+            # The four reads run concurrently, so login waits for the slowest one
+            responses = github_client.get_many(
+                access_token,
+                {
+                    "user": (base_url, 0),
+                    "orgs": (f"{base_url}/orgs", 0),
+                    "teams": (f"{base_url}/teams", _teams_ttl()),
+                    "emails": (f"{base_url}/emails", 0),
+                },
+            )
+            user_info = responses["user"]
             st.session_state["user_info"] = user_info
 
             logger.info("Fetched GitHub user info for: %s", user_info.get("login"))
 
-            # Fetch organizations
-            orgs_response = requests.get(f"{base_url}/orgs", headers=headers, timeout=10)
-            orgs_response.raise_for_status()
-            st.session_state["user_orgs"] = orgs_response.json()
-
-            # Fetch teams
-            teams_response = requests.get(f"{base_url}/teams", headers=headers, timeout=10)
-            teams_response.raise_for_status()
-            user_teams = teams_response.json()
+            st.session_state["user_orgs"] = responses["orgs"]
+            user_teams = responses["teams"]
             st.session_state["user_teams"] = user_teams
-
-            # Fetch user emails to get the primary email
-            emails_response = requests.get(f"{base_url}/emails", headers=headers, timeout=10)
-            emails_response.raise_for_status()
-            emails = emails_response.json()
+            emails = responses["emails"]
 
             primary_email = None
             for email_record in emails:
@@ -4,21 +4,29 @@
 Linguistic Service for CRUD operations on Record, Source, and Language models.
 """
 
+import gzip
 import os
 import re
 import tempfile
-import unicodedata
+import zipfile
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any, Literal
 
 from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload, selectinload
 
 from src.database.connection import get_session
 from src.database.models.core import Language, Record, RecordLanguage, Source
 from src.database.models.identity import UserActivityLog
+from src.database.models.meta import SourceRecordCount
 from src.database.models.search import GlossSearchEntry, HeadwordSearchEntry, SearchEntry
-from src.database.models.workflow import EditHistory, MatchupQueue
+from src.database.models.workflow import MatchupQueue
 from src.logging_config import get_logger
+from src.services.history_store import compact_history_tail, history_entry, load_history_data
+from src.services.reference_cache import reference_cache, reference_data_version
+from src.services.sort_key import sort_key
 
 logger = get_logger("snea.linguistic_service")
 
@@ -84,6 +92,188 @@ _search_strategies: dict[str, callable] = {
 }
 
 
+def _source_dict(source: Source, count: int) -> dict[str, Any]:
+    return {
+        "id": source.id,
+        "name": source.name,
+        "short_name": source.short_name,
+        "description": source.description,
+        "record_count": count,
+    }
+
+
+def _query_sources_with_counts(session) -> list[dict[str, Any]]:
+    """Sources ordered by name with counts read from source_record_counts."""
+    query = (
+        session.query(
+            Source,
+            (func.coalesce(SourceRecordCount.record_count, 0) + func.coalesce(SourceRecordCount.queue_count, 0)).label(
+                "total_count"
+            ),
+        )
+        .outerjoin(SourceRecordCount, Source.id == SourceRecordCount.source_id)
+        .order_by(Source.name)
+    )
+    return [_source_dict(source, count) for source, count in query.all()]
+
+
+def _query_sources_with_grouped_counts(session) -> list[dict[str, Any]]:
+    """Sources ordered by name with counts from full GROUP BYs (pre-migration fallback)."""
+    # Subquery to count records per source
+    record_counts = (
+        session.query(Record.source_id, func.count(Record.id).label("record_count"))
+        .group_by(Record.source_id)
+        .subquery()
+    )
+
+    # Subquery to count matchup queue entries per source
+    matchup_counts = (
+        session.query(MatchupQueue.source_id, func.count(MatchupQueue.id).label("matchup_count"))
+        .group_by(MatchupQueue.source_id)
+        .subquery()
+    )
+
+    # Join sources with both counts and sum them
+    query = (
+        session.query(
+            Source,
+            (func.coalesce(record_counts.c.record_count, 0) + func.coalesce(matchup_counts.c.matchup_count, 0)).label(
+                "total_count"
+            ),
+        )
+        .outerjoin(record_counts, Source.id == record_counts.c.source_id)
+        .outerjoin(matchup_counts, Source.id == matchup_counts.c.source_id)
+        .order_by(Source.name)
+    )
+    return [_source_dict(source, count) for source, count in query.all()]
+
+
+def _query_languages(session) -> list[dict[str, Any]]:
+    from src.database.models.iso639 import ISO639_3
+
+    results = (
+        session.query(Language)
+        .join(ISO639_3, (Language.code == ISO639_3.id) & (Language.name == ISO639_3.ref_name))
+        .order_by(Language.name)
+        .all()
+    )
+    return [{"id": l.id, "name": l.name, "code": l.code} for l in results]
+
+
+def _record_detail(record: Record) -> dict[str, Any]:
+    """Full record dict as returned by get_record/get_records."""
+    return {
+        "id": record.id,
+        "lx": record.lx,
+        "hm": record.hm,
+        "ps": record.ps,
+        "ge": record.ge,
+        "source_id": record.source_id,
+        "source_name": record.source.name if record.source else None,
+        "source_page": record.source_page,
+        "status": record.status,
+        "is_locked": record.is_locked,
+        "locked_by": record.locked_by,
+        "locked_at": record.locked_at,
+        "lock_note": record.lock_note,
+        "mdf_data": record.mdf_data,
+        "languages": [{"id": lang.id, "code": lang.code, "name": lang.name} for lang in record.language],
+        "updated_at": record.updated_at,
+        "updated_by": record.updated_by,
+        "reviewed_at": record.reviewed_at,
+        "reviewed_by": record.reviewed_by,
+        "current_version": record.current_version,
+    }
+
+
+def _apply_export_filters(
+    query,
+    source_id: int | None = None,
+    search_term: str | None = None,
+    search_mode: str = "Lexeme",
+    record_ids: list[int] | None = None,
+):
+    """Apply the shared export filters (selection, source, search) to a Record query."""
+    query = query.filter(Record.is_deleted == False)
+    if record_ids is not None:
+        return query.filter(Record.id.in_(record_ids))
+    if source_id:
+        query = query.filter(Record.source_id == source_id)
+    if search_term:
+        strategy = _search_strategies.get(search_mode)
+        if strategy is None:
+            raise ValueError(f"Unknown search mode: {search_mode}")
+        query = strategy(query, search_term)
+    return query
+
+
+def _unique_entry_name(name: str, used: set[str]) -> str:
+    """Return ``name``, numbered before its extension if ``used`` already holds it."""
+    stem, ext = os.path.splitext(name)
+    candidate, n = name, 2
+    while candidate in used:
+        candidate, n = f"{stem}_{n}{ext}", n + 1
+    used.add(candidate)
+    return candidate
+
+
+# Rows fetched per round-trip when streaming exports
+_EXPORT_BATCH_SIZE = 1000
+
+ExportCompression = Literal["zip", "gzip"]
+
+# "cursor": named server-side cursor (stream_results) fetched in batches.
+# "copy": COPY (SELECT ...) TO STDOUT decoded straight into the output file.
+ExportEngine = Literal["cursor", "copy"]
+
+# PostgreSQL COPY text format escapes these characters on output.
+_COPY_TEXT_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v", "\\": "\\"}
+_COPY_ESCAPE_RE = re.compile(r"\\([bfnrtv\\])")
+
+
+def _unescape_copy_text(field: str) -> str:
+    """Decode one field of PostgreSQL COPY text-format output."""
+    return _COPY_ESCAPE_RE.sub(lambda m: _COPY_TEXT_ESCAPES[m.group(1)], field)
+
+
+class _CopyMdfSink:
+    """
+    Write-only file object handed to ``cursor.copy_expert``.
+    Each COPY row (a single mdf_data column) is decoded and written to
+    ``out`` as an MDF block, separated by blank lines.
+    """
+
+    def __init__(self, out):
+        self._out = out
+        self._pending = b""
+        self._first = True
+
+    def write(self, data: bytes | str) -> int:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        *rows, self._pending = (self._pending + data).split(b"\n")
+        for row in rows:
+            if not self._first:
+                self._out.write("\n\n")
+            self._out.write(_unescape_copy_text(row.decode("utf-8")))
+            self._first = False
+        return len(data)
+
+
+def _copy_mdf_to_file(session, query, out) -> None:
+    """
+    Stream the mdf_data column of an export query into ``out`` via COPY.
+    The query must label its columns mdf_data, source_id, sort_lx and hm;
+    ordering is applied on the outer SELECT so it survives the subquery.
+    """
+    compiled = query.statement.compile(dialect=session.get_bind().dialect)
+    dbapi_conn = session.connection().connection.dbapi_connection
+    with dbapi_conn.cursor() as cur:
+        inner_sql = cur.mogrify(str(compiled), compiled.params).decode("utf-8")
+        copy_sql = f"COPY (SELECT q.mdf_data FROM ({inner_sql}) AS q ORDER BY q.source_id, q.sort_lx, q.hm) TO STDOUT"
+        cur.copy_expert(copy_sql, _CopyMdfSink(out))
+
+
 @dataclass
 class RecordSearchResult:
     """
@@ -120,115 +310,47 @@ class LinguisticService:
               This pattern MUST be followed globally whenever sort keys are generated
               for this corpus — do not map ∞ to any other value.
             - ✔ (U+2714) is an annotation mark; stripped (→ "") for sort purposes.
-        4. Lowercase (case-insensitive).
+        4. Lowercase (case-insensitive), with final sigma (ς) folded to σ.
         5. Strip leading punctuation ([*-=([])]).
         """
-        if not lx:
-            return ""
-        # 1. NFD Normalization
-        nfd = unicodedata.normalize("NFD", lx)
-        # 2. Strip diacritics
-        stripped = "".join(c for c in nfd if not unicodedata.combining(c))
-        # 3. Straighten quotes
-        # Convert fancy quotes and various apostrophes to straight ones
-        quotes_map = {
-            "\u2018": "'",
-            "\u2019": "'",
-            "\u201a": "'",
-            "\u201b": "'",
-            "\u201c": '"',
-            "\u201d": '"',
-            "\u201e": '"',
-            "\u201f": '"',
-            "\u02bc": "'",
-            "\u02b9": "'",
-            "\u00b4": "'",
-        }
-        for fancy, straight in quotes_map.items():
-            stripped = stripped.replace(fancy, straight)
-        # 3b. Symbol substitution — treat linguistic symbols as letters
-        # ∞ (U+221E) is an Algonquian letter for a long rounded vowel; sorts after oo*/before op
-        # ✔ (U+2714) is an annotation mark; stripped for sort purposes
-        symbol_map = {
-            "\u221e": "oozzz",
-            "\u2714": "",
-        }
-        for symbol, replacement in symbol_map.items():
-            stripped = stripped.replace(symbol, replacement)
-        # 4. Lowercase
-        lowered = stripped.lower()
-        # 5. Strip leading punctuation and numerals
-        # Re-using common linguistic punctuation: *, -, =, [, ], (, )
-        # Also strip leading digits and any resulting whitespace
-        # Note: ONLY strip leading characters. Infix search handles non-leading digits.
-        result = re.sub(r"^[0-9*\-=\[\]\(\)\s]+", "", lowered)
-
-        # 6. For search, if we are normalizing a search term that is JUST numbers/punct,
-        # it will return empty. We return the lowered string if it's empty but original wasn't.
-        # This allows searching for things that are only "special" characters if needed,
-        # although search_records now has its own guard for this.
-        return result
+        # The rules live in src/services/sort_key.py, shared with the SQL port snea_sort_key()
+        return sort_key(lx)
 
     @staticmethod
     def get_sources_with_counts() -> list[dict[str, Any]]:
         """
         Retrieve all sources with their associated record counts (Records + MatchupQueue).
+
+        Served from the process-wide reference cache; the counts themselves come
+        from the trigger-maintained source_record_counts table.
         """
         with get_session() as session:
-            # Subquery to count records per source
-            record_counts = (
-                session.query(Record.source_id, func.count(Record.id).label("record_count"))
-                .group_by(Record.source_id)
-                .subquery()
-            )
-
-            # Subquery to count matchup queue entries per source
-            matchup_counts = (
-                session.query(MatchupQueue.source_id, func.count(MatchupQueue.id).label("matchup_count"))
-                .group_by(MatchupQueue.source_id)
-                .subquery()
-            )
+            try:
+                version = reference_data_version(session)
+            except SQLAlchemyError as e:
+                # Counts or change_counters not migrated yet: count live, uncached.
+                logger.warning(f"Reference data version unavailable, counting sources live: {e}")
+                session.rollback()
+                return _query_sources_with_grouped_counts(session)
 
-            # Join sources with both counts and sum them
-            query = (
-                session.query(
-                    Source,
-                    (
-                        func.coalesce(record_counts.c.record_count, 0)
-                        + func.coalesce(matchup_counts.c.matchup_count, 0)
-                    ).label("total_count"),
-                )
-                .outerjoin(record_counts, Source.id == record_counts.c.source_id)
-                .outerjoin(matchup_counts, Source.id == matchup_counts.c.source_id)
-                .order_by(Source.name)
+            sources = reference_cache.get_or_load(
+                "sources_with_counts", version, lambda: _query_sources_with_counts(session)
             )
-
-            results = []
-            for source, count in query.all():
-                results.append(
-                    {
-                        "id": source.id,
-                        "name": source.name,
-                        "short_name": source.short_name,
-                        "description": source.description,
-                        "record_count": count,
-                    }
-                )
-            return results
+        return [dict(s) for s in sources]
 
     @staticmethod
     def get_languages() -> list[dict[str, Any]]:
         """Retrieve languages whose code exists in ISO 639-3 and whose name matches the ISO ref_name."""
-        from src.database.models.iso639 import ISO639_3
-
         with get_session() as session:
-            results = (
-                session.query(Language)
-                .join(ISO639_3, (Language.code == ISO639_3.id) & (Language.name == ISO639_3.ref_name))
-                .order_by(Language.name)
-                .all()
-            )
-            return [{"id": l.id, "name": l.name, "code": l.code} for l in results]
+            try:
+                version = reference_data_version(session)
+            except SQLAlchemyError as e:
+                logger.warning(f"Reference data version unavailable, loading languages uncached: {e}")
+                session.rollback()
+                return _query_languages(session)
+
+            languages = reference_cache.get_or_load("languages", version, lambda: _query_languages(session))
+        return [dict(lang) for lang in languages]
 
     @staticmethod
     def update_source(source_id: int, **fields: Any) -> bool:
@@ -335,31 +457,31 @@ class LinguisticService:
             if not record:
                 return None
 
-            # Get languages
-            languages = [{"id": lang.id, "code": lang.code, "name": lang.name} for lang in record.language]
+            return _record_detail(record)
 
-            return {
-                "id": record.id,
-                "lx": record.lx,
-                "hm": record.hm,
-                "ps": record.ps,
-                "ge": record.ge,
-                "source_id": record.source_id,
-                "source_name": record.source.name if record.source else None,
-                "source_page": record.source_page,
-                "status": record.status,
-                "is_locked": record.is_locked,
-                "locked_by": record.locked_by,
-                "locked_at": record.locked_at,
-                "lock_note": record.lock_note,
-                "mdf_data": record.mdf_data,
-                "languages": languages,
-                "updated_at": record.updated_at,
-                "updated_by": record.updated_by,
-                "reviewed_at": record.reviewed_at,
-                "reviewed_by": record.reviewed_by,
-                "current_version": record.current_version,
-            }
+    @staticmethod
+    def get_records(record_ids: list[int]) -> list[dict[str, Any]]:
+        """
+        Retrieve many records by ID in the same shape as get_record.
+
+        Sources and languages are eager-loaded, so the whole batch costs a
+        fixed number of queries regardless of its size. Results follow the
+        order of record_ids; missing or deleted ids are skipped.
+        """
+        if not record_ids:
+            return []
+
+        with get_session() as session:
+            records = (
+                session.query(Record)
+                .options(joinedload(Record.source), selectinload(Record.language))
+                .filter(Record.id.in_(set(record_ids)))
+                .filter(Record.is_deleted == False)
+                .all()
+            )
+            by_id = {record.id: _record_detail(record) for record in records}
+
+        return [by_id[rid] for rid in record_ids if rid in by_id]
 
     @staticmethod
     def get_source(source_id: int) -> dict[str, Any] | None:
@@ -496,34 +618,19 @@ class LinguisticService:
         """
         with get_session() as session:
             # Column projection: explicitly select required fields, excluding embedding
-            query = (
-                session.query(
-                    Record.id,
-                    Record.lx,
-                    Record.hm,
-                    Record.ps,
-                    Record.ge,
-                    Record.status,
-                    Record.source_id,
-                    Record.sort_lx,
-                    Record.mdf_data,
-                    Source.name.label("source_name"),
-                )
-                .outerjoin(Source, Record.source_id == Source.id)
-                .filter(Record.is_deleted == False)
-            )
-
-            if record_ids is not None:
-                query = query.filter(Record.id.in_(record_ids))
-            else:
-                if source_id:
-                    query = query.filter(Record.source_id == source_id)
-
-                if search_term:
-                    strategy = _search_strategies.get(search_mode)
-                    if strategy is None:
-                        raise ValueError(f"Unknown search mode: {search_mode}")
-                    query = strategy(query, search_term)
+            query = session.query(
+                Record.id,
+                Record.lx,
+                Record.hm,
+                Record.ps,
+                Record.ge,
+                Record.status,
+                Record.source_id,
+                Record.sort_lx,
+                Record.mdf_data,
+                Source.name.label("source_name"),
+            ).outerjoin(Source, Record.source_id == Source.id)
+            query = _apply_export_filters(query, source_id, search_term, search_mode, record_ids)
 
             # Efficient Sorting: source_id, sort_lx (NFD/No-Punct), hm, ps, ge
             query = query.order_by(Record.source_id, Record.sort_lx, Record.hm)
@@ -554,38 +661,46 @@ class LinguisticService:
         search_term: str | None = None,
         search_mode: str = "Lexeme",
         record_ids: list[int] | None = None,
+        engine: ExportEngine = "cursor",
     ) -> str:
         """
         Stream all records matching criteria to a temporary file.
         Returns the path to the temporary file.
         The caller is responsible for deleting the file when finished.
+
+        engine="cursor" fetches through a named server-side cursor in batches
+        of _EXPORT_BATCH_SIZE; engine="copy" pipes COPY ... TO STDOUT output
+        directly into the file (psycopg2 only). Both produce identical output.
         """
+        if engine not in ("cursor", "copy"):
+            raise ValueError(f"Unknown export engine: {engine}")
+
         fd, path = tempfile.mkstemp(suffix=".txt", prefix="mdf_export_")
         try:
             with os.fdopen(fd, "w", encoding="utf-8") as tmp:
                 with get_session() as session:
                     # Column projection: we only need mdf_data and sorting columns for the export file
-                    query = session.query(Record.mdf_data, Record.source_id, Record.sort_lx, Record.hm).filter(
-                        Record.is_deleted == False
+                    query = session.query(
+                        Record.mdf_data.label("mdf_data"),
+                        Record.source_id.label("source_id"),
+                        Record.sort_lx.label("sort_lx"),
+                        Record.hm.label("hm"),
                     )
+                    query = _apply_export_filters(query, source_id, search_term, search_mode, record_ids)
 
-                    if record_ids is not None:
-                        query = query.filter(Record.id.in_(record_ids))
-                    else:
-                        if source_id:
-                            query = query.filter(Record.source_id == source_id)
-
-                        if search_term:
-                            strategy = _search_strategies.get(search_mode)
-                            if strategy is None:
-                                raise ValueError(f"Unknown search mode: {search_mode}")
-                            query = strategy(query, search_term)
+                    if engine == "copy":
+                        _copy_mdf_to_file(session, query, tmp)
+                        return path
 
                     query = query.order_by(Record.source_id, Record.sort_lx, Record.hm)
 
-                    # Stream results in batches of 1000
+                    # stream_results makes psycopg2 use a named server-side cursor, so only
+                    # _EXPORT_BATCH_SIZE rows are held client-side at a time.
+                    rows = query.execution_options(stream_results=True, max_row_buffer=_EXPORT_BATCH_SIZE).yield_per(
+                        _EXPORT_BATCH_SIZE
+                    )
                     first = True
-                    for mdf_data, _, _, _ in query.yield_per(1000):
+                    for mdf_data, _, _, _ in rows:
                         if not first:
                             tmp.write("\n\n")
                         tmp.write(mdf_data)
@@ -597,22 +712,122 @@ class LinguisticService:
             logger.error(f"Failed to stream records to temp file: {e}")
             raise
 
+    @staticmethod
+    def get_export_summary(
+        source_id: int | None = None,
+        search_term: str | None = None,
+        search_mode: str = "Lexeme",
+        record_ids: list[int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Count the records an export would contain, grouped by source.
+        Returns [{source_id, source_name, count}] ordered by source name,
+        without loading any mdf_data.
+        """
+        with get_session() as session:
+            matching_ids = _apply_export_filters(
+                session.query(Record.id), source_id, search_term, search_mode, record_ids
+            ).subquery()
+            rows = (
+                session.query(Record.source_id, Source.name, func.count(Record.id))
+                .outerjoin(Source, Record.source_id == Source.id)
+                .filter(Record.id.in_(session.query(matching_ids.c.id)))
+                .group_by(Record.source_id, Source.name)
+                .order_by(Source.name)
+                .all()
+            )
+            return [{"source_id": sid, "source_name": name, "count": count} for sid, name, count in rows]
+
+    @staticmethod
+    def stream_records_to_archive(
+        entry_name: Callable[[str], str],
+        source_id: int | None = None,
+        search_term: str | None = None,
+        search_mode: str = "Lexeme",
+        record_ids: list[int] | None = None,
+        compression: ExportCompression = "zip",
+        compresslevel: int = 6,
+    ) -> str:
+        """
+        Stream all records matching criteria into a compressed archive on disk.
+
+        - "zip": one MDF entry per source, named by ``entry_name(source_name)``
+          and numbered when two names collide. Entries are written record-by-record, so only one batch of rows is
+          held in memory regardless of corpus size.
+        - "gzip": a single gzip-compressed MDF stream of all matching records.
+
+        Returns the path to the temporary archive. The caller is responsible
+        for deleting the file when finished.
+        """
+        if compression not in ("zip", "gzip"):
+            raise ValueError(f"Unknown export compression: {compression}")
+
+        suffix = ".zip" if compression == "zip" else ".txt.gz"
+        fd, path = tempfile.mkstemp(suffix=suffix, prefix="mdf_export_")
+        os.close(fd)
+        try:
+            with get_session() as session:
+                query = session.query(Record.mdf_data, Source.name, Record.sort_lx, Record.hm).outerjoin(
+                    Source, Record.source_id == Source.id
+                )
+                query = _apply_export_filters(query, source_id, search_term, search_mode, record_ids)
+                query = query.order_by(Source.name, Record.sort_lx, Record.hm)
+                rows = query.execution_options(stream_results=True, max_row_buffer=_EXPORT_BATCH_SIZE).yield_per(
+                    _EXPORT_BATCH_SIZE
+                )
+
+                if compression == "gzip":
+                    with gzip.open(path, "wt", encoding="utf-8", compresslevel=compresslevel) as out:
+                        first = True
+                        for mdf_data, _, _, _ in rows:
+                            if not first:
+                                out.write("\n\n")
+                            out.write(mdf_data)
+                            first = False
+                    return path
+
+                with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zf:
+                    current_source = None
+                    entry = None
+                    used_names: set[str] = set()
+                    try:
+                        for mdf_data, source_name, _, _ in rows:
+                            source_name = source_name or "results"
+                            if source_name != current_source:
+                                if entry is not None:
+                                    entry.close()
+                                name = _unique_entry_name(entry_name(source_name), used_names)
+                                entry = zf.open(name, "w", force_zip64=True)
+                                current_source = source_name
+                            else:
+                                entry.write(b"\n\n")
+                            entry.write(mdf_data.encode("utf-8"))
+                    finally:
+                        if entry is not None:
+                            entry.close()
+            return path
+        except Exception as e:
+            if os.path.exists(path):
+                os.remove(path)
+            logger.error(f"Failed to stream records to archive: {e}")
+            raise
+
     @staticmethod
     def bundle_records_to_mdf(records: list[dict[str, Any]]) -> str:
         """
         Bundle a list of records into a single MDF text blob.
         Each record is separated by double blank lines.
         """
-        # Ensure we have mdf_data and handle potential missing keys
+        # Fallback to fetch records whose mdf_data is missing, though usually provided
+        missing_ids = [r["id"] for r in records if "mdf_data" not in r and "id" in r]
+        fetched = {r["id"]: r["mdf_data"] for r in LinguisticService.get_records(missing_ids)}
+
         mdf_blocks = []
         for r in records:
             if "mdf_data" in r:
                 mdf_blocks.append(r["mdf_data"])
-            elif "id" in r:
-                # Fallback to fetch if data is missing, though usually provided
-                full_record = LinguisticService.get_record(r["id"])
-                if full_record:
-                    mdf_blocks.append(full_record["mdf_data"])
+            elif r.get("id") in fetched:
+                mdf_blocks.append(fetched[r["id"]])
 
         return "\n\n".join(mdf_blocks)
 
@@ -680,7 +895,8 @@ class LinguisticService:
 
             try:
                 # Create history entry
-                history = EditHistory(
+                compact_history_tail(session, [record.id])
+                history = history_entry(
                     record_id=record.id,
                     user_email=user_email,
                     session_id=session_id,
@@ -697,6 +913,11 @@ class LinguisticService:
 
                 session.commit()
                 logger.info(f"Updated record {record_id} by {user_email}")
+
+                # The commit queued the record; rebuild its search data in the background
+                from src.services.derived_data_queue import derived_data_indexer
+
+                derived_data_indexer.notify()
                 return True
             except Exception as e:
                 session.rollback()
@@ -721,7 +942,8 @@ class LinguisticService:
 
             try:
                 # Audit: EditHistory snapshot
-                history = EditHistory(
+                compact_history_tail(session, [record.id])
+                history = history_entry(
                     record_id=record.id,
                     user_email=user_email,
                     version=record.current_version + 1,
@@ -768,7 +990,8 @@ class LinguisticService:
 
             try:
                 # Audit: EditHistory snapshot
-                history = EditHistory(
+                compact_history_tail(session, [record.id])
+                history = history_entry(
                     record_id=record.id,
                     user_email=user_email,
                     version=record.current_version + 1,
@@ -814,6 +1037,7 @@ class LinguisticService:
                 .order_by(EditHistory.timestamp.desc())
                 .all()
             )
+            snapshots = load_history_data(session, history)
             return [
                 {
                     "id": h.id,
@@ -821,7 +1045,7 @@ class LinguisticService:
                     "version": h.version,
                     "change_summary": h.change_summary,
                     "timestamp": h.timestamp.strftime("%Y-%m-%d %H:%M:%S") if h.timestamp else "N/A",
-                    "current_data": h.current_data,
+                    "current_data": snapshots[h.id].current_data,
                 }
                 for h in history
             ]
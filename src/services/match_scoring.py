@@ -0,0 +1,140 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Similarity scoring for upload match candidates.
+
+``UploadService.suggest_matches`` ranks same-source candidates by
+``(hm_match, ge_score, nt_score)``. Candidate features (lowercased ``\\ge``
+and first non-record ``\\nt``) are extracted once per candidate and cached
+on the scorer, and string similarity is computed with rapidfuzz's Indel
+ratio via ``process.cdist`` so a whole candidate list is scored in one call.
+
+Indel similarity is based on the longest common subsequence, whereas
+``difflib.SequenceMatcher.ratio()`` uses the Ratcliff/Obershelp heuristic;
+the two agree for most short glosses, but Indel is never lower and can be
+noticeably higher. Ranking uses Indel, while acceptance thresholds tuned
+against difflib are checked with ``ge_ratio()``, one difflib ratio for the
+winning candidate only. Setting ``SNEA_EXACT_MATCH_SCORING=1`` (or passing
+``exact=True``) reproduces the historical difflib ratios exactly for
+regression testing.
+"""
+
+import difflib
+import os
+from dataclasses import dataclass
+
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
+
+EXACT_SCORING_ENV = "SNEA_EXACT_MATCH_SCORING"
+
+
+def exact_scoring_enabled() -> bool:
+    """Return True when the difflib compatibility mode is requested via environment."""
+    return os.getenv(EXACT_SCORING_ENV, "").lower() not in ("", "false", "0")
+
+
+def extract_first_nt(mdf_text: str) -> str | None:
+    """Return the first \\nt value that is not a \\nt Record: line."""
+    for line in mdf_text.split("\n"):
+        s = line.lstrip()
+        if s.startswith("\\nt "):
+            val = s[len("\\nt ") :].strip()
+            # Skip \nt Record: <digits> lines
+            if val.startswith("Record:"):
+                remainder = val[len("Record:") :].strip()
+                if remainder.isdigit():
+                    continue
+            return val or None
+    return None
+
+
+@dataclass(frozen=True)
+class CandidateFeatures:
+    """Pre-extracted, lowercased comparison fields for one candidate record."""
+
+    id: int
+    hm: int | None
+    ge: str
+    nt: str
+
+
+class CandidateScorer:
+    """Scores candidate records against an uploaded entry.
+
+    One scorer is created per ``suggest_matches`` chunk; features for each
+    candidate id are extracted on first use and reused for every row that
+    sees the same candidate.
+    """
+
+    def __init__(self, mdf_by_id: dict[int, str] | None = None, exact: bool | None = None):
+        self.mdf_by_id = mdf_by_id if mdf_by_id is not None else {}
+        self.exact = exact_scoring_enabled() if exact is None else exact
+        self._features: dict[int, CandidateFeatures] = {}
+
+    def features(self, candidate) -> CandidateFeatures:
+        """Return cached features for a row exposing ``id``, ``hm`` and ``ge``."""
+        feats = self._features.get(candidate.id)
+        if feats is None:
+            nt = extract_first_nt(self.mdf_by_id.get(candidate.id, "")) or ""
+            feats = CandidateFeatures(
+                id=candidate.id,
+                hm=candidate.hm,
+                ge=(candidate.ge or "").lower(),
+                nt=nt.lower(),
+            )
+            self._features[candidate.id] = feats
+        return feats
+
+    def similarities(self, query: str, choices: list[str]) -> list[float]:
+        """Return the similarity ratio of ``query`` against each choice (0.0–1.0)."""
+        if not choices:
+            return []
+        if self.exact:
+            return [difflib.SequenceMatcher(None, query, c).ratio() for c in choices]
+        matrix = process.cdist([query], choices, scorer=Indel.normalized_similarity)
+        return [float(v) for v in matrix[0]]
+
+    def ge_ratio(self, parsed_ge: str, candidate) -> float:
+        """Return the difflib ratio of ``parsed_ge`` against ``candidate``'s \\ge.
+
+        Thresholds on the \\ge score were tuned against difflib; use this
+        rather than the ranking score to compare against them.
+        """
+        return difflib.SequenceMatcher(None, parsed_ge.lower(), self.features(candidate).ge).ratio()
+
+    def score_all(
+        self, candidates: list, parsed_hm: int | None, parsed_ge: str | None, parsed_nt: str | None
+    ) -> list[tuple[bool, float, float]]:
+        """Return ``(hm_match, ge_score, nt_score)`` for every candidate, in order."""
+        feats = [self.features(c) for c in candidates]
+        if parsed_ge is not None:
+            ge_scores = self.similarities(parsed_ge.lower(), [f.ge for f in feats])
+        else:
+            ge_scores = [0.0] * len(feats)
+        if parsed_nt is not None:
+            nt_scores = self.similarities(parsed_nt.lower(), [f.nt for f in feats])
+        else:
+            nt_scores = [0.0] * len(feats)
+        return [
+            (parsed_hm is not None and f.hm == parsed_hm, ge, nt)
+            for f, ge, nt in zip(feats, ge_scores, nt_scores, strict=True)
+        ]
+
+    def best(
+        self, candidates: list, parsed_hm: int | None, parsed_ge: str | None, parsed_nt: str | None
+    ) -> tuple[object, tuple[bool, float, float]]:
+        """Return the highest-scoring candidate and its score.
+
+        Ties resolve to the earliest candidate, matching ``max()`` semantics.
+        """
+        scores = self.score_all(candidates, parsed_hm, parsed_ge, parsed_nt)
+        best_idx = max(range(len(candidates)), key=scores.__getitem__)
+        return candidates[best_idx], scores[best_idx]
+
+    def best_by_text(self, query: str, candidates: list, attr: str):
+        """Return the candidate whose lowercased ``attr`` is most similar to ``query``."""
+        values = [(getattr(c, attr) or "").lower() for c in candidates]
+        scores = self.similarities(query.lower(), values)
+        best_idx = max(range(len(candidates)), key=scores.__getitem__)
+        return candidates[best_idx]
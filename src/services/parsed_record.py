@@ -0,0 +1,75 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Read access to the persisted records.parsed cache.
+
+records.parsed holds parse_record() output for mdf_data (every parse_mdf()
+field except the raw text) and records.parsed_version the PARSER_VERSION
+that produced it. Every ORM assignment of Record.mdf_data refreshes both
+columns (see the listener in models/core.py), so consumers read the
+structured fields from here instead of reparsing.
+
+Rows inserted by raw SQL leave parsed_version NULL, and a raw UPDATE that
+changes mdf_data but not parsed has it cleared by the
+trg_records_invalidate_parsed trigger; bumping PARSER_VERSION makes every
+stored value stale. parsed_entry() re-derives such rows on read. The write-back is a plain UPDATE of the two cache
+columns so it neither bumps the optimistic-lock version nor touches
+updated_at; it commits with the caller's transaction.
+"""
+
+from sqlalchemy import bindparam, or_, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import object_session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.database.models.core import Record
+from src.mdf.parser import PARSER_VERSION, parse_record
+
+_records = Record.__table__
+
+_write_back = (
+    update(_records)
+    .where(_records.c.id == bindparam("_id"))
+    .values(
+        parsed=bindparam("_parsed", type_=JSONB(none_as_null=True)),
+        parsed_version=PARSER_VERSION,
+        updated_at=_records.c.updated_at,
+    )
+)
+
+
+def parsed_entry(record: Record) -> dict | None:
+    """Return the parsed fields of ``record``, re-deriving them when stale.
+
+    Returns None when mdf_data does not parse.
+    """
+    if record.parsed_version == PARSER_VERSION:
+        return record.parsed
+    parsed = parse_record(record.mdf_data)
+    set_committed_value(record, "parsed", parsed)
+    set_committed_value(record, "parsed_version", PARSER_VERSION)
+    session = object_session(record)
+    if session is not None and record.id is not None:
+        session.execute(_write_back, [{"_id": record.id, "_parsed": parsed}])
+    return parsed
+
+
+def refresh_stale_parsed(session, batch_size: int = 500, after_id: int = 0) -> tuple[int, int | None]:
+    """Re-derive up to ``batch_size`` stale records with id > ``after_id``.
+
+    Returns the number of rows refreshed and the last id seen (None when no
+    stale rows remain), so callers can commit and resume batch by batch.
+    """
+    rows = session.execute(
+        select(_records.c.id, _records.c.mdf_data)
+        .where(
+            _records.c.id > after_id,
+            or_(_records.c.parsed_version.is_(None), _records.c.parsed_version != PARSER_VERSION),
+        )
+        .order_by(_records.c.id)
+        .limit(batch_size)
+    ).all()
+    if not rows:
+        return 0, None
+    session.execute(_write_back, [{"_id": rid, "_parsed": parse_record(mdf_data)} for rid, mdf_data in rows])
+    return len(rows), rows[-1][0]
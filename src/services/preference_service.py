@@ -1,5 +1,10 @@
 # Copyright (c) 2026 Brothertown Language
 # <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+from collections.abc import Iterable
+
+import streamlit as st
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.database.connection import get_session
 from src.database.models.identity import UserPreference
@@ -7,10 +12,20 @@ from src.logging_config import get_logger
 
 logger = get_logger("snea.preference_service")
 
+# Session-state keys: {user_email: {view_name: {key: value}}} for views loaded
+# so far, and {user_email: {(view_name, key): value}} not yet written back.
+_SNAPSHOT_STATE_KEY = "_preference_snapshot"
+_PENDING_STATE_KEY = "_preference_pending"
+
 
 class PreferenceService:
     """
     Manages persistent user preferences (UI settings, defaults, etc.) in the database.
+
+    Pages read through a per-session snapshot (prefetch_preferences /
+    get_cached_preference) loaded with one query per set of views, and write
+    through set_preference_deferred. Deferred writes are coalesced and saved
+    by flush_deferred_preferences in a single upsert at the end of the run.
     """
 
     @staticmethod
@@ -64,3 +79,123 @@ class PreferenceService:
             return False
         finally:
             session.close()
+
+    @staticmethod
+    def load_preferences(user_email: str, view_names: Iterable[str]) -> dict[str, dict[str, str]] | None:
+        """
+        Retrieves all saved preferences of a user for the given views in one query.
+        Returns {view_name: {key: value}} (empty dicts for views without rows), or None on error.
+        """
+        view_names = list(view_names)
+        session = get_session()
+        try:
+            rows = (
+                session.query(UserPreference.view_name, UserPreference.preference_key, UserPreference.preference_value)
+                .filter(UserPreference.user_email == user_email, UserPreference.view_name.in_(view_names))
+                .all()
+            )
+            prefs: dict[str, dict[str, str]] = {view: {} for view in view_names}
+            for view, key, value in rows:
+                prefs[view][key] = value
+            return prefs
+        except Exception as e:
+            logger.error(f"Failed to load preferences for {user_email} in {view_names}: {e}")
+            return None
+        finally:
+            session.close()
+
+    @staticmethod
+    def save_preferences(user_email: str, values: dict[tuple[str, str], str]) -> bool:
+        """
+        Upserts many preferences of one user, keyed by (view_name, key), in one
+        INSERT ... ON CONFLICT statement.
+        Returns True if successful, False otherwise.
+        """
+        if not values:
+            return True
+
+        session = get_session()
+        try:
+            stmt = pg_insert(UserPreference).values(
+                [
+                    {"user_email": user_email, "view_name": view, "preference_key": key, "preference_value": value}
+                    for (view, key), value in values.items()
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                constraint="uix_user_pref_view_key",
+                set_={"preference_value": stmt.excluded.preference_value, "updated_at": func.now()},
+            )
+            session.execute(stmt)
+            session.commit()
+            return True
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to save {len(values)} preference(s) for {user_email}: {e}")
+            return False
+        finally:
+            session.close()
+
+    @staticmethod
+    def prefetch_preferences(user_email: str, view_names: Iterable[str]) -> None:
+        """
+        Loads every view in view_names not yet in this session's snapshot, in one query.
+        On error the views stay unloaded and are retried on next access.
+        """
+        snapshot = st.session_state.setdefault(_SNAPSHOT_STATE_KEY, {}).setdefault(user_email, {})
+        missing = [view for view in view_names if view not in snapshot]
+        if not missing:
+            return
+        loaded = PreferenceService.load_preferences(user_email, missing)
+        if loaded is None:
+            return
+        # Queued changes are newer than what is stored
+        for (view, key), value in st.session_state.get(_PENDING_STATE_KEY, {}).get(user_email, {}).items():
+            if view in loaded:
+                loaded[view][key] = value
+        snapshot.update(loaded)
+
+    @staticmethod
+    def get_cached_preference(user_email: str, view_name: str, key: str, default: str | None = None) -> str | None:
+        """
+        Reads a preference from this session's snapshot, loading its view on first use.
+        Returns the default value if no preference is found or the view could not be loaded.
+        """
+        PreferenceService.prefetch_preferences(user_email, (view_name,))
+        view = st.session_state[_SNAPSHOT_STATE_KEY][user_email].get(view_name)
+        if view is None:
+            # View could not be loaded; a change queued this session still wins
+            pending = st.session_state.get(_PENDING_STATE_KEY, {}).get(user_email, {})
+            return pending.get((view_name, key), default)
+        return view.get(key, default)
+
+    @staticmethod
+    def set_preference_deferred(user_email: str, view_name: str, key: str, value: str) -> None:
+        """
+        Records a preference change in this session's snapshot and queues it for
+        flush_deferred_preferences. Repeated changes to one key are coalesced.
+        """
+        PreferenceService.prefetch_preferences(user_email, (view_name,))
+        view = st.session_state[_SNAPSHOT_STATE_KEY][user_email].get(view_name)
+        if view is not None:
+            if view.get(key) == value:
+                return
+            view[key] = value
+        pending = st.session_state.setdefault(_PENDING_STATE_KEY, {}).setdefault(user_email, {})
+        pending[(view_name, key)] = value
+
+    @staticmethod
+    def flush_deferred_preferences() -> bool:
+        """
+        Saves all queued preference changes of this session, one upsert per user.
+        Changes that fail to save stay queued for the next flush.
+        Returns True if nothing remains queued.
+        """
+        pending = st.session_state.get(_PENDING_STATE_KEY)
+        if not pending:
+            return True
+
+        for user_email, values in list(pending.items()):
+            if PreferenceService.save_preferences(user_email, values):
+                del pending[user_email]
+        return not pending
@@ -0,0 +1,216 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Per-process SQL statement statistics.
+
+install() hooks before_/after_cursor_execute (and handle_error, which drops
+the pending start of a failed statement) on every SQLAlchemy Engine.
+Each statement is reduced to a fingerprint (bound values and IN-list
+lengths removed) and aggregated per (fingerprint, caller, page): the caller
+is the innermost src/services or other app function on the stack, the page
+the src/frontend/pages module that was rendering. Statements slower than
+SNEA_SLOW_QUERY_MS (default 500) are also logged. The System Status page
+shows and resets the aggregates for admins.
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.logging_config import get_logger
+
+logger = get_logger("snea.query_stats")
+
+SLOW_QUERY_ENV = "SNEA_SLOW_QUERY_MS"
+DEFAULT_SLOW_QUERY_MS = 500.0
+
+# Durations kept per statement for the p95
+_SAMPLES = 256
+
+_SRC_ROOT = str(Path(__file__).resolve().parent.parent) + os.sep
+_PAGES_DIR = os.path.join(_SRC_ROOT, "frontend", "pages") + os.sep
+# Frames inside these packages are plumbing, not the code that issued the query
+_SKIP_DIRS = (os.path.join(_SRC_ROOT, "database") + os.sep, os.path.join(_SRC_ROOT, "logging_config"))
+
+_PARAM = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\?")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Statement text with literals, bound values and IN-list lengths normalized away."""
+    text = _STRING.sub("?", statement)
+    text = _PARAM.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _SPACE.sub(" ", text).strip()
+    return _IN_LIST.sub("(?...)", text)
+
+
+def slow_query_ms() -> float:
+    try:
+        return float(os.getenv(SLOW_QUERY_ENV, DEFAULT_SLOW_QUERY_MS))
+    except ValueError:
+        return DEFAULT_SLOW_QUERY_MS
+
+
+def _attribution() -> tuple[str, str]:
+    """(caller, page) of the statement being executed, from the Python stack."""
+    caller = page = ""
+    frame = sys._getframe(2)
+    while frame is not None and not page:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_SRC_ROOT) and filename != __file__:
+            if filename.startswith(_PAGES_DIR):
+                page = Path(filename).stem
+            if not caller and not filename.startswith(_SKIP_DIRS):
+                caller = f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    return caller or "-", page or "-"
+
+
+@dataclass
+class StatementStats:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    rows: int = 0
+    samples: deque = field(default_factory=lambda: deque(maxlen=_SAMPLES))
+
+    def p95_ms(self) -> float:
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))] if ordered else 0.0
+
+
+class QueryStats:
+    """Thread-safe aggregate of statement timings keyed by (fingerprint, caller, page)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str, str], StatementStats] = {}
+        self.since = time.time()
+
+    def record(self, statement: str, elapsed_ms: float, rows: int, caller: str, page: str) -> None:
+        key = (fingerprint(statement), caller, page)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = StatementStats()
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.rows += max(rows, 0)
+            stats.samples.append(elapsed_ms)
+
+    def snapshot(self) -> list[dict]:
+        """One row per statement, slowest total first."""
+        with self._lock:
+            items = [(key, stats, stats.p95_ms()) for key, stats in self._stats.items()]
+        rows = [
+            {
+                "statement": statement,
+                "caller": caller,
+                "page": page,
+                "count": stats.count,
+                "total_ms": round(stats.total_ms, 1),
+                "mean_ms": round(stats.total_ms / stats.count, 2),
+                "p95_ms": round(p95, 2),
+                "max_ms": round(stats.max_ms, 2),
+                "rows": stats.rows,
+            }
+            for (statement, caller, page), stats, p95 in items
+        ]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self.since = time.time()
+
+
+# Shared by every session in this Streamlit server process
+query_stats = QueryStats()
+
+
+@dataclass
+class QueryTotals:
+    count: int = 0
+    total_ms: float = 0.0
+
+
+_local = threading.local()
+
+
+@contextmanager
+def capture():
+    """Count the statements this thread executes inside the block, and their time."""
+    outer = getattr(_local, "totals", None)
+    totals = _local.totals = QueryTotals()
+    try:
+        yield totals
+    finally:
+        _local.totals = outer
+        if outer is not None:
+            outer.count += totals.count
+            outer.total_ms += totals.total_ms
+
+
+_installed = False
+_install_lock = threading.Lock()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_stats_start")
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+    caller, page = _attribution()
+    rows = getattr(cursor, "rowcount", -1)
+    query_stats.record(statement, elapsed_ms, rows, caller, page)
+    totals = getattr(_local, "totals", None)
+    if totals is not None:
+        totals.count += 1
+        totals.total_ms += elapsed_ms
+    if elapsed_ms >= slow_query_ms():
+        logger.warning(
+            "Slow query (%.0f ms, %d rows) from %s on page %s: %s",
+            elapsed_ms,
+            rows,
+            caller,
+            page,
+            fingerprint(statement)[:500],
+        )
+
+
+def _handle_error(context):
+    """A failed statement never reaches after_cursor_execute; drop its start time."""
+    conn = context.connection
+    starts = conn.info.get("query_stats_start") if conn is not None else None
+    if starts:
+        starts.pop()
+
+
+def install() -> None:
+    """Attach the timing listeners to all engines; later calls are no-ops."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+        _installed = True
@@ -0,0 +1,227 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Opt-in profiler for Streamlit reruns.
+
+streamlit_app.py runs every page inside profile_render(). When profiling is
+on (SNEA_PROFILE_RENDERS=1, or the admin toggle on System Status) a sampler
+thread snapshots the rerun thread's stack every SNEA_PROFILE_INTERVAL_MS
+(default 5). Each rerun is kept as a RenderProfile with its wall, CPU and
+database time, query count, samples per area (db, parsing, html, widgets,
+app) and collapsed stacks. The last SNEA_PROFILE_KEEP (default 20) reruns
+of this server process are held in memory for the flame summary.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.logging_config import get_logger
+from src.services import query_stats
+
+logger = get_logger("snea.render_profiler")
+
+PROFILE_ENV = "SNEA_PROFILE_RENDERS"
+INTERVAL_ENV = "SNEA_PROFILE_INTERVAL_MS"
+KEEP_ENV = "SNEA_PROFILE_KEEP"
+
+_SRC_ROOT = str(Path(__file__).resolve().parent.parent) + os.sep
+_PAGES_DIR = os.path.join(_SRC_ROOT, "frontend", "pages") + os.sep
+_MDF_DIR = os.path.join(_SRC_ROOT, "mdf") + os.sep
+_FRONTEND_DIR = os.path.join(_SRC_ROOT, "frontend") + os.sep
+_MAX_DEPTH = 60
+
+# Checked from the innermost frame outwards; the first match names the area
+AREAS = ("db", "parsing", "html", "widgets", "app")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except ValueError:
+        return default
+
+
+def _area(frames: list) -> str:
+    for frame in reversed(frames):
+        filename = frame.f_code.co_filename
+        if f"{os.sep}sqlalchemy{os.sep}" in filename or f"{os.sep}psycopg2{os.sep}" in filename:
+            return "db"
+        if filename.startswith(_MDF_DIR):
+            return "parsing"
+        if filename.startswith(_FRONTEND_DIR) and frame.f_code.co_name.endswith(("_html", "_css")):
+            return "html"
+        if f"{os.sep}streamlit{os.sep}" in filename:
+            return "widgets"
+    return "app"
+
+
+def _label(frame) -> str:
+    filename = frame.f_code.co_filename
+    module = frame.f_globals.get("__name__", "?")
+    if module == "__main__":
+        module = Path(filename).stem
+    return f"{module}:{frame.f_code.co_name}"
+
+
+def _stack(frame) -> list:
+    """Frames from the page script down to `frame`, outermost first.
+
+    The whole stack is returned so _area() sees the innermost frames; only
+    the recorded labels are cut to _MAX_DEPTH.
+    """
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    frames.reverse()
+    for i, f in enumerate(frames):
+        if f.f_code.co_filename.startswith(_PAGES_DIR):
+            frames = frames[i:]
+            break
+    return frames
+
+
+@dataclass
+class RenderProfile:
+    page: str
+    started: float
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    db_ms: float = 0.0
+    queries: int = 0
+    samples: int = 0
+    areas: Counter = field(default_factory=Counter)
+    stacks: Counter = field(default_factory=Counter)
+
+
+class _Sampler(threading.Thread):
+    def __init__(self, target_id: int, profile: RenderProfile, interval: float):
+        super().__init__(name="snea-render-sampler", daemon=True)
+        self._target_id = target_id
+        self._profile = profile
+        self._interval = interval
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self._interval):
+            frame = sys._current_frames().get(self._target_id)
+            if frame is None:
+                continue
+            self.sample(frame)
+            del frame
+
+    def sample(self, frame):
+        frames = _stack(frame)
+        self._profile.samples += 1
+        self._profile.areas[_area(frames)] += 1
+        self._profile.stacks[tuple(_label(f) for f in frames[:_MAX_DEPTH])] += 1
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+_enabled = os.getenv(PROFILE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+_lock = threading.Lock()
+_profiles: deque[RenderProfile] = deque(maxlen=_env_int(KEEP_ENV, 20))
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn profiling on or off for every session in this process."""
+    global _enabled
+    _enabled = bool(enabled)
+    logger.info("Render profiling %s", "enabled" if _enabled else "disabled")
+
+
+def recent_profiles() -> list[RenderProfile]:
+    """Profiled reruns, newest first."""
+    with _lock:
+        return list(reversed(_profiles))
+
+
+def clear_profiles() -> None:
+    with _lock:
+        _profiles.clear()
+
+
+@contextmanager
+def profile_render(page: str):
+    """Profile the enclosed page run, including runs cut short by st.rerun()/st.stop()."""
+    if not _enabled:
+        yield
+        return
+
+    profile = RenderProfile(page=page, started=time.time())
+    sampler = _Sampler(threading.get_ident(), profile, _env_int(INTERVAL_ENV, 5) / 1000)
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    sampler.start()
+    try:
+        with query_stats.capture() as totals:
+            yield
+    finally:
+        sampler.stop()
+        profile.wall_ms = (time.perf_counter() - wall_start) * 1000
+        profile.cpu_ms = (time.thread_time() - cpu_start) * 1000
+        profile.db_ms = totals.total_ms
+        profile.queries = totals.count
+        with _lock:
+            _profiles.append(profile)
+        logger.info(
+            "Rerun of %s: %.0f ms wall, %.0f ms CPU, %.0f ms in %d queries",
+            page,
+            profile.wall_ms,
+            profile.cpu_ms,
+            profile.db_ms,
+            profile.queries,
+        )
+
+
+def flame_summary(profiles: list[RenderProfile], min_share: float = 0.01) -> list[tuple[int, str, int, float]]:
+    """
+    Merge the sampled stacks of `profiles` into a call tree.
+
+    Returns (depth, frame label, samples, share of all samples) rows in
+    depth-first order, heaviest child first, omitting subtrees below
+    `min_share`.
+    """
+    tree: dict = {}
+    total = 0
+    for profile in profiles:
+        for stack, count in profile.stacks.items():
+            total += count
+            node = tree
+            for label in stack:
+                entry = node.setdefault(label, [0, {}])
+                entry[0] += count
+                node = entry[1]
+    rows = []
+
+    def walk(node: dict, depth: int) -> None:
+        for label, (count, children) in sorted(node.items(), key=lambda item: item[1][0], reverse=True):
+            if count / total < min_share:
+                continue
+            rows.append((depth, label, count, count / total))
+            walk(children, depth + 1)
+
+    if total:
+        walk(tree, 0)
+    return rows
+
+
+def collapsed_stacks(profiles: list[RenderProfile]) -> str:
+    """Stacks in the folded 'a;b;c count' format read by flamegraph.pl and speedscope."""
+    merged = Counter()
+    for profile in profiles:
+        merged.update(profile.stacks)
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in merged.most_common())
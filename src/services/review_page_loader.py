@@ -0,0 +1,128 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Bulk loader for one page of the upload review table.
+
+The review table shows, for every queue row on the page, the suggested
+record, the other sources that already contain the headword, and whether
+the uploaded ``\\nt Record:`` id belongs to a different source. Loading
+these per row costs a diacritic-folding query per entry; this module
+resolves the whole page with one query per concern.
+
+Base-form (diacritic-folded, lowercased) headword comparison is shared
+with ``UploadService.get_cross_source_info``. The SQL expression is
+indexed by ``idx_records_lx_base_form``, so queries must build it with
+``lx_base_form_expr()`` for the planner to match the index.
+"""
+
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from sqlalchemy import func
+
+from src.database.models.core import Record, Source
+
+# Must match idx_records_lx_base_form; changing them needs a migration that rebuilds it
+LX_BASE_FORM_FROM = "áàâäãåāéèêëēíìîïīóòôöõøōúùûüū"
+LX_BASE_FORM_TO = "aaaaaaaeeeeeiiiiiooooooouuuuu"
+
+
+def lx_base_form_expr(column):
+    """SQL base form of a headword column: listed diacritics folded, lowercased."""
+    return func.lower(func.translate(column, LX_BASE_FORM_FROM, LX_BASE_FORM_TO))
+
+
+def lx_base_form(lx: str) -> str:
+    """Python-side value to compare against lx_base_form_expr()."""
+    nfd = unicodedata.normalize("NFD", lx)
+    return "".join(ch for ch in nfd if unicodedata.category(ch) != "Mn").lower()
+
+
+def parse_uploaded_record_id(mdf_data: str) -> int | None:
+    """Return the id from the last ``\\nt Record: <id>`` line, if any."""
+    record_id = None
+    for line in mdf_data.split("\n"):
+        stripped = line.lstrip()
+        if stripped.startswith("\\nt Record:"):
+            val = stripped[len("\\nt Record:") :].strip()
+            if val.isdigit():
+                record_id = int(val)
+    return record_id
+
+
+@dataclass(frozen=True)
+class ReviewPageContext:
+    """Per-page review data; the dicts other than suggested_records are keyed by queue id."""
+
+    suggested_records: dict = field(default_factory=dict)
+    uploaded_record_ids: dict[int, int] = field(default_factory=dict)
+    record_id_conflicts: dict[int, list[str]] = field(default_factory=dict)
+    cross_sources: dict[int, list[str]] = field(default_factory=dict)
+
+
+def load_review_page_context(session, rows, source_id: int | None) -> ReviewPageContext:
+    """Resolve suggested records, record-id conflicts and cross-source matches for ``rows``."""
+    suggested_records = {}
+    suggested_ids = {r.suggested_record_id for r in rows if r.suggested_record_id}
+    if suggested_ids:
+        recs = session.query(Record).filter(Record.id.in_(suggested_ids)).all()
+        suggested_records = {r.id: r for r in recs}
+
+    uploaded_record_ids = {}
+    for row in rows:
+        record_id = parse_uploaded_record_id(row.mdf_data)
+        if record_id is not None:
+            uploaded_record_ids[row.id] = record_id
+
+    record_id_conflicts = {}
+    if uploaded_record_ids and source_id:
+        owners = defaultdict(set)
+        for record_id, name in (
+            session.query(Record.id, Source.name)
+            .join(Source, Record.source_id == Source.id)
+            .filter(
+                Record.id.in_(set(uploaded_record_ids.values())),
+                Record.source_id != source_id,
+                Record.is_deleted == False,  # noqa: E712
+            )
+            .all()
+        ):
+            owners[record_id].add(name)
+        record_id_conflicts = {
+            queue_id: sorted(owners[record_id])
+            for queue_id, record_id in uploaded_record_ids.items()
+            if record_id in owners
+        }
+
+    cross_sources = {}
+    lxs = {r.lx for r in rows if r.lx}
+    if lxs and source_id:
+        base_expr = lx_base_form_expr(Record.lx)
+        by_lx = defaultdict(set)
+        by_base = defaultdict(set)
+        for lx, base_lx, name in (
+            session.query(Record.lx, base_expr, Source.name)
+            .join(Source, Record.source_id == Source.id)
+            .filter(
+                Record.source_id != source_id,
+                Record.is_deleted == False,  # noqa: E712
+                Record.lx.in_(lxs) | base_expr.in_({lx_base_form(lx) for lx in lxs}),
+            )
+            .distinct()
+            .all()
+        ):
+            by_lx[lx].add(name)
+            by_base[base_lx].add(name)
+        for row in rows:
+            if row.lx:
+                names = by_lx.get(row.lx, set()) | by_base.get(lx_base_form(row.lx), set())
+                if names:
+                    cross_sources[row.id] = sorted(names)
+
+    return ReviewPageContext(
+        suggested_records=suggested_records,
+        uploaded_record_ids=uploaded_record_ids,
+        record_id_conflicts=record_id_conflicts,
+        cross_sources=cross_sources,
+    )
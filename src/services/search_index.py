@@ -0,0 +1,244 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Rows derived from a record for the search tables, in Python and in SQL.
+
+search_entries, headword_search_entries, gloss_search_entries and
+fts_entries are normally rebuilt by UploadService.populate_search_entries()
+from search_rows(). With SNEA_SEARCH_MAINTENANCE=trigger, init_db installs
+row triggers on records that rebuild them inside PostgreSQL from the
+persisted parse (records.parsed) whenever mdf_data or parsed changes, and
+populate_search_entries() becomes a no-op for the process.
+
+The SQL side is snea_search_rows(parsed, mdf_data), a port of search_rows()
+on top of snea_sort_key() (see sort_key.py). Both are created by migration
+regardless of the mode; scripts/check_search_triggers.py compares them
+across the corpus.
+"""
+
+import os
+from collections import Counter
+from typing import NamedTuple
+
+from sqlalchemy import bindparam, text
+
+from src.services.sort_key import sort_key
+
+SEARCH_MAINTENANCE_ENV = "SNEA_SEARCH_MAINTENANCE"
+MAINTENANCE_APP = "app"
+MAINTENANCE_TRIGGER = "trigger"
+
+KIND_SEARCH = "search"
+KIND_HEADWORD = "headword"
+KIND_GLOSS = "gloss"
+KIND_FTS = "fts"
+
+# Set by sync_search_triggers(); the app skips its own rebuilds only once the triggers exist
+_triggers_active = False
+
+
+class SearchRow(NamedTuple):
+    kind: str
+    entry_type: str | None
+    term: str
+    normalized_term: str
+
+
+def search_triggers_requested() -> bool:
+    """True when SNEA_SEARCH_MAINTENANCE=trigger."""
+    return os.getenv(SEARCH_MAINTENANCE_ENV, MAINTENANCE_APP).lower() == MAINTENANCE_TRIGGER
+
+
+def search_triggers_active() -> bool:
+    """True once this process has installed the search triggers."""
+    return _triggers_active
+
+
+def search_rows(entry: dict | None, mdf_data: str, with_fts: bool = True) -> list[SearchRow]:
+    """Search-table rows for a record parsed as ``entry``; none when it did not parse.
+
+    The fts row's term is the normalized MDF text fed to to_tsvector().
+    """
+    if not entry:
+        return []
+    rows = []
+    lx = entry.get("lx")
+    if lx:
+        rows.append(SearchRow(KIND_SEARCH, "lx", lx, sort_key(lx)))
+    # va, se, cf, ve lists (deduplicate per record)
+    seen = set()
+    for field in ("va", "se", "cf", "ve"):
+        for val in entry.get(field, []):
+            if val and (val, field) not in seen:
+                seen.add((val, field))
+                rows.append(SearchRow(KIND_SEARCH, field, val, sort_key(val)))
+    # Headword search: primary lx and the va forms before any subentry or sense
+    if lx:
+        rows.append(SearchRow(KIND_HEADWORD, "lx", lx, sort_key(lx)))
+    for val in entry.get("primary_va", []):
+        if val:
+            rows.append(SearchRow(KIND_HEADWORD, "va", val, sort_key(val)))
+    ge = entry.get("ge")
+    if ge:
+        rows.append(SearchRow(KIND_GLOSS, None, ge, sort_key(ge)))
+    if with_fts:
+        norm_mdf = sort_key(mdf_data)
+        if norm_mdf:
+            rows.append(SearchRow(KIND_FTS, None, norm_mdf, norm_mdf))
+    return rows
+
+
+SEARCH_ROWS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION snea_search_rows(p_parsed jsonb, p_mdf text)
+RETURNS TABLE (kind text, entry_type text, term text, normalized_term text)
+LANGUAGE plpgsql STABLE AS $$
+DECLARE
+    v_lx text := p_parsed ->> 'lx';
+    v_ge text := p_parsed ->> 'ge';
+    v_mdf text;
+BEGIN
+    IF p_parsed IS NULL OR jsonb_typeof(p_parsed) <> 'object' THEN
+        RETURN;
+    END IF;
+    IF v_lx <> '' THEN
+        RETURN QUERY SELECT 'search'::text, 'lx'::text, v_lx, snea_sort_key(v_lx);
+    END IF;
+    RETURN QUERY
+        SELECT 'search'::text, f.field, v.val, snea_sort_key(v.val)
+        FROM unnest(ARRAY['va', 'se', 'cf', 've']) WITH ORDINALITY AS f(field, pos)
+        CROSS JOIN LATERAL jsonb_array_elements_text(COALESCE(p_parsed -> f.field, '[]'::jsonb))
+            WITH ORDINALITY AS v(val, idx)
+        WHERE v.val <> ''
+        GROUP BY f.field, v.val
+        ORDER BY min(f.pos), min(v.idx);
+    IF v_lx <> '' THEN
+        RETURN QUERY SELECT 'headword'::text, 'lx'::text, v_lx, snea_sort_key(v_lx);
+    END IF;
+    RETURN QUERY
+        SELECT 'headword'::text, 'va'::text, v.val, snea_sort_key(v.val)
+        FROM jsonb_array_elements_text(COALESCE(p_parsed -> 'primary_va', '[]'::jsonb)) AS v(val)
+        WHERE v.val <> '';
+    IF v_ge <> '' THEN
+        RETURN QUERY SELECT 'gloss'::text, NULL::text, v_ge, snea_sort_key(v_ge);
+    END IF;
+    v_mdf := snea_sort_key(p_mdf);
+    IF v_mdf <> '' THEN
+        RETURN QUERY SELECT 'fts'::text, NULL::text, v_mdf, v_mdf;
+    END IF;
+END;
+$$;
+"""
+
+REFRESH_TRIGGER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION snea_refresh_search_entries() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    has_fts boolean := to_regclass('fts_entries') IS NOT NULL;
+    r record;
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        DELETE FROM search_entries WHERE record_id = NEW.id;
+        DELETE FROM headword_search_entries WHERE record_id = NEW.id;
+        DELETE FROM gloss_search_entries WHERE record_id = NEW.id;
+        IF has_fts THEN
+            DELETE FROM fts_entries WHERE record_id = NEW.id;
+        END IF;
+    END IF;
+    FOR r IN SELECT * FROM snea_search_rows(NEW.parsed, NEW.mdf_data) LOOP
+        IF r.kind = 'search' THEN
+            INSERT INTO search_entries (record_id, term, normalized_term, entry_type)
+            VALUES (NEW.id, r.term, r.normalized_term, r.entry_type);
+        ELSIF r.kind = 'headword' THEN
+            INSERT INTO headword_search_entries (record_id, entry_type, term, normalized_term)
+            VALUES (NEW.id, r.entry_type, r.term, r.normalized_term);
+        ELSIF r.kind = 'gloss' THEN
+            INSERT INTO gloss_search_entries (record_id, term, normalized_term)
+            VALUES (NEW.id, r.term, r.normalized_term);
+        ELSIF r.kind = 'fts' AND has_fts THEN
+            INSERT INTO fts_entries (record_id, fts_vector)
+            VALUES (NEW.id, to_tsvector('simple', r.normalized_term));
+        END IF;
+    END LOOP;
+    RETURN NULL;
+END;
+$$;
+"""
+
+_TRIGGERS = {
+    "trg_records_search_insert": "AFTER INSERT ON records FOR EACH ROW",
+    "trg_records_search_update": (
+        "AFTER UPDATE OF mdf_data, parsed ON records FOR EACH ROW "
+        "WHEN (OLD.mdf_data IS DISTINCT FROM NEW.mdf_data OR OLD.parsed IS DISTINCT FROM NEW.parsed)"
+    ),
+}
+
+
+_EXISTING_TRIGGERS = text(
+    "SELECT tgname FROM pg_trigger WHERE tgrelid = 'records'::regclass AND tgname IN :names"
+).bindparams(bindparam("names", expanding=True))
+
+
+def sync_search_triggers(conn) -> bool:
+    """Install or drop the search triggers to match SNEA_SEARCH_MAINTENANCE.
+
+    Only missing or unwanted triggers are touched, so the usual startup
+    costs one catalog query and takes no lock on records. Returns whether
+    trigger maintenance is active. The caller commits.
+    """
+    global _triggers_active
+    enabled = search_triggers_requested()
+    existing = {name for (name,) in conn.execute(_EXISTING_TRIGGERS, {"names": list(_TRIGGERS)})}
+    for name, definition in _TRIGGERS.items():
+        if enabled and name not in existing:
+            conn.execute(text(f"CREATE TRIGGER {name} {definition} EXECUTE FUNCTION snea_refresh_search_entries();"))
+        elif not enabled and name in existing:
+            conn.execute(text(f"DROP TRIGGER {name} ON records;"))
+    _triggers_active = enabled
+    return enabled
+
+
+def assume_search_triggers_synced() -> bool:
+    """Set the active flag from SNEA_SEARCH_MAINTENANCE without touching the database.
+
+    For startups that skip sync_search_triggers() because the schema
+    fingerprint, which includes the maintenance mode, shows the triggers
+    already match.
+    """
+    global _triggers_active
+    _triggers_active = search_triggers_requested()
+    return _triggers_active
+
+
+_SQL_ROWS = text("""
+    SELECT r.id, s.kind, s.entry_type, s.term, s.normalized_term
+    FROM records r CROSS JOIN LATERAL snea_search_rows(r.parsed, r.mdf_data) AS s
+    WHERE r.id IN :ids
+""").bindparams(bindparam("ids", expanding=True))
+
+
+def cross_check_search_rows(session, record_ids, with_fts: bool = True) -> dict[int, tuple[Counter, Counter]]:
+    """Compare snea_search_rows() with search_rows() for ``record_ids``.
+
+    Both sides derive from the same stored records.parsed and mdf_data, so
+    the comparison isolates the SQL port. Returns {record_id: (only_in_python,
+    only_in_sql)} for records that differ.
+    """
+    from src.database.models.core import Record
+
+    expected: dict[int, Counter] = {}
+    for rid, parsed, mdf_data in session.query(Record.id, Record.parsed, Record.mdf_data).filter(
+        Record.id.in_(record_ids)
+    ):
+        expected[rid] = Counter(search_rows(parsed, mdf_data, with_fts))
+
+    actual: dict[int, Counter] = {rid: Counter() for rid in expected}
+    if expected:
+        for rid, kind, entry_type, term, normalized_term in session.execute(_SQL_ROWS, {"ids": list(expected)}):
+            if with_fts or kind != KIND_FTS:
+                actual[rid][SearchRow(kind, entry_type, term, normalized_term)] += 1
+
+    return {
+        rid: (expected[rid] - actual[rid], actual[rid] - expected[rid])
+        for rid in expected
+        if expected[rid] != actual[rid]
+    }
@@ -0,0 +1,135 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Sort-key normalization shared by Python and PostgreSQL.
+
+sort_key() is the implementation behind LinguisticService.generate_sort_lx.
+sort_key_function_sql() renders the same rules as the SQL function
+snea_sort_key(text), built from the tables below so the two cannot drift
+apart rule by rule. The combining marks stripped after NFD, the lowercase
+mapping and the whitespace stripped from the front are all taken from this
+interpreter's unicodedata and spelled out in the SQL, so neither side
+depends on the database's LC_CTYPE or on context rules such as str.lower()'s
+word-final sigma.
+
+Migrations that change these rules renormalize stored keys in place with
+MigrationManager._renormalize_sort_keys(), i.e. a single
+``UPDATE records SET sort_lx = snea_sort_key(lx)`` per column;
+tests/database/test_sort_key_parity.py checks the port against the corpus.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# Fancy quotes and apostrophes -> straight ones
+SORT_QUOTES_MAP = {
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u201a": "'",
+    "\u201b": "'",
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u201e": '"',
+    "\u201f": '"',
+    "\u02bc": "'",
+    "\u02b9": "'",
+    "\u00b4": "'",
+}
+
+# ∞ (U+221E) is an Algonquian letter for a long rounded vowel; sorts after oo*/before op
+# ✔ (U+2714) is an annotation mark; stripped for sort purposes
+SORT_SYMBOL_MAP = {
+    "\u221e": "oozzz",
+    "\u2714": "",
+}
+
+# Final sigma sorts as σ wherever it appears
+SORT_CASE_FOLDS = {
+    "\u03c2": "\u03c3",
+}
+
+# Every character str.isspace() accepts, i.e. what \s matches in Python; spelled
+# out rather than scanned for at import (checked in test_linguistic_normalization)
+_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005"
+    "\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+# Leading numerals, linguistic punctuation (*, -, =, [, ], (, )) and whitespace
+_LEADING_STRIP = re.compile(rf"^[0-9*\-=\[\]\(\){re.escape(_WHITESPACE)}]+")
+_LEADING_STRIP_SQL = rf"^[0-9*=()\[\]{_WHITESPACE}-]+"
+
+
+@lru_cache(maxsize=1)
+def case_map() -> dict[str, str]:
+    """Single-character lowercase mapping, plus SORT_CASE_FOLDS.
+
+    Characters whose lowercase is longer than one character (only U+0130,
+    which NFD has already decomposed by this point) are left alone.
+    """
+    mapping = {}
+    for cp in range(0x110000):
+        char = chr(cp)
+        lowered = char.lower()
+        if lowered != char and len(lowered) == 1:
+            mapping[char] = lowered
+    mapping.update(SORT_CASE_FOLDS)
+    return mapping
+
+
+# str.lower() agrees with case_map() except where its final-sigma rule emits ς
+_FOLD_TABLE = str.maketrans(SORT_CASE_FOLDS)
+
+
+def sort_key(value: str) -> str:
+    """Normalized sort/search key; see LinguisticService.generate_sort_lx for the rules."""
+    if not value:
+        return ""
+    nfd = unicodedata.normalize("NFD", value)
+    stripped = "".join(c for c in nfd if not unicodedata.combining(c))
+    for fancy, straight in SORT_QUOTES_MAP.items():
+        stripped = stripped.replace(fancy, straight)
+    for symbol, replacement in SORT_SYMBOL_MAP.items():
+        stripped = stripped.replace(symbol, replacement)
+    return _LEADING_STRIP.sub("", stripped.lower().translate(_FOLD_TABLE))
+
+
+@lru_cache(maxsize=1)
+def combining_mark_ranges() -> tuple[tuple[int, int], ...]:
+    """Inclusive code point ranges for which unicodedata.combining() is non-zero."""
+    ranges: list[list[int]] = []
+    for cp in range(0x110000):
+        if unicodedata.combining(chr(cp)):
+            if ranges and ranges[-1][1] == cp - 1:
+                ranges[-1][1] = cp
+            else:
+                ranges.append([cp, cp])
+    return tuple((lo, hi) for lo, hi in ranges)
+
+
+def _sql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def sort_key_function_sql() -> str:
+    """CREATE OR REPLACE statement for snea_sort_key(text), the SQL port of sort_key()."""
+    marks = "".join(chr(lo) if lo == hi else f"{chr(lo)}-{chr(hi)}" for lo, hi in combining_mark_ranges())
+    expr = f"regexp_replace(normalize(coalesce(p_text, ''), NFD), {_sql_literal(f'[{marks}]')}, '', 'g')"
+    # translate() only maps one character to one character
+    quotes_from, quotes_to = "".join(SORT_QUOTES_MAP), "".join(SORT_QUOTES_MAP.values())
+    expr = f"translate({expr}, {_sql_literal(quotes_from)}, {_sql_literal(quotes_to)})"
+    for symbol, replacement in SORT_SYMBOL_MAP.items():
+        expr = f"replace({expr}, {_sql_literal(symbol)}, {_sql_literal(replacement)})"
+    # Lowercase from case_map(), not lower(): A-Z under the C collation, which is
+    # ASCII-only whatever the database locale, then translate() for the rest. It
+    # scans its whole table per character, so it only runs on non-ASCII text.
+    non_ascii = {char: lowered for char, lowered in case_map().items() if ord(char) > 0x7F}
+    lower_rest = f"translate(v, {_sql_literal(''.join(non_ascii))}, {_sql_literal(''.join(non_ascii.values()))})"
+    return (
+        "CREATE OR REPLACE FUNCTION snea_sort_key(p_text text) RETURNS text "
+        "LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$ "
+        f'DECLARE v text := lower({expr} COLLATE "C"); '
+        f"BEGIN IF octet_length(v) <> char_length(v) THEN v := {lower_rest}; END IF; "
+        f"RETURN regexp_replace(v, {_sql_literal(_LEADING_STRIP_SQL)}, ''); END $$;"
+    )
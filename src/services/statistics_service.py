@@ -1,129 +1,254 @@
 # Copyright (c) 2026 Brothertown Language
 # <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.database.connection import get_session
 from src.database.models.core import Language, Record, RecordLanguage, Source
+from src.database.models.meta import StatisticsSnapshot
 from src.database.models.workflow import EditHistory
 from src.logging_config import get_logger
 
 logger = get_logger("snea.services.statistics")
 
+# The snapshot is a single row; see StatisticsSnapshot.
+_SNAPSHOT_ID = 1
+
+# Safety net: recompute even without a recorded change after this long
+# (e.g. if the change triggers have not been installed yet).
+_SNAPSHOT_MAX_AGE = timedelta(minutes=10)
+
+# Number of recent edits kept in the snapshot; larger limits query live.
+_RECENT_ACTIVITY_CAP = 20
+
+# Triggers bump the "statistics" rows inside the writing transaction, so
+# this only counts committed writes (see ChangeCounter).
+_CHANGE_COUNT_SQL = "SELECT coalesce(sum(value), 0) FROM change_counters WHERE name = 'statistics'"
+
 
 class StatisticsService:
     """
     Service for retrieving linguistic and system statistics.
+
+    All aggregates are served from a single-row snapshot (statistics_snapshot)
+    that is recomputed only when the "statistics" change counter has advanced,
+    i.e. when a write to a tracked table has committed since the snapshot was
+    taken.
     """
 
     @classmethod
-    def get_summary_stats(cls) -> dict[str, int]:
+    def get_snapshot(cls) -> dict[str, Any]:
         """
-        Returns basic counts of records, sources, and languages.
+        Returns the current statistics snapshot, refreshing it first if stale.
+        The result includes a 'computed_at' freshness timestamp.
         """
         with get_session() as session:
             try:
-                record_count = session.query(func.count(Record.id)).scalar() or 0
-                source_count = session.query(func.count(Source.id)).scalar() or 0
+                row = session.execute(
+                    text(
+                        "SELECT s.payload, s.computed_at, s.change_seq, "
+                        f"({_CHANGE_COUNT_SQL}) AS current_seq "
+                        "FROM statistics_snapshot s WHERE s.id = :id"
+                    ),
+                    {"id": _SNAPSHOT_ID},
+                ).first()
+            except SQLAlchemyError as e:
+                # Snapshot or change counter not migrated yet: serve live aggregates.
+                logger.warning(f"Statistics snapshot unavailable, computing live: {e}")
+                session.rollback()
+                payload = cls._compute_payload(session)
+                payload["computed_at"] = datetime.now(UTC)
+                return payload
+
+            if row is not None:
+                payload, computed_at, change_seq, current_seq = row
+                is_fresh = change_seq == current_seq and datetime.now(UTC) - computed_at < _SNAPSHOT_MAX_AGE
+                if is_fresh:
+                    return {**payload, "computed_at": computed_at}
+
+            return cls._refresh_snapshot(session)
+
+    @classmethod
+    def refresh_snapshot(cls) -> dict[str, Any]:
+        """
+        Recomputes and stores the statistics snapshot unconditionally.
+        """
+        with get_session() as session:
+            return cls._refresh_snapshot(session)
 
-                # Count only languages that are actually assigned to records
-                language_count = session.query(func.count(func.distinct(RecordLanguage.language_id))).scalar() or 0
+    @classmethod
+    def _refresh_snapshot(cls, session) -> dict[str, Any]:
+        """Compute all aggregates and upsert them into statistics_snapshot."""
+        try:
+            # Read the counter before aggregating: writes that commit during the
+            # computation advance it further and mark this snapshot stale.
+            change_seq = session.execute(text(_CHANGE_COUNT_SQL)).scalar() or 0
+            payload = cls._compute_payload(session)
+            computed_at = datetime.now(UTC)
+
+            stmt = pg_insert(StatisticsSnapshot).values(
+                id=_SNAPSHOT_ID, payload=payload, change_seq=change_seq, computed_at=computed_at
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[StatisticsSnapshot.id],
+                set_={"payload": payload, "change_seq": change_seq, "computed_at": computed_at},
+            )
+            session.execute(stmt)
+            session.commit()
+            return {**payload, "computed_at": computed_at}
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error refreshing statistics snapshot: {e}")
+            raise
+
+    @staticmethod
+    def _compute_payload(session) -> dict[str, Any]:
+        """Run every dashboard aggregate once. Distributions are [key, count] pairs to keep order in JSON."""
+        record_count = session.query(func.count(Record.id)).scalar() or 0
+        source_count = session.query(func.count(Source.id)).scalar() or 0
+        # Count only languages that are actually assigned to records
+        language_count = session.query(func.count(func.distinct(RecordLanguage.language_id))).scalar() or 0
+
+        status = session.query(Record.status, func.count(Record.id)).group_by(Record.status).all()
+        pos = (
+            session.query(Record.ps, func.count(Record.id))
+            .group_by(Record.ps)
+            .order_by(desc(func.count(Record.id)))
+            .all()
+        )
+        sources = session.query(Source.name, func.count(Record.id)).join(Record).group_by(Source.name).all()
+
+        lang_rows = (
+            session.query(
+                Language.name,
+                func.count(RecordLanguage.id),
+                func.count(RecordLanguage.id).filter(RecordLanguage.is_primary == True),
+            )
+            .join(RecordLanguage)
+            .group_by(Language.name)
+            .all()
+        )
+
+        return {
+            "summary": {"records": record_count, "sources": source_count, "languages": language_count},
+            "status": [[s, c] for s, c in status],
+            "pos": [[ps if ps else "Unknown", c] for ps, c in pos],
+            "sources": [[name, c] for name, c in sources],
+            "languages_all": [[name, total] for name, total, _ in lang_rows],
+            "languages_primary": [[name, primary] for name, _, primary in lang_rows if primary],
+            "recent_activity": [
+                {**item, "timestamp": item["timestamp"].isoformat() if item["timestamp"] else None}
+                for item in StatisticsService._query_recent_activity(session, _RECENT_ACTIVITY_CAP)
+            ],
+        }
+
+    @staticmethod
+    def _query_recent_activity(session, limit: int) -> list[dict[str, Any]]:
+        """Most recent edits, joined to their record's lx in the same query."""
+        results = (
+            session.query(
+                EditHistory.record_id,
+                Record.lx,
+                EditHistory.user_email,
+                EditHistory.timestamp,
+                EditHistory.change_summary,
+            )
+            .outerjoin(Record, EditHistory.record_id == Record.id)
+            .order_by(desc(EditHistory.timestamp))
+            .limit(limit)
+            .all()
+        )
+        return [
+            {
+                "record_id": record_id,
+                "lx": lx if lx is not None else "Unknown",
+                "user": user_email,
+                "timestamp": timestamp,
+                "summary": summary,
+            }
+            for record_id, lx, user_email, timestamp, summary in results
+        ]
+
+    # Each helper reads one part of the snapshot. Pages that show several
+    # parts fetch get_snapshot() once and pass it in.
 
-                return {"records": record_count, "sources": source_count, "languages": language_count}
-            except Exception as e:
-                logger.error(f"Error fetching summary stats: {e}")
-                raise
+    @classmethod
+    def get_summary_stats(cls, snapshot: dict[str, Any] | None = None) -> dict[str, int]:
+        """
+        Returns basic counts of records, sources, and languages.
+        """
+        try:
+            return dict((snapshot or cls.get_snapshot())["summary"])
+        except Exception as e:
+            logger.error(f"Error fetching summary stats: {e}")
+            raise
 
     @classmethod
-    def get_status_distribution(cls) -> dict[str, int]:
+    def get_status_distribution(cls, snapshot: dict[str, Any] | None = None) -> dict[str, int]:
         """
         Returns the distribution of records by status.
         """
-        with get_session() as session:
-            try:
-                results = session.query(Record.status, func.count(Record.id)).group_by(Record.status).all()
-                return {status: count for status, count in results}
-            except Exception as e:
-                logger.error(f"Error fetching status distribution: {e}")
-                raise
+        try:
+            return dict((snapshot or cls.get_snapshot())["status"])
+        except Exception as e:
+            logger.error(f"Error fetching status distribution: {e}")
+            raise
 
     @classmethod
-    def get_top_parts_of_speech(cls, limit: int = 10) -> dict[str, int]:
+    def get_top_parts_of_speech(cls, limit: int = 10, snapshot: dict[str, Any] | None = None) -> dict[str, int]:
         """
         Returns the most common parts of speech.
         """
-        with get_session() as session:
-            try:
-                results = (
-                    session.query(Record.ps, func.count(Record.id))
-                    .group_by(Record.ps)
-                    .order_by(desc(func.count(Record.id)))
-                    .limit(limit)
-                    .all()
-                )
-                return {ps if ps else "Unknown": count for ps, count in results}
-            except Exception as e:
-                logger.error(f"Error fetching POS distribution: {e}")
-                raise
+        try:
+            return dict((snapshot or cls.get_snapshot())["pos"][:limit])
+        except Exception as e:
+            logger.error(f"Error fetching POS distribution: {e}")
+            raise
 
     @classmethod
-    def get_source_distribution(cls) -> dict[str, int]:
+    def get_source_distribution(cls, snapshot: dict[str, Any] | None = None) -> dict[str, int]:
         """
         Returns the count of records per source.
         """
-        with get_session() as session:
-            try:
-                results = session.query(Source.name, func.count(Record.id)).join(Record).group_by(Source.name).all()
-                return {name: count for name, count in results}
-            except Exception as e:
-                logger.error(f"Error fetching source distribution: {e}")
-                raise
+        try:
+            return dict((snapshot or cls.get_snapshot())["sources"])
+        except Exception as e:
+            logger.error(f"Error fetching source distribution: {e}")
+            raise
 
     @classmethod
-    def get_language_distribution(cls, primary_only: bool = True) -> dict[str, int]:
+    def get_language_distribution(
+        cls, primary_only: bool = True, snapshot: dict[str, Any] | None = None
+    ) -> dict[str, int]:
         """
         Returns the count of records per language.
         If primary_only is True, only counts is_primary=True mappings.
         """
-        with get_session() as session:
-            try:
-                query = (
-                    session.query(Language.name, func.count(RecordLanguage.id))
-                    .join(RecordLanguage)
-                    .group_by(Language.name)
-                )
-
-                if primary_only:
-                    query = query.filter(RecordLanguage.is_primary == True)
-
-                results = query.all()
-                return {name: count for name, count in results}
-            except Exception as e:
-                logger.error(f"Error fetching language distribution: {e}")
-                raise
+        try:
+            key = "languages_primary" if primary_only else "languages_all"
+            return dict((snapshot or cls.get_snapshot())[key])
+        except Exception as e:
+            logger.error(f"Error fetching language distribution: {e}")
+            raise
 
     @classmethod
-    def get_recent_activity(cls, limit: int = 5) -> list[dict[str, Any]]:
+    def get_recent_activity(cls, limit: int = 5, snapshot: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """
         Returns the most recent edits.
         """
-        with get_session() as session:
-            try:
-                results = session.query(EditHistory).order_by(desc(EditHistory.timestamp)).limit(limit).all()
-
-                activity = []
-                for entry in results:
-                    activity.append(
-                        {
-                            "record_id": entry.record_id,
-                            "lx": entry.record.lx if entry.record else "Unknown",
-                            "user": entry.user_email,
-                            "timestamp": entry.timestamp,
-                            "summary": entry.change_summary,
-                        }
-                    )
-                return activity
-            except Exception as e:
-                logger.error(f"Error fetching recent activity: {e}")
-                raise
+        try:
+            if limit > _RECENT_ACTIVITY_CAP:
+                with get_session() as session:
+                    return cls._query_recent_activity(session, limit)
+
+            return [
+                {**item, "timestamp": datetime.fromisoformat(item["timestamp"]) if item["timestamp"] else None}
+                for item in (snapshot or cls.get_snapshot())["recent_activity"][:limit]
+            ]
+        except Exception as e:
+            logger.error(f"Error fetching recent activity: {e}")
+            raise
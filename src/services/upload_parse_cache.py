@@ -0,0 +1,130 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""
+Process-wide cache of parsed MDF uploads, keyed by content digest.
+
+The upload page re-runs top to bottom on every widget interaction while a
+file is active. Parsing is deterministic, so the parsed entries, the
+summary projection and the raw-preview line index are stored once per
+distinct file content (SHA-256) and shared across reruns and sessions.
+Eviction is least-recently-used, bounded by total cached content size.
+
+Cached entries are shared: callers must treat them as read-only.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+# Upper bound on the summed size of cached upload contents (characters)
+DEFAULT_MAX_CHARS = 64 * 1024 * 1024
+DEFAULT_MAX_ITEMS = 16
+
+_LINE_START = re.compile(r"\n")
+
+
+@dataclass(frozen=True)
+class ParsedUpload:
+    """Parse result for one upload content digest."""
+
+    digest: str
+    size: int
+    entries: list[dict] = field(default_factory=list)
+    summary_rows: list[dict] = field(default_factory=list)
+    line_starts: tuple[int, ...] = ()
+    error: str | None = None
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_starts)
+
+    def preview_page(self, content: str, page: int, page_size: int) -> str:
+        """Return lines [page*page_size, (page+1)*page_size) of ``content`` without splitting it."""
+        first = page * page_size
+        if first >= self.line_count:
+            return ""
+        last = first + page_size
+        start = self.line_starts[first]
+        end = self.line_starts[last] - 1 if last < self.line_count else len(content)
+        return content[start:end]
+
+
+def content_digest(content: str) -> str:
+    """SHA-256 hex digest of upload content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class UploadParseCache:
+    """Thread-safe LRU of ParsedUpload objects bounded by total content size."""
+
+    def __init__(self, max_chars: int = DEFAULT_MAX_CHARS, max_items: int = DEFAULT_MAX_ITEMS):
+        self.max_chars = max_chars
+        self.max_items = max_items
+        self._items: OrderedDict[tuple, ParsedUpload] = OrderedDict()
+        self._total_chars = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get_or_parse(self, content: str, parse: Callable[[str], list[dict]]) -> ParsedUpload:
+        """Return the cached parse of ``content``, running ``parse`` on a miss.
+
+        A ValueError from ``parse`` is cached as ``error`` so that invalid
+        files are not re-parsed on every rerun either.
+        """
+        digest = content_digest(content)
+        # Keyed by parser as well as content: after a hot-reload the parse
+        # function is a new object and must not be served the old output.
+        key = (parse, digest)
+        with self._lock:
+            cached = self._items.get(key)
+            if cached is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        # Parse outside the lock; a concurrent miss on the same digest just parses twice.
+        try:
+            entries = parse(content)
+            error = None
+        except ValueError as e:
+            entries, error = [], str(e)
+
+        parsed = ParsedUpload(
+            digest=digest,
+            size=len(content),
+            entries=entries,
+            summary_rows=[{"lx": e.get("lx", ""), "ps": e.get("ps", ""), "ge": e.get("ge", "")} for e in entries],
+            line_starts=(0, *(m.end() for m in _LINE_START.finditer(content))),
+            error=error,
+        )
+        self._store(key, parsed)
+        return parsed
+
+    def _store(self, key: tuple, parsed: ParsedUpload) -> None:
+        if parsed.size > self.max_chars:
+            return
+        with self._lock:
+            if key in self._items:
+                return
+            self._items[key] = parsed
+            self._total_chars += parsed.size
+            while self._items and (self._total_chars > self.max_chars or len(self._items) > self.max_items):
+                _, evicted = self._items.popitem(last=False)
+                self._total_chars -= evicted.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._total_chars = 0
+
+
+# Shared by every session in this Streamlit server process
+parse_cache = UploadParseCache()
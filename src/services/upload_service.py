@@ -4,7 +4,6 @@
 Upload Service for MDF file upload, staging, matching, and commit operations.
 """
 
-import difflib
 import re
 import unicodedata
 import uuid
@@ -21,7 +20,12 @@ from src.database.models.workflow import EditHistory, MatchupQueue
 from src.logging_config import get_logger
 from src.mdf.parser import format_mdf_record, normalize_nt_record, parse_mdf
 from src.services.audit_service import AuditService
+from src.services.history_store import compact_history_tail, delete_history, history_entry, load_history_data
 from src.services.linguistic_service import LinguisticService
+from src.services.match_scoring import CandidateScorer
+from src.services.parsed_record import parsed_entry
+from src.services.review_page_loader import lx_base_form, lx_base_form_expr
+from src.services.search_index import KIND_GLOSS, KIND_HEADWORD, KIND_SEARCH, search_rows, search_triggers_active
 
 logger = get_logger("snea.upload")
 
@@ -213,7 +217,7 @@ class UploadService:
 
         session = get_session()
         try:
-            base_lx = _strip_diacritics(lx).lower()
+            base_lx = lx_base_form(lx)
 
             # Query for exact match or base form match in other sources
             matches = (
@@ -221,15 +225,7 @@ class UploadService:
                 .join(Record, Record.source_id == Source.id)
                 .filter(Record.source_id != current_source_id)
                 .filter(Record.is_deleted == False)
-                .filter(
-                    (Record.lx == lx)
-                    | (
-                        func.lower(
-                            func.translate(Record.lx, "áàâäãåāéèêëēíìîïīóòôöõøōúùûüū", "aaaaaaaeeeeeiiiiiooooooouuuuu")
-                        )
-                        == base_lx
-                    )
-                )
+                .filter((Record.lx == lx) | (lx_base_form_expr(Record.lx) == base_lx))
                 .distinct()
                 .all()
             )
@@ -358,19 +354,9 @@ class UploadService:
                     stripped = UploadService._strip_nt_record_lines(mdf_text)
                     return "\n".join(line for line in stripped.split("\n") if line.strip())
 
-                def _extract_first_nt(mdf_text: str) -> str | None:
-                    """Return the first \\nt value that is not a \\nt Record: line."""
-                    for line in mdf_text.split("\n"):
-                        s = line.lstrip()
-                        if s.startswith("\\nt "):
-                            val = s[len("\\nt ") :].strip()
-                            # Skip \nt Record: <digits> lines
-                            if val.startswith("Record:"):
-                                remainder = val[len("Record:") :].strip()
-                                if remainder.isdigit():
-                                    continue
-                            return val or None
-                    return None
+                # Candidate features (lowercased \ge, first \nt) are extracted once
+                # per chunk and scored in batch; see src/services/match_scoring.py.
+                scorer = CandidateScorer(candidate_mdf_map)
 
                 # 3. Targeted Query for OTHER Source existence
                 # We want to know if these LXs exist elsewhere
@@ -422,35 +408,14 @@ class UploadService:
                     # A single exact-lx candidate with a low \ge similarity is rejected so that
                     # the base-form fallback (section C) can find the correct diacritic variant.
                     _GE_ACCEPT_THRESHOLD = 0.4
-                    parsed_ge_lower = (parsed_ge or "").lower()
-                    parsed_nt_lower = (parsed_nt or "").lower()
-
-                    def _score_candidate(c):
-                        hm_match = parsed_hm is not None and c.hm == parsed_hm
-                        ge_score = (
-                            difflib.SequenceMatcher(None, parsed_ge_lower, (c.ge or "").lower()).ratio()
-                            if parsed_ge is not None
-                            else 0.0
-                        )
-                        nt_score = (
-                            difflib.SequenceMatcher(
-                                None,
-                                parsed_nt_lower,
-                                (_extract_first_nt(candidate_mdf_map.get(c.id, "")) or "").lower(),
-                            ).ratio()
-                            if parsed_nt is not None
-                            else 0.0
-                        )
-                        return (hm_match, ge_score, nt_score)
 
                     if not suggested_record_id and row.lx in chunk_exact_map:
                         candidates = chunk_exact_map[row.lx]
-                        best = max(candidates, key=_score_candidate)
-                        best_score = _score_candidate(best)
-                        best_ge_score = best_score[1]
+                        best, _ = scorer.best(candidates, parsed_hm, parsed_ge, parsed_nt)
                         # Reject if \ge is available and best candidate similarity is too low.
                         # This allows the base-form fallback to find a better diacritic match.
-                        if parsed_ge is None or best_ge_score >= _GE_ACCEPT_THRESHOLD:
+                        # The threshold is a difflib ratio, so compare ge_ratio, not the ranking score.
+                        if parsed_ge is None or scorer.ge_ratio(parsed_ge, best) >= _GE_ACCEPT_THRESHOLD:
                             suggested_record_id = best.id
                             suggested_lx = best.lx
                             match_type = "exact"
@@ -488,13 +453,7 @@ class UploadService:
                             if len(ge_matches) == 1:
                                 ge_match = ge_matches[0]
                             else:
-                                upload_lx = (row.lx or "").lower()
-                                ge_match = max(
-                                    ge_matches,
-                                    key=lambda m: difflib.SequenceMatcher(
-                                        None, upload_lx, (m.lx or "").lower()
-                                    ).ratio(),
-                                )
+                                ge_match = scorer.best_by_text(row.lx or "", ge_matches, "lx")
                             suggested_record_id = ge_match.id
                             suggested_lx = ge_match.lx
                             match_type = "ge_match"
@@ -519,11 +478,11 @@ class UploadService:
                         )
                         if base_candidates:
                             # Populate candidate_mdf_map for base-form candidates so that
-                            # _score_candidate can compute a real nt_score for tiebreaking.
+                            # the scorer can compute a real nt_score for tiebreaking.
                             for bc in base_candidates:
                                 if bc.id not in candidate_mdf_map and bc.mdf_data:
                                     candidate_mdf_map[bc.id] = bc.mdf_data
-                            best_base = max(base_candidates, key=_score_candidate)
+                            best_base, _ = scorer.best(base_candidates, parsed_hm, parsed_ge, parsed_nt)
                             suggested_record_id = best_base.id
                             suggested_lx = best_base.lx
                             match_type = "base_form"
@@ -1312,8 +1271,9 @@ class UploadService:
 
                 # current_version is auto-incremented by SQLAlchemy optimistic locking
                 next_version = record.current_version + 1
+                compact_history_tail(session, [record.id])
                 session.add(
-                    EditHistory(
+                    history_entry(
                         record_id=record.id,
                         user_email=user_email,
                         session_id=session_id,
@@ -1353,7 +1313,7 @@ class UploadService:
                 formatted = format_mdf_record(normalized)
                 new_record.mdf_data = formatted
                 session.add(
-                    EditHistory(
+                    history_entry(
                         record_id=new_record.id,
                         user_email=user_email,
                         session_id=session_id,
@@ -1386,7 +1346,7 @@ class UploadService:
                 formatted = format_mdf_record(normalized)
                 new_record.mdf_data = formatted
                 session.add(
-                    EditHistory(
+                    history_entry(
                         record_id=new_record.id,
                         user_email=user_email,
                         session_id=session_id,
@@ -1529,6 +1489,7 @@ class UploadService:
         session = get_session()
         try:
             rows = session.query(MatchupQueue).filter_by(batch_id=batch_id, status="matched").all()
+            compact_history_tail(session, list({r.suggested_record_id for r in rows if r.suggested_record_id}))
             count = 0
             total = len(rows)
             updated_record_ids = []
@@ -1554,7 +1515,7 @@ class UploadService:
                 # current_version is auto-incremented by SQLAlchemy optimistic locking
                 next_version = record.current_version + 1
                 session.add(
-                    EditHistory(
+                    history_entry(
                         record_id=record.id,
                         user_email=user_email,
                         session_id=session_id,
@@ -1645,7 +1606,7 @@ class UploadService:
                 formatted = format_mdf_record(normalized)
                 new_record.mdf_data = formatted
                 session.add(
-                    EditHistory(
+                    history_entry(
                         record_id=new_record.id,
                         user_email=user_email,
                         session_id=session_id,
@@ -1715,7 +1676,7 @@ class UploadService:
                 formatted = format_mdf_record(normalized)
                 new_record.mdf_data = formatted
                 session.add(
-                    EditHistory(
+                    history_entry(
                         record_id=new_record.id,
                         user_email=user_email,
                         session_id=session_id,
@@ -1756,7 +1717,13 @@ class UploadService:
 
     @staticmethod
     def populate_search_entries(record_ids: list[int], session=None) -> int:
-        """Rebuild search_entries for given record ids. Returns count created."""
+        """Rebuild search_entries for given record ids. Returns count created.
+
+        A no-op once the search triggers are installed (SNEA_SEARCH_MAINTENANCE=trigger):
+        the records write that precedes every call has already rebuilt them.
+        """
+        if search_triggers_active():
+            return 0
         _provided_session = session is not None
         if not _provided_session:
             session = get_session()
@@ -1767,71 +1734,47 @@ class UploadService:
 
             _fts_table_exists = sa_inspect(session.get_bind()).has_table("fts_entries")
 
-            for rid in record_ids:
-                record = session.get(Record, rid)
-                if not record:
-                    continue
-                # Delete existing search entries
-                session.query(SearchEntry).filter_by(record_id=rid).delete()
-                session.query(HeadwordSearchEntry).filter_by(record_id=rid).delete()
-                session.query(GlossSearchEntry).filter_by(record_id=rid).delete()
-                if _fts_table_exists:
-                    session.query(FTSEntry).filter_by(record_id=rid).delete()
-                session.flush()
-
-                # Re-parse MDF to extract searchable fields
-                from src.mdf.parser import parse_mdf as _parse
-
-                try:
-                    parsed = _parse(record.mdf_data)
-                except ValueError:
-                    continue
-                if not parsed:
-                    continue
-                entry = parsed[0]
+            records = session.query(Record).filter(Record.id.in_(record_ids)).all() if record_ids else []
+            if not records:
+                return 0
+            found_ids = [r.id for r in records]
+
+            # Delete existing search entries for the whole batch at once
+            search_models = [SearchEntry, HeadwordSearchEntry, GlossSearchEntry]
+            if _fts_table_exists:
+                search_models.append(FTSEntry)
+            for model in search_models:
+                session.query(model).filter(model.record_id.in_(found_ids)).delete()
+            session.flush()
 
-                # Insert lx
-                if entry.get("lx"):
-                    term = entry["lx"]
-                    norm = LinguisticService.generate_sort_lx(term)
-                    session.add(SearchEntry(record_id=rid, term=term, normalized_term=norm, entry_type="lx"))
-                    total += 1
-                # Insert va, se, cf, ve lists (deduplicate per record)
-                seen = set()
-                for field in ("va", "se", "cf", "ve"):
-                    for val in entry.get(field, []):
-                        if val and (val, field) not in seen:
-                            seen.add((val, field))
-                            norm = LinguisticService.generate_sort_lx(val)
-                            session.add(SearchEntry(record_id=rid, term=val, normalized_term=norm, entry_type=field))
-                            total += 1
-
-                # Populate headword_search_entries (PRIMARY lx and va)
-                if entry.get("lx"):
-                    term = entry["lx"]
-                    norm = LinguisticService.generate_sort_lx(term)
-                    session.add(HeadwordSearchEntry(record_id=rid, entry_type="lx", term=term, normalized_term=norm))
-                    total += 1
-                for val in entry.get("primary_va", []):
-                    if val:
-                        norm = LinguisticService.generate_sort_lx(val)
-                        session.add(HeadwordSearchEntry(record_id=rid, entry_type="va", term=val, normalized_term=norm))
-                        total += 1
-
-                # Populate gloss_search_entries (PRIMARY ge)
-                if entry.get("ge"):
-                    term = entry["ge"]
-                    norm = LinguisticService.generate_sort_lx(term)
-                    session.add(GlossSearchEntry(record_id=rid, term=term, normalized_term=norm))
+            for record in records:
+                rid = record.id
+                # Searchable fields come from the persisted parse
+                for row in search_rows(parsed_entry(record), record.mdf_data, with_fts=_fts_table_exists):
+                    if row.kind == KIND_SEARCH:
+                        session.add(
+                            SearchEntry(
+                                record_id=rid,
+                                term=row.term,
+                                normalized_term=row.normalized_term,
+                                entry_type=row.entry_type,
+                            )
+                        )
+                    elif row.kind == KIND_HEADWORD:
+                        session.add(
+                            HeadwordSearchEntry(
+                                record_id=rid,
+                                entry_type=row.entry_type,
+                                term=row.term,
+                                normalized_term=row.normalized_term,
+                            )
+                        )
+                    elif row.kind == KIND_GLOSS:
+                        session.add(GlossSearchEntry(record_id=rid, term=row.term, normalized_term=row.normalized_term))
+                    else:
+                        session.add(FTSEntry(record_id=rid, fts_vector=func.to_tsvector("simple", row.normalized_term)))
                     total += 1
 
-                # Populate fts_entries for FTS mode (guard: table may not exist yet)
-                if _fts_table_exists:
-                    norm_mdf = LinguisticService.generate_sort_lx(record.mdf_data)
-                    if norm_mdf:
-                        session.add(FTSEntry(record_id=rid, fts_vector=func.to_tsvector("simple", norm_mdf)))
-                        total += 1
-
             if not _provided_session:
                 session.commit()
             return total
@@ -1843,6 +1786,33 @@ class UploadService:
             if not _provided_session:
                 session.close()
 
+    @staticmethod
+    def _reprocess_record(session, record) -> bool:
+        """Re-derive metadata, languages and search entries of one record from its MDF.
+
+        Returns False, leaving the record untouched, when the MDF does not parse.
+        """
+        # 1. Parsed MDF (re-derived if stamped by an older parser)
+        entry = parsed_entry(record)
+        if not entry:
+            return False
+
+        # 2. Update Record fields from MDF
+        record.lx = entry.get("lx", record.lx)
+        record.hm = entry.get("hm", 1)
+        record.ps = entry.get("ps", "")
+        record.ge = entry.get("ge", "")
+        record.source_page = entry.get("source_page", "")
+        record.sort_lx = LinguisticService.generate_sort_lx(record.lx)
+
+        # 3. Update Languages
+        UploadService._update_record_languages(session, record, entry.get("lg", []))
+
+        # 4. Update Search Entries
+        # We pass the existing session to avoid nested transaction issues
+        UploadService.populate_search_entries([record.id], session=session)
+        return True
+
     @staticmethod
     def reprocess_all_records(progress_callback: Callable | None = None, session=None) -> dict:
         """Reprocess languages and search entries for all non-deleted records.
@@ -1866,29 +1836,9 @@ class UploadService:
             _logger.info(f"Starting reprocessing of {total} records.")
 
             for i, record in enumerate(records):
-                # 1. Parse MDF
-                from src.mdf.parser import parse_mdf as _parse
-
-                parsed = _parse(record.mdf_data)
-                if not parsed:
+                if not UploadService._reprocess_record(session, record):
                     _logger.warning(f"Failed to parse MDF for record {record.id}")
                     continue
-                entry = parsed[0]
-
-                # 2. Update Record fields from MDF
-                record.lx = entry.get("lx", record.lx)
-                record.hm = entry.get("hm", 1)
-                record.ps = entry.get("ps", "")
-                record.ge = entry.get("ge", "")
-                record.source_page = entry.get("source_page", "")
-                record.sort_lx = LinguisticService.generate_sort_lx(record.lx)
-
-                # 3. Update Languages
-                UploadService._update_record_languages(session, record, entry.get("lg", []))
-
-                # 4. Update Search Entries
-                # We pass the existing session to avoid nested transaction issues
-                UploadService.populate_search_entries([record.id], session=session)
 
                 # Commit per-record to prevent autoflush PK collisions on next iteration
                 session.commit()
@@ -1969,10 +1919,11 @@ class UploadService:
                 return {"rolled_back_count": 0, "deleted_count": 0, "skipped_count": 0}
 
             # Map of record_id to the earliest prev_data in this session
-            record_changes = {}
+            first_entries = {}
             for h in history_entries:
-                if h.record_id not in record_changes:
-                    record_changes[h.record_id] = h.prev_data
+                first_entries.setdefault(h.record_id, h)
+            snapshots = load_history_data(session, first_entries.values())
+            record_changes = {rid: snapshots[h.id].prev_data for rid, h in first_entries.items()}
 
             rolled_back = 0
             deleted = 0
@@ -2015,18 +1966,16 @@ class UploadService:
                     # Record was updated -> restore from prev_data
                     record.mdf_data = prev_data
 
-                    from src.mdf.parser import parse_mdf as _parse
-
-                    parsed = _parse(prev_data)
-                    if parsed:
-                        entry = parsed[0]
+                    entry = parsed_entry(record)
+                    if entry:
                         record.lx = entry.get("lx")
                         record.hm = entry.get("hm", 1)
                         record.ps = entry.get("ps", "")
                         record.ge = entry.get("ge", "")
 
-                    # Delete history entries for this session for this record
-                    session.query(EditHistory).filter_by(session_id=session_id, record_id=rid).delete()
+                    # Delete history entries for this session for this record; later
+                    # deltas may be based on them
+                    delete_history(session, EditHistory.session_id == session_id, EditHistory.record_id == rid)
                     rolled_back += 1
 
                     # Repopulate search entries
@@ -2080,18 +2029,19 @@ class UploadService:
                 return {"reverted_count": 0, "skipped_locked": 0, "already_current": 0}
 
             # Map record_id -> post-import snapshot (current_data of earliest session entry)
-            post_import_snapshots: dict[int, str] = {}
+            first_entries = {}
             for h in history_entries:
-                if h.record_id not in post_import_snapshots:
-                    post_import_snapshots[h.record_id] = h.current_data
+                first_entries.setdefault(h.record_id, h)
+            snapshots = load_history_data(session, first_entries.values())
+            post_import_snapshots: dict[int, str] = {
+                rid: snapshots[h.id].current_data for rid, h in first_entries.items()
+            }
 
             reverted = 0
             skipped_locked = 0
             already_current = 0
             total = len(post_import_snapshots)
 
-            from src.mdf.parser import parse_mdf as _parse
-
             for i, (rid, post_import_data) in enumerate(post_import_snapshots.items(), 1):
                 record = session.get(Record, rid)
                 if not record:
@@ -2131,9 +2081,8 @@ class UploadService:
 
                 # Restore to post-import snapshot
                 record.mdf_data = post_import_data
-                parsed = _parse(post_import_data)
-                if parsed:
-                    entry = parsed[0]
+                entry = parsed_entry(record)
+                if entry:
                     record.lx = entry.get("lx")
                     record.hm = entry.get("hm", 1)
                     record.ps = entry.get("ps", "")
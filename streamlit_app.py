@@ -147,6 +147,11 @@ def _initialize_database():
 
                 # 3. Schema initialization
                 init_db()
+
+                # 4. Drain queued derived-data rebuilds in the background
+                from src.services.derived_data_queue import derived_data_indexer
+
+                derived_data_indexer.start()
                 status.empty()
                 return  # success
             except Exception as e:
@@ -300,14 +305,23 @@ def main():
 
     # Run the selected page
     logger.debug("Running page: %s", getattr(pg, "title", pg))
+    from src.services.render_profiler import profile_render
+
     try:
-        pg.run()
+        with profile_render(getattr(pg, "title", str(pg))):
+            pg.run()
     except Exception as e:
         from src.frontend.ui_utils import handle_ui_error
 
         mastodon_url = st.secrets.get("contact", {}).get("mastodon_url")
         contact = f" Please report this issue on Mastodon: {mastodon_url}" if mastodon_url else ""
         handle_ui_error(e, f"An unexpected error occurred.{contact}", logger_name="snea.app")
+    finally:
+        # Write back preference changes deferred during this run, including
+        # runs cut short by st.rerun()/st.stop()
+        from src.services.preference_service import PreferenceService
+
+        PreferenceService.flush_deferred_preferences()
 
 
 if __name__ == "__main__":
@@ -24,6 +24,7 @@ mock_linguistic.get_edit_history.return_value = []
 
 mock_preference = MagicMock()
 mock_preference.get_preference.return_value = "25"
+mock_preference.get_cached_preference.return_value = "25"
 
 mock_identity = MagicMock()
 mock_identity.get_github_username.return_value = "tester"
@@ -0,0 +1,95 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""Parity between snea_sort_key() in PostgreSQL and sort_key() in Python.
+
+Migrations renormalize sort keys in SQL, so any divergence would silently
+re-sort the corpus differently from what the app writes on edit.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import text
+
+# Ensure private database is used
+os.environ["OPENCODE"] = "1"
+
+from src.database.connection import init_db
+from src.database.migrations import MigrationManager
+from src.services.sort_key import sort_key
+
+EDGE_CASES = [
+    "",
+    "Wôk",
+    "ÀÉÎÕÜ ñ ç",
+    "‘quoted’ “word” ‚a‛ „‟",
+    "maʼaw ʹx ´y",
+    "∞ht",
+    "w∞∞d",
+    "✔ checked",
+    "123 word",
+    "*-=[]() \t\nroot",
+    "(1) -ash",
+    "ẅ̃ǭ",
+    "Ω ΣΑΣ",
+    "ạ̧́b",
+    "ς σ Σ",
+    "\u00a0\u3000\u2003word",
+    "KELVIN \u212a İstanbul ǅ",
+    "ΆΈΉ ÆØÅ ŊƏ",
+]
+
+CORPUS_QUERIES = [
+    "SELECT lx FROM records WHERE lx IS NOT NULL",
+    "SELECT mdf_data FROM records WHERE mdf_data IS NOT NULL",
+    "SELECT term FROM search_entries",
+    "SELECT term FROM gloss_search_entries",
+]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Provide a database engine initialized via init_db."""
+    return init_db()
+
+
+def _mismatches(conn, values):
+    sql_keys = conn.execute(
+        text("SELECT v, snea_sort_key(v) FROM unnest(CAST(:values AS text[])) AS t(v)"),
+        {"values": list(values)},
+    )
+    return [(value, key, sort_key(value)) for value, key in sql_keys if key != sort_key(value)]
+
+
+def test_edge_cases_match(engine):
+    with engine.connect() as conn:
+        assert _mismatches(conn, EDGE_CASES) == []
+
+
+def test_null_is_empty(engine):
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT snea_sort_key(NULL)")).scalar() == ""
+
+
+@pytest.mark.parametrize("query", CORPUS_QUERIES)
+def test_corpus_matches(engine, query):
+    with engine.connect() as conn:
+        values = {value for (value,) in conn.execute(text(query))}
+        assert _mismatches(conn, values) == []
+
+
+def test_renormalize_rewrites_stale_keys(engine):
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS sort_key_probe (term text, normalized_term text)"))
+        conn.execute(text("INSERT INTO sort_key_probe VALUES ('Wôk', 'wok'), ('∞ht', 'stale'), ('Ana', NULL)"))
+        conn.commit()
+    try:
+        MigrationManager(engine)._renormalize_sort_keys([("sort_key_probe", "normalized_term", "term")])
+        with engine.connect() as conn:
+            rows = dict(conn.execute(text("SELECT term, normalized_term FROM sort_key_probe")).all())
+    finally:
+        with engine.connect() as conn:
+            conn.execute(text("DROP TABLE IF EXISTS sort_key_probe"))
+            conn.commit()
+
+    assert rows == {"Wôk": "wok", "∞ht": "oozzzht", "Ana": "ana"}
@@ -0,0 +1,89 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.exc import ProgrammingError
+
+from src.database import connection
+from src.database.migrations import MigrationManager
+
+# Register every model so the fingerprint covers the full schema
+from src.database.models import core, identity, iso639, meta, search, workflow  # noqa: F401
+from src.services import search_index
+from src.services.search_index import SEARCH_MAINTENANCE_ENV
+
+
+class TestStartupFingerprint(unittest.TestCase):
+    def test_stable_across_calls(self):
+        manager = MigrationManager(MagicMock())
+        self.assertEqual(manager.startup_fingerprint(), manager.startup_fingerprint())
+
+    def test_changes_with_new_migration(self):
+        manager = MigrationManager(MagicMock())
+        before = manager.startup_fingerprint()
+        latest = max(v for v, _, _ in MigrationManager._MIGRATIONS)
+        with patch.object(MigrationManager, "_MIGRATIONS", [*MigrationManager._MIGRATIONS, (latest + 1, "_x", "x")]):
+            self.assertNotEqual(manager.startup_fingerprint(), before)
+
+    def test_changes_with_migration_below_latest(self):
+        manager = MigrationManager(MagicMock())
+        before = manager.startup_fingerprint()
+        earliest = min(v for v, _, _ in MigrationManager._MIGRATIONS)
+        with patch.object(MigrationManager, "_MIGRATIONS", [*MigrationManager._MIGRATIONS, (earliest + 1, "_x", "x")]):
+            self.assertNotEqual(manager.startup_fingerprint(), before)
+
+    def test_changes_with_search_maintenance_mode(self):
+        manager = MigrationManager(MagicMock())
+        with patch.dict(os.environ, {SEARCH_MAINTENANCE_ENV: "app"}):
+            app = manager.startup_fingerprint()
+        with patch.dict(os.environ, {SEARCH_MAINTENANCE_ENV: "trigger"}):
+            self.assertNotEqual(manager.startup_fingerprint(), app)
+
+    def test_missing_table_is_not_current(self):
+        engine = MagicMock()
+        engine.connect.return_value.__enter__.return_value.execute.side_effect = ProgrammingError("x", {}, None)
+        self.assertFalse(MigrationManager(engine).fingerprint_is_current("abc"))
+
+
+class TestInitDbFastPath(unittest.TestCase):
+    def setUp(self):
+        self.engine = MagicMock()
+        for target, attr in (
+            ("src.database.connection.get_engine", "get_engine"),
+            ("src.database.connection.reset_sequences", "reset_sequences"),
+            ("src.database.base.Base.metadata.create_all", "create_all"),
+            ("src.database.migrations.MigrationManager.run_all", "run_all"),
+            ("src.database.migrations.MigrationManager.record_fingerprint", "record_fingerprint"),
+            ("src.services.search_index.sync_search_triggers", "sync_triggers"),
+        ):
+            patcher = patch(target)
+            setattr(self, attr, patcher.start())
+            self.addCleanup(patcher.stop)
+        self.get_engine.return_value = self.engine
+        self.addCleanup(setattr, search_index, "_triggers_active", False)
+
+    def test_current_fingerprint_skips_initialization(self):
+        with (
+            patch("src.database.migrations.MigrationManager.fingerprint_is_current", return_value=True),
+            patch.dict(os.environ, {SEARCH_MAINTENANCE_ENV: "trigger"}),
+        ):
+            self.assertIs(connection.init_db(), self.engine)
+        for step in (self.create_all, self.run_all, self.sync_triggers, self.reset_sequences, self.record_fingerprint):
+            step.assert_not_called()
+        self.assertTrue(search_index.search_triggers_active())
+        self.assertEqual(set(connection.startup_timings), {"fingerprint", "fingerprint_check", "total"})
+
+    def test_stale_fingerprint_runs_every_phase_and_records_it(self):
+        with patch("src.database.migrations.MigrationManager.fingerprint_is_current", return_value=False):
+            connection.init_db()
+        self.create_all.assert_called_once_with(self.engine)
+        self.run_all.assert_called_once()
+        self.reset_sequences.assert_called_once_with(self.engine)
+        self.record_fingerprint.assert_called_once()
+        self.assertIn("reset_sequences", connection.startup_timings)
+
+
+if __name__ == "__main__":
+    unittest.main()
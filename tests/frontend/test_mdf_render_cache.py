@@ -0,0 +1,57 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import unittest
+from unittest.mock import patch
+
+from src.frontend import ui_utils
+
+
+class TestMdfRenderCache(unittest.TestCase):
+    def setUp(self):
+        ui_utils._mdf_record_html.cache_clear()
+        ui_utils.format_mdf_for_display.cache_clear()
+
+    def test_record_html_is_memoized_by_content_and_mode(self):
+        with patch("src.mdf.validator.MDFValidator.diagnose_record", return_value=[{"status": "ok"}]) as diagnose:
+            first = ui_utils._mdf_record_html("\\lx a", True)
+            again = ui_utils._mdf_record_html("\\lx a", True)
+            plain = ui_utils._mdf_record_html("\\lx a", False)
+        self.assertIs(first, again)
+        self.assertEqual(diagnose.call_count, 1)
+        self.assertIn("\\lx a", plain)
+        self.assertEqual(ui_utils._mdf_record_html.cache_info().hits, 1)
+
+    def test_fragment_has_no_style_or_script(self):
+        fragment = ui_utils._mdf_record_html("\\lx <a>\n\\ge b", False)
+        self.assertTrue(fragment.startswith('<div class="mdf-wrap-block">'))
+        self.assertNotIn("<style", fragment)
+        self.assertNotIn("<script", fragment)
+        self.assertIn("&lt;a&gt;", fragment)
+
+    def test_diagnostics_and_spans_are_rendered(self):
+        html = ui_utils._mdf_block_html(
+            "\\lx a\n\\ge b",
+            [
+                {"status": "ok"},
+                {
+                    "status": "diff",
+                    "message": "changed",
+                    "spans": [{"text": "\\ge ", "changed": False}, {"text": "b", "changed": True}],
+                },
+            ],
+        )
+        self.assertIn('class="mdf-line status-diff" title="changed"', html)
+        self.assertIn('<mark class="diff-token">b</mark>', html)
+
+    @patch("streamlit.html")
+    def test_render_paths_emit_one_element_each(self, mock_html):
+        ui_utils.inject_mdf_styles()
+        ui_utils.render_mdf_record("\\lx a", False, key="r1")
+        ui_utils.render_mdf_block("\\lx a", key="r2")
+        self.assertEqual(mock_html.call_count, 3)
+        self.assertIn("<style>", mock_html.call_args_list[0][0][0])
+        self.assertEqual(mock_html.call_args_list[1][0][0], mock_html.call_args_list[2][0][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+"""Tests for the upload review page's per-batch cache."""
+
+import unittest
+
+import streamlit as st
+
+from src.frontend.pages.upload_mdf import _invalidate_review_cache, _review_batch_cache
+
+
+class TestReviewBatchCache(unittest.TestCase):
+    def setUp(self):
+        _invalidate_review_cache()
+
+    def test_cache_is_kept_per_batch(self):
+        cache = _review_batch_cache("batch-a")
+        cache["locked_conflict_count"] = 3
+        self.assertIs(_review_batch_cache("batch-a"), cache)
+        self.assertIsNone(_review_batch_cache("batch-b")["locked_conflict_count"])
+
+    def test_invalidate_drops_cache(self):
+        _review_batch_cache("batch-a")["locked_conflict_count"] = 3
+        _invalidate_review_cache()
+        self.assertNotIn("review_page_cache", st.session_state)
+        self.assertIsNone(_review_batch_cache("batch-a")["locked_conflict_count"])
+
+
+if __name__ == "__main__":
+    unittest.main()
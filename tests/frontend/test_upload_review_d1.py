@@ -1312,8 +1312,8 @@ class TestReviewFiltering(unittest.TestCase):
     @patch("streamlit.sidebar")
     @patch("streamlit.selectbox")
     @patch("streamlit.rerun")
-    @patch("src.services.preference_service.PreferenceService.get_preference", return_value="10")
-    @patch("src.services.preference_service.PreferenceService.set_preference")
+    @patch("src.services.preference_service.PreferenceService.get_cached_preference", return_value="10")
+    @patch("src.services.preference_service.PreferenceService.set_preference_deferred")
     def test_page_size_change_resets_current_page(
         self, mock_set_pref, mock_get_pref, mock_rerun, mock_selectbox, mock_sidebar, mock_get_session
     ):
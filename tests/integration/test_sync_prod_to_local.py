@@ -0,0 +1,121 @@
+# Copyright (c) 2026 Brothertown Language
+import unittest
+import uuid
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from scripts.sync_prod_to_local import (
+    ProdSnapshot,
+    full_sync,
+    get_function_definitions,
+    get_schema_metadata,
+    incremental_sync,
+    max_tracked_ids,
+)
+from src.database.connection import get_session, init_db
+from src.database.migrations import MigrationManager
+from src.database.models.core import Record, Source
+from src.database.models.identity import User
+from src.database.models.workflow import EditHistory
+from src.services.history_store import STORAGE_DELTA, compact_history_tail, history_entry, load_history_data
+from src.services.upload_service import UploadService
+
+LOCAL_DB = "sync_prod_to_local_test"
+USER_EMAIL = "sync@example.com"
+HISTORY_SQL = "SELECT id, record_id, storage, base_id, current_data FROM edit_history ORDER BY id"
+
+
+class TestIncrementalSync(unittest.TestCase):
+    """Syncs the test database ("prod") into a second database on the same server."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.prod_engine = init_db()
+        admin = create_engine(cls.prod_engine.url, isolation_level="AUTOCOMMIT")
+        with admin.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {LOCAL_DB}"))
+            conn.execute(text(f"CREATE DATABASE {LOCAL_DB}"))
+        admin.dispose()
+        cls.local_engine = create_engine(cls.prod_engine.url.set(database=LOCAL_DB))
+        with cls.local_engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.local_engine.dispose()
+        admin = create_engine(cls.prod_engine.url, isolation_level="AUTOCOMMIT")
+        with admin.connect() as conn:
+            conn.execute(text(f"DROP DATABASE IF EXISTS {LOCAL_DB}"))
+        admin.dispose()
+
+    def _full_sync(self) -> dict:
+        """Copy prod into the local database; return the watermark of that copy."""
+        with ProdSnapshot(self.prod_engine) as prod:
+            started_at = prod.conn.execute(text("SELECT now()")).scalar()
+            self.table_meta = get_schema_metadata(prod.conn)
+            functions = get_function_definitions(prod.conn)
+            max_ids = max_tracked_ids(prod.conn, self.table_meta)
+            full_sync(prod, self.local_engine, self.table_meta, functions)
+        # As on app start: prod's copied schema has no serial sequences for local inserts
+        MigrationManager(self.local_engine)._migrate_ensure_sequences()
+        return {"records_updated_at": started_at.isoformat(), "max_ids": max_ids}
+
+    def test_rolled_back_session_rewrites_synced_history(self):
+        """Deltas re-keyframed below the id watermark reach the local copy."""
+        session = get_session()
+        if not session.query(User).filter_by(email=USER_EMAIL).first():
+            session.add(User(email=USER_EMAIL, username="sync_user", github_id=424242))
+        source = Source(name=f"Sync Source {uuid.uuid4().hex[:8]}")
+        session.add(source)
+        session.commit()
+        rec = Record(lx="heron", hm=1, source_id=source.id, mdf_data="\\lx heron")
+        session.add(rec)
+        session.commit()
+        session_id = str(uuid.uuid4())
+        versions = [
+            (None, "Creation", "\\lx heron"),
+            (session_id, "Upload", "\\lx heron\n\\ge heron"),
+            (None, "Record locked", "\\lx heron\n\\ge heron"),
+            (session_id, "Upload again", "\\lx heron\n\\ge grey heron"),
+        ]
+        prev = None
+        for version, (sid, summary, data) in enumerate(versions, 1):
+            compact_history_tail(session, [rec.id])
+            session.add(
+                history_entry(
+                    record_id=rec.id,
+                    user_email=USER_EMAIL,
+                    session_id=sid,
+                    version=version,
+                    change_summary=summary,
+                    prev_data=prev,
+                    current_data=data,
+                )
+            )
+            session.commit()
+            prev = data
+        rec.mdf_data = prev
+        session.commit()
+        rid = rec.id
+        session.close()
+
+        watermark = self._full_sync()
+        LocalSession = sessionmaker(bind=self.local_engine)
+        with LocalSession() as local:
+            lock_row = local.query(EditHistory).filter_by(record_id=rid, change_summary="Record locked").one()
+            self.assertEqual(lock_row.storage, STORAGE_DELTA)
+
+        # The surviving delta becomes a keyframe on prod; its id is below the watermark
+        UploadService.rollback_session(session_id, user_email=USER_EMAIL)
+        with ProdSnapshot(self.prod_engine) as prod:
+            incremental_sync(prod, self.local_engine, self.table_meta, watermark)
+
+        with self.prod_engine.connect() as pc, self.local_engine.connect() as lc:
+            self.assertEqual(lc.execute(text(HISTORY_SQL)).all(), pc.execute(text(HISTORY_SQL)).all())
+        with LocalSession() as local:
+            remaining = local.query(EditHistory).filter_by(record_id=rid).order_by(EditHistory.id).all()
+            self.assertEqual([h.change_summary for h in remaining], ["Creation", "Record locked"])
+            snapshot = load_history_data(local, remaining)[remaining[1].id]
+            self.assertEqual(snapshot.current_data, "\\lx heron\n\\ge heron")
+            self.assertEqual(local.get(Record, rid).mdf_data, "\\lx heron")
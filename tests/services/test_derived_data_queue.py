@@ -0,0 +1,182 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Register every model so Record's relationships can be configured
+from src.database.models import core, identity, iso639, meta, search, workflow  # noqa: F401
+from src.database.models.core import Record
+from src.services import derived_data_queue
+from src.services.derived_data_queue import DerivedDataIndexer, claim_dirty_records, rebuild_derived_data
+
+
+def _record(id, mdf, **columns):
+    columns.setdefault("source_id", 1)
+    return Record(id=id, mdf_data=mdf, **columns)
+
+
+class TestRebuildDerivedData(unittest.TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        for name in ("_update_record_languages", "populate_search_entries"):
+            patcher = patch(f"src.services.upload_service.UploadService.{name}")
+            setattr(self, name.strip("_"), patcher.start())
+            self.addCleanup(patcher.stop)
+        patcher = patch("src.services.linguistic_service.LinguisticService.generate_sort_lx", return_value="wok")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_stale_headword_columns_are_refreshed(self):
+        edited = _record(1, "\\lx wôk\n\\ps n\n\\ge maize", lx="wôk", hm=1, ps="n", ge="corn", sort_lx="wok")
+        self.session.query.return_value.filter.return_value.all.return_value = [edited]
+
+        self.assertEqual(rebuild_derived_data(self.session, [1]), 1)
+
+        params = self.session.execute.call_args[0][1]
+        self.assertEqual(params, [{"_id": 1, "_lx": "wôk", "_hm": 1, "_ps": "n", "_ge": "maize", "_sort_lx": "wok"}])
+        self.assertEqual(edited.ge, "maize")
+        self.update_record_languages.assert_called_once_with(self.session, edited, [])
+        self.populate_search_entries.assert_called_once_with([1], session=self.session)
+
+    def test_current_columns_issue_no_update(self):
+        clean = _record(2, "\\lx wôk\n\\ge corn", lx="wôk", hm=1, ps="", ge="corn", sort_lx="wok")
+        self.session.query.return_value.filter.return_value.all.return_value = [clean]
+        rebuild_derived_data(self.session, [2])
+        self.session.execute.assert_not_called()
+        self.populate_search_entries.assert_called_once_with([2], session=self.session)
+
+
+class TestClaim(unittest.TestCase):
+    def test_returns_claimed_ids(self):
+        session = MagicMock()
+        session.execute.return_value = iter([(4,), (5,)])
+        self.assertEqual(claim_dirty_records(session, 2), [4, 5])
+        self.assertEqual(session.execute.call_args[0][1], {"limit": 2})
+        self.assertIn("SKIP LOCKED", str(session.execute.call_args[0][0]))
+
+
+class TestClaimLocking(unittest.TestCase):
+    """Claims against the local database, alongside an uncommitted edit."""
+
+    @classmethod
+    def setUpClass(cls):
+        from src.database.connection import init_db
+
+        cls.engine = init_db()
+        with Session(cls.engine) as session:
+            source = core.Source(name="Claim Locking Source")
+            session.add(source)
+            session.flush()
+            records = [_record(None, f"\\lx {lx}", lx=lx, source_id=source.id) for lx in ("claimedit", "claimidle")]
+            session.add_all(records)
+            session.commit()
+            cls.source_id = source.id
+            cls.edited, cls.idle = (r.id for r in records)
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.engine.begin() as conn:
+            conn.execute(text("DELETE FROM records WHERE source_id = :s"), {"s": cls.source_id})
+            conn.execute(text("DELETE FROM sources WHERE id = :s"), {"s": cls.source_id})
+
+    def setUp(self):
+        with self.engine.begin() as conn:
+            conn.execute(
+                text("INSERT INTO dirty_records (record_id) VALUES (:a), (:b) ON CONFLICT DO NOTHING"),
+                {"a": self.edited, "b": self.idle},
+            )
+
+    def _queued(self):
+        with self.engine.connect() as conn:
+            return set(conn.execute(text("SELECT record_id FROM dirty_records")).scalars())
+
+    def test_skips_records_locked_by_an_edit(self):
+        with self.engine.connect() as editor:
+            editor.execute(
+                text("UPDATE records SET mdf_data = '\\lx claimedit\n\\ge x' WHERE id = :id"), {"id": self.edited}
+            )
+            with Session(self.engine) as session:
+                # Fail instead of hanging if the claim waits on the editor
+                session.execute(text("SET LOCAL lock_timeout = '2s'"))
+                claimed = claim_dirty_records(session, 1000)
+                self.assertIn(self.idle, claimed)
+                self.assertNotIn(self.edited, claimed)
+                session.commit()
+            editor.commit()
+        self.assertIn(self.edited, self._queued())
+
+    def test_edit_during_rebuild_waits_instead_of_deadlocking(self):
+        errors, started = [], threading.Event()
+
+        def edit():
+            try:
+                with self.engine.connect() as editor:
+                    started.set()
+                    editor.execute(
+                        text("UPDATE records SET mdf_data = '\\lx claimedit\n\\ge y' WHERE id = :id"),
+                        {"id": self.edited},
+                    )
+                    editor.commit()
+            except Exception as e:
+                errors.append(e)
+
+        with Session(self.engine) as session:
+            self.assertIn(self.edited, claim_dirty_records(session, 1000))
+            editor = threading.Thread(target=edit)
+            editor.start()
+            started.wait(5)
+            time.sleep(0.3)  # let the edit reach its lock wait
+            # The rebuild's own write to the record it claimed
+            session.execute(text("UPDATE records SET lx = lx WHERE id = :id"), {"id": self.edited})
+            session.commit()
+        editor.join(10)
+
+        self.assertEqual(errors, [])
+        self.assertIn(self.edited, self._queued())
+
+
+class TestIndexer(unittest.TestCase):
+    def test_drains_full_batches_then_waits_for_notify(self):
+        drained, woken = threading.Event(), threading.Event()
+        batches = iter([2, 2, 1, 0])
+
+        def fake_drain(batch_size):
+            size = next(batches)
+            if size == 1:
+                drained.set()
+            elif size == 0:
+                woken.set()
+            return size
+
+        indexer = DerivedDataIndexer(batch_size=2, sweep_interval=30)
+        with patch.object(derived_data_queue, "drain_once", side_effect=fake_drain) as drain:
+            indexer.start()
+            self.assertTrue(drained.wait(5))
+            indexer.notify()
+            self.assertTrue(woken.wait(5))
+            indexer.stop(timeout=5)
+        # Three batches until a short one, then one more after the wake-up
+        self.assertEqual(drain.call_count, 4)
+
+    def test_failed_batch_keeps_worker_alive(self):
+        indexer = DerivedDataIndexer(sweep_interval=30)
+        called = threading.Event()
+
+        def boom(batch_size):
+            called.set()
+            raise RuntimeError("db down")
+
+        with patch.object(derived_data_queue, "drain_once", side_effect=boom):
+            indexer.start()
+            self.assertTrue(called.wait(5))
+            self.assertTrue(indexer._thread.is_alive())
+            indexer.stop(timeout=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+import streamlit as st
+
+from src.services.github_client import GitHubClient, github_client
+from src.services.identity_service import IdentityService
+
+DELAY = 0.3
+
+PAYLOADS = {
+    "/user": {"id": 7, "login": "stub", "name": "Stub User", "email": None},
+    "/user/orgs": [{"login": "Brothertown-Language"}],
+    "/user/teams": [{"slug": "proto-SNEA", "organization": {"login": "Brothertown-Language"}}],
+    "/user/emails": [{"email": "stub@example.com", "primary": True, "verified": True}],
+}
+
+
+class _StubGitHub(BaseHTTPRequestHandler):
+    """GitHub-like API: fixed payloads, one ETag per path, DELAY seconds per response."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get("If-None-Match"), self.headers.get("Authorization")))
+        time.sleep(DELAY)
+        if self.headers.get("Authorization") != "token good":
+            self.send_response(401)
+            self.end_headers()
+            return
+        etag = f'"{self.path}-v1"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = json.dumps(PAYLOADS[self.path]).encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServerTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGitHub)
+        cls.server.lock = threading.Lock()
+        cls.server.requests = []
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}/user"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.client = GitHubClient()
+
+    def identity_requests(self, ttl=0):
+        return {
+            "user": (self.base_url, 0),
+            "orgs": (f"{self.base_url}/orgs", 0),
+            "teams": (f"{self.base_url}/teams", ttl),
+            "emails": (f"{self.base_url}/emails", 0),
+        }
+
+
+class TestGitHubClient(StubServerTestCase):
+    def test_requests_run_concurrently(self):
+        start = time.perf_counter()
+        responses = self.client.get_many("good", self.identity_requests())
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(responses["teams"], PAYLOADS["/user/teams"])
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertLess(elapsed, 2.5 * DELAY)
+
+    def test_revalidates_with_etag(self):
+        first = self.client.get_json("good", f"{self.base_url}/orgs")
+        second = self.client.get_json("good", f"{self.base_url}/orgs")
+
+        self.assertEqual(first, second)
+        self.assertEqual([etag for _, etag, _ in self.server.requests], [None, '"/user/orgs-v1"'])
+
+    def test_ttl_skips_request(self):
+        self.client.get_many("good", self.identity_requests(ttl=60))
+        self.server.requests.clear()
+        responses = self.client.get_many("good", self.identity_requests(ttl=60))
+
+        self.assertEqual(responses["teams"], PAYLOADS["/user/teams"])
+        self.assertEqual(sorted(path for path, _, _ in self.server.requests), ["/user", "/user/emails", "/user/orgs"])
+
+    def test_cache_is_per_token(self):
+        self.client.get_json("good", self.base_url)
+        with self.assertRaises(requests.HTTPError):
+            self.client.get_json("bad", self.base_url)
+        self.assertEqual(self.server.requests[-1], ("/user", None, "token bad"))
+
+    def test_failure_is_raised(self):
+        with self.assertRaises(requests.HTTPError):
+            self.client.get_many("bad", self.identity_requests())
+
+
+class TestFetchGitHubUserInfoAgainstStub(StubServerTestCase):
+    def test_login_flow(self):
+        github_client.clear_cache()
+        self.addCleanup(github_client.clear_cache)
+        with (
+            patch("streamlit.session_state", {}),
+            patch("streamlit.secrets", {"github_oauth": {"user_info_url": self.base_url}}),
+            patch("src.services.security_manager.SecurityManager.get_user_role", return_value="editor"),
+            patch.object(IdentityService, "sync_user_to_db") as mock_sync,
+            patch("src.services.audit_service.AuditService.log_activity"),
+        ):
+            start = time.perf_counter()
+            self.assertTrue(IdentityService.fetch_github_user_info("good"))
+            elapsed = time.perf_counter() - start
+
+            self.assertEqual(st.session_state["user_email"], "stub@example.com")
+            self.assertEqual(st.session_state["user_role"], "editor")
+            mock_sync.assert_called_once_with(PAYLOADS["/user"], "stub@example.com")
+        self.assertLess(elapsed, 2.5 * DELAY)
+
+
+if __name__ == "__main__":
+    unittest.main()
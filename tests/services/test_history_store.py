@@ -0,0 +1,144 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import os
+import random
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+# Register every model so EditHistory's relationships can be configured
+from src.database.models import core, identity, iso639, meta, search  # noqa: F401
+from src.services.history_store import (
+    HISTORY_STORAGE_ENV,
+    STORAGE_DELTA,
+    STORAGE_FULL,
+    STORAGE_KEYFRAME,
+    apply_delta,
+    compact_record_history,
+    encode_delta,
+    history_entry,
+    load_history_data,
+)
+
+
+def _row(id, record_id=1, prev=None, current="", storage=STORAGE_FULL, base_id=None):
+    return SimpleNamespace(
+        id=id, record_id=record_id, prev_data=prev, current_data=current, storage=storage, base_id=base_id
+    )
+
+
+def _chain(n, record_id=1, start_id=1):
+    """Full-storage chain where each version appends a gloss line to the previous one."""
+    rows, text = [], None
+    for i in range(n):
+        new = f"\\lx word{record_id}" if text is None else f"{text}\n\\ge gloss {i}"
+        rows.append(_row(start_id + i, record_id, prev=text, current=new))
+        text = new
+    return rows
+
+
+def _session_for(rows):
+    session = MagicMock()
+    session.query.return_value.filter.return_value.order_by.return_value.all.return_value = rows
+    return session
+
+
+class TestDeltaCodec(unittest.TestCase):
+    def test_round_trip(self):
+        base = "\\lx a\n\\ps n\n\\ge one\n\\nt note"
+        target = "\\lx a\n\\ge one (updated)\n\\nt note\n\\dt 2026"
+        self.assertEqual(apply_delta(base, encode_delta(base, target)), target)
+
+    def test_identical_text_is_a_single_copy(self):
+        text = "\\lx a\n\\ge b\n"
+        self.assertEqual(encode_delta(text, text), "[[0,3]]")
+
+    def test_random_edits_round_trip(self):
+        rng = random.Random(7)
+        lines = [f"\\ge line {i}" for i in range(30)]
+        for _ in range(50):
+            edited = [line for line in lines if rng.random() > 0.2]
+            edited.insert(rng.randrange(len(edited) + 1), "\\nt inserted ✓")
+            base, target = "\n".join(lines), "\n".join(edited)
+            self.assertEqual(apply_delta(base, encode_delta(base, target)), target)
+
+
+class TestHistoryEntry(unittest.TestCase):
+    def test_keyframe_by_default(self):
+        with patch.dict(os.environ, {HISTORY_STORAGE_ENV: ""}):
+            entry = history_entry(record_id=1, user_email="u", version=2, prev_data="\\lx a", current_data="\\lx a")
+        self.assertEqual(entry.storage, STORAGE_KEYFRAME)
+        self.assertEqual(entry.prev_data, "[[0,1]]")
+        self.assertEqual(entry.current_data, "\\lx a")
+
+    def test_creation_keeps_null_prev(self):
+        entry = history_entry(record_id=1, user_email="u", version=1, prev_data=None, current_data="\\lx a")
+        self.assertIsNone(entry.prev_data)
+
+    def test_full_mode(self):
+        with patch.dict(os.environ, {HISTORY_STORAGE_ENV: "full"}):
+            entry = history_entry(record_id=1, user_email="u", version=2, prev_data="\\lx a", current_data="\\lx b")
+        self.assertEqual(entry.storage, STORAGE_FULL)
+        self.assertEqual(entry.prev_data, "\\lx a")
+
+
+class TestCompactionAndReconstruction(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.dict(os.environ, {HISTORY_STORAGE_ENV: ""})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_compaction_is_lossless(self):
+        rows = _chain(7) + _chain(3, record_id=2, start_id=100)
+        expected = {r.id: (r.prev_data, r.current_data) for r in rows}
+
+        rewritten = compact_record_history(_session_for(rows), [1, 2], keyframe_interval=3)
+
+        self.assertEqual(rewritten, len(rows))
+        storages = [r.storage for r in rows[:7]]
+        self.assertEqual(
+            storages,
+            [STORAGE_KEYFRAME, STORAGE_DELTA, STORAGE_DELTA, STORAGE_KEYFRAME, STORAGE_DELTA, STORAGE_DELTA]
+            + [STORAGE_KEYFRAME],
+        )
+        self.assertEqual(rows[1].base_id, rows[0].id)
+        self.assertIsNone(rows[0].prev_data)
+
+        snapshots = load_history_data(MagicMock(), rows)
+        self.assertEqual({i: tuple(s) for i, s in snapshots.items()}, expected)
+
+    def test_compaction_is_idempotent(self):
+        rows = _chain(5)
+        compact_record_history(_session_for(rows), [1], keyframe_interval=2)
+        self.assertEqual(compact_record_history(_session_for(rows), [1], keyframe_interval=2), 0)
+
+    def test_missing_bases_are_fetched(self):
+        rows = _chain(4)
+        expected = rows[2].current_data
+        compact_record_history(_session_for(rows), [1], keyframe_interval=16)
+        self.assertEqual([r.storage for r in rows[1:3]], [STORAGE_DELTA, STORAGE_DELTA])
+
+        # Resolving row 3 alone walks back through row 2 to the keyframe, one query per step
+        session = MagicMock()
+        session.query.return_value.filter.return_value.all.side_effect = [[rows[1]], [rows[0]]]
+        self.assertEqual(load_history_data(session, [rows[2]])[3].current_data, expected)
+        self.assertEqual(session.query.call_count, 2)
+
+    def test_missing_base_raises(self):
+        session = MagicMock()
+        session.query.return_value.filter.return_value.all.return_value = []
+        with self.assertRaises(ValueError):
+            load_history_data(session, [_row(2, current="[[0,1]]", storage=STORAGE_DELTA, base_id=1)])
+
+    def test_full_mode_expands_chains(self):
+        rows = _chain(4)
+        expected = {r.id: (r.prev_data, r.current_data) for r in rows}
+        compact_record_history(_session_for(rows), [1], keyframe_interval=2)
+        with patch.dict(os.environ, {HISTORY_STORAGE_ENV: "full"}):
+            compact_record_history(_session_for(rows), [1])
+        self.assertTrue(all(r.storage == STORAGE_FULL and r.base_id is None for r in rows))
+        self.assertEqual({r.id: (r.prev_data, r.current_data) for r in rows}, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -83,22 +83,14 @@ class TestIdentityService(unittest.TestCase):
         self.assertEqual(result["organizations"], ["org1", "org2"])
         self.assertEqual(result["teams"], ["team1", "team2"])
 
-    @patch("requests.get")
-    def test_fetch_github_user_info_authorized(self, mock_get):
-        # Mock responses
-        mock_user = MagicMock()
-        mock_user.json.return_value = {"id": 1, "login": "user", "email": "user@example.com"}
-
-        mock_orgs = MagicMock()
-        mock_orgs.json.return_value = [{"login": "Brothertown-Language"}]
-
-        mock_teams = MagicMock()
-        mock_teams.json.return_value = [{"slug": "proto-SNEA", "organization": {"login": "Brothertown-Language"}}]
-
-        mock_emails = MagicMock()
-        mock_emails.json.return_value = [{"email": "primary@example.com", "primary": True, "verified": True}]
-
-        mock_get.side_effect = [mock_user, mock_orgs, mock_teams, mock_emails]
+    @patch("src.services.github_client.GitHubClient.get_many")
+    def test_fetch_github_user_info_authorized(self, mock_get_many):
+        mock_get_many.return_value = {
+            "user": {"id": 1, "login": "user", "email": "user@example.com"},
+            "orgs": [{"login": "Brothertown-Language"}],
+            "teams": [{"slug": "proto-SNEA", "organization": {"login": "Brothertown-Language"}}],
+            "emails": [{"email": "primary@example.com", "primary": True, "verified": True}],
+        }
 
         with patch("src.services.security_manager.SecurityManager.get_user_role") as mock_get_role:
             mock_get_role.return_value = "editor"
@@ -114,22 +106,14 @@ class TestIdentityService(unittest.TestCase):
                     mock_log.assert_called_once()
                     mock_get_role.assert_called_once()
 
-    @patch("requests.get")
-    def test_fetch_github_user_info_unauthorized(self, mock_get):
-        # Mock responses
-        mock_user = MagicMock()
-        mock_user.json.return_value = {"id": 1, "login": "user"}
-
-        mock_orgs = MagicMock()
-        mock_orgs.json.return_value = []
-
-        mock_teams = MagicMock()
-        mock_teams.json.return_value = [{"slug": "some-other-team", "organization": {"login": "other-org"}}]
-
-        mock_emails = MagicMock()
-        mock_emails.json.return_value = []
-
-        mock_get.side_effect = [mock_user, mock_orgs, mock_teams, mock_emails]
+    @patch("src.services.github_client.GitHubClient.get_many")
+    def test_fetch_github_user_info_unauthorized(self, mock_get_many):
+        mock_get_many.return_value = {
+            "user": {"id": 1, "login": "user"},
+            "orgs": [],
+            "teams": [{"slug": "some-other-team", "organization": {"login": "other-org"}}],
+            "emails": [],
+        }
 
         with patch("src.services.security_manager.SecurityManager.get_user_role") as mock_get_role:
             mock_get_role.return_value = None
@@ -1,6 +1,8 @@
+import unicodedata
 import unittest
 
 from src.services.linguistic_service import LinguisticService
+from src.services.sort_key import _WHITESPACE, SORT_CASE_FOLDS, case_map
 
 
 class TestLinguisticNormalization(unittest.TestCase):
@@ -45,6 +47,23 @@ class TestLinguisticNormalization(unittest.TestCase):
         self.assertLess(LinguisticService.generate_sort_lx("ooy"), LinguisticService.generate_sort_lx("∞"))
         self.assertLess(LinguisticService.generate_sort_lx("∞"), LinguisticService.generate_sort_lx("op"))
 
+    def test_generate_sort_lx_folds_final_sigma(self):
+        self.assertEqual(LinguisticService.generate_sort_lx("ΣΑΣ"), "σασ")
+        self.assertEqual(LinguisticService.generate_sort_lx("λόγος"), "λογοσ")
+
+    def test_lowercasing_matches_the_sql_case_map(self):
+        # snea_sort_key() lowercases from case_map(); Python uses str.lower() plus the folds
+        folds = str.maketrans(SORT_CASE_FOLDS)
+        mapping = case_map()
+        for cp in range(0x110000):
+            char = chr(cp)
+            if unicodedata.normalize("NFD", char) != char and len(char.lower()) > 1:
+                continue  # U+0130: decomposed by NFD before lowercasing
+            self.assertEqual(char.lower().translate(folds), mapping.get(char, char), hex(cp))
+
+    def test_whitespace_table_matches_isspace(self):
+        self.assertEqual(_WHITESPACE, "".join(chr(cp) for cp in range(0x110000) if chr(cp).isspace()))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,7 +13,18 @@ from src.database.models.core import Language, Record, RecordLanguage, Source
 from src.database.models.identity import User
 from src.database.models.search import GlossSearchEntry, HeadwordSearchEntry, SearchEntry
 from src.database.models.workflow import EditHistory, MatchupQueue
-from src.services.linguistic_service import LinguisticService
+from src.mdf.parser import PARSER_VERSION
+from src.services.history_store import (
+    KEYFRAME_INTERVAL,
+    STORAGE_DELTA,
+    STORAGE_KEYFRAME,
+    compact_record_history,
+    history_entry,
+    load_history_data,
+)
+from src.services.linguistic_service import LinguisticService, _CopyMdfSink, _unescape_copy_text
+from src.services.parsed_record import parsed_entry
+from src.services.reference_cache import reference_cache
 from src.services.statistics_service import StatisticsService
 
 
@@ -63,6 +74,8 @@ class TestLinguisticService(unittest.TestCase):
             shutil.rmtree(cls.test_db_path)
 
     def setUp(self):
+        # Each test class has its own database; never reuse another's cached lists
+        reference_cache.clear()
         self.session = self.Session()
         # Seed basic data
         self.user = User(email="editor@example.com", username="editor", github_id=1)
@@ -104,6 +117,61 @@ class TestLinguisticService(unittest.TestCase):
         self.assertEqual(sources[0]["name"], "Source A")
         self.assertEqual(sources[0]["record_count"], 2)
 
+    def test_source_counts_follow_inserts_moves_and_deletes(self):
+        other = Source(name="Source B")
+        self.session.add(other)
+        self.session.commit()
+        r1 = Record(lx="word1", source_id=self.source_id, mdf_data="\\lx word1")
+        r2 = Record(lx="word2", source_id=self.source_id, mdf_data="\\lx word2")
+        self.session.add_all([r1, r2])
+        self.session.add(
+            MatchupQueue(user_email="editor@example.com", source_id=other.id, batch_id="b1", mdf_data="\\lx q")
+        )
+        self.session.commit()
+
+        def counts():
+            with self._patch_session():
+                return {s["name"]: s["record_count"] for s in LinguisticService.get_sources_with_counts()}
+
+        self.assertEqual(counts(), {"Source A": 2, "Source B": 1})
+
+        r2.source_id = other.id
+        self.session.commit()
+        self.assertEqual(counts(), {"Source A": 1, "Source B": 2})
+
+        r1.ge = "edited"  # same-source update leaves counts alone
+        self.session.commit()
+        self.session.delete(r1)
+        self.session.commit()
+        self.assertEqual(counts(), {"Source A": 0, "Source B": 2})
+
+    def test_sources_cached_until_reference_data_changes(self):
+        with self._patch_session():
+            LinguisticService.get_sources_with_counts()
+        with patch("src.services.linguistic_service._query_sources_with_counts") as mock_query:
+            with self._patch_session():
+                LinguisticService.get_sources_with_counts()
+            mock_query.assert_not_called()
+
+            self.session.add(Source(name="Source C"))
+            self.session.commit()
+            mock_query.return_value = []
+            with self._patch_session():
+                LinguisticService.get_sources_with_counts()
+            mock_query.assert_called_once()
+
+    def test_sources_cache_only_counts_committed_writes(self):
+        def names():
+            with self._patch_session():
+                return {s["name"] for s in LinguisticService.get_sources_with_counts()}
+
+        with self.engine.connect() as writer:
+            writer.execute(text("INSERT INTO sources (name) VALUES ('Source D')"))
+            # The writer's trigger has run, but its row is not visible yet
+            self.assertEqual(names(), {"Source A"})
+            writer.commit()
+        self.assertEqual(names(), {"Source A", "Source D"})
+
     def test_get_source(self):
         with self._patch_session():
             source = LinguisticService.get_source(self.source_id)
@@ -132,6 +200,30 @@ class TestLinguisticService(unittest.TestCase):
         self.assertEqual(len(res["languages"]), 1)
         self.assertEqual(res["languages"][0]["code"], "wqk")
 
+    def test_get_records_preserves_order_and_skips_missing(self):
+        r1 = Record(lx="nup", source_id=self.source_id, mdf_data="\\lx nup")
+        r2 = Record(lx="wuskan", source_id=self.source_id, mdf_data="\\lx wuskan")
+        r3 = Record(lx="gone", source_id=self.source_id, mdf_data="\\lx gone", is_deleted=True)
+        self.session.add_all([r1, r2, r3])
+        self.session.commit()
+        self.session.add(RecordLanguage(record_id=r2.id, language_id=self.lang_id, is_primary=True))
+        self.session.commit()
+
+        with self._patch_session():
+            res = LinguisticService.get_records([r2.id, 999999, r3.id, r1.id])
+
+        self.assertEqual([r["lx"] for r in res], ["wuskan", "nup"])
+        self.assertEqual(res[0]["source_name"], "Source A")
+        self.assertEqual(res[0]["languages"][0]["code"], "wqk")
+        self.assertEqual(res[1]["languages"], [])
+        with self._patch_session():
+            self.assertEqual(LinguisticService.get_record(r2.id), res[0])
+
+    def test_get_records_empty(self):
+        with patch("src.services.linguistic_service.get_session") as mock_get_session:
+            self.assertEqual(LinguisticService.get_records([]), [])
+        mock_get_session.assert_not_called()
+
     def test_search_records(self):
         from src.database.models.search import SearchEntry
 
@@ -280,6 +372,138 @@ class TestLinguisticService(unittest.TestCase):
                 if os.path.exists(temp_path):
                     os.remove(temp_path)
 
+    def test_stream_records_to_temp_file_copy_engine_matches_cursor(self):
+        """COPY engine output is byte-identical to the server-side cursor engine."""
+        import os
+
+        self.session.add_all(
+            [
+                Record(lx="cb", sort_lx="cb", source_id=self.source_id, mdf_data="\\lx cb\n\\ge tab\there"),
+                Record(lx="ca", sort_lx="ca", source_id=self.source_id, mdf_data="\\lx ca\n\\nt back\\slash"),
+            ]
+        )
+        self.session.commit()
+
+        outputs = {}
+        for engine in ("cursor", "copy"):
+            with self._patch_session():
+                path = LinguisticService.stream_records_to_temp_file(source_id=self.source_id, engine=engine)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    outputs[engine] = f.read()
+            finally:
+                if os.path.exists(path):
+                    os.remove(path)
+
+        self.assertEqual(outputs["copy"], outputs["cursor"])
+        self.assertEqual(outputs["copy"], "\\lx ca\n\\nt back\\slash\n\n\\lx cb\n\\ge tab\there")
+
+    def test_get_export_summary(self):
+        """Export summary counts records per source without loading MDF."""
+        source_b = Source(name="Source B", short_name="SB")
+        self.session.add(source_b)
+        self.session.commit()
+        self.session.add_all(
+            [
+                Record(lx="sum1", source_id=self.source_id, mdf_data="\\lx sum1"),
+                Record(lx="sum2", source_id=self.source_id, mdf_data="\\lx sum2"),
+                Record(lx="sum3", source_id=source_b.id, mdf_data="\\lx sum3"),
+            ]
+        )
+        self.session.commit()
+
+        with self._patch_session():
+            summary = LinguisticService.get_export_summary()
+
+        counts = {s["source_name"]: s["count"] for s in summary}
+        self.assertEqual(counts, {"Source A": 2, "Source B": 1})
+
+    def test_stream_records_to_archive_zip(self):
+        """Zip export writes one MDF entry per source, streamed in sort order."""
+        import os
+        import zipfile
+
+        source_b = Source(name="Source B", short_name="SB")
+        self.session.add(source_b)
+        self.session.commit()
+        self.session.add_all(
+            [
+                Record(lx="zb", sort_lx="zb", source_id=self.source_id, mdf_data="\\lx zb"),
+                Record(lx="za", sort_lx="za", source_id=self.source_id, mdf_data="\\lx za"),
+                Record(lx="other", sort_lx="other", source_id=source_b.id, mdf_data="\\lx other"),
+            ]
+        )
+        self.session.commit()
+
+        with self._patch_session():
+            path = LinguisticService.stream_records_to_archive(entry_name=lambda name: f"{name}.txt")
+        try:
+            with zipfile.ZipFile(path) as zf:
+                self.assertEqual(sorted(zf.namelist()), ["Source A.txt", "Source B.txt"])
+                self.assertEqual(zf.read("Source A.txt").decode("utf-8"), "\\lx za\n\n\\lx zb")
+                self.assertEqual(zf.read("Source B.txt").decode("utf-8"), "\\lx other")
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_stream_records_to_archive_zip_entry_names_are_unique(self):
+        """Sources whose entry names collide each get their own numbered entry."""
+        import os
+        import zipfile
+
+        source_b = Source(name="Source B", short_name="SB")
+        source_c = Source(name="Source C", short_name="SC")
+        self.session.add_all([source_b, source_c])
+        self.session.commit()
+        self.session.add_all(
+            [
+                Record(lx="a", sort_lx="a", source_id=self.source_id, mdf_data="\\lx a"),
+                Record(lx="b", sort_lx="b", source_id=source_b.id, mdf_data="\\lx b"),
+                Record(lx="c", sort_lx="c", source_id=source_c.id, mdf_data="\\lx c"),
+            ]
+        )
+        self.session.commit()
+
+        with self._patch_session():
+            path = LinguisticService.stream_records_to_archive(entry_name=lambda name: "export.txt")
+        try:
+            with zipfile.ZipFile(path) as zf:
+                self.assertEqual(zf.namelist(), ["export.txt", "export_2.txt", "export_3.txt"])
+                self.assertEqual(
+                    [zf.read(name).decode("utf-8") for name in zf.namelist()], ["\\lx a", "\\lx b", "\\lx c"]
+                )
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_stream_records_to_archive_gzip(self):
+        """Gzip export writes a single compressed MDF stream."""
+        import gzip
+        import os
+
+        self.session.add_all(
+            [
+                Record(lx="g1", sort_lx="g1", source_id=self.source_id, mdf_data="\\lx g1"),
+                Record(lx="g2", sort_lx="g2", source_id=self.source_id, mdf_data="\\lx g2"),
+            ]
+        )
+        self.session.commit()
+
+        with self._patch_session():
+            path = LinguisticService.stream_records_to_archive(
+                entry_name=str, source_id=self.source_id, compression="gzip", compresslevel=1
+            )
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                self.assertEqual(f.read(), "\\lx g1\n\n\\lx g2")
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_stream_records_to_archive_rejects_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            LinguisticService.stream_records_to_archive(entry_name=str, compression="rar")
+
     def test_bundle_records_to_mdf(self):
         records = [
             {"lx": "apple", "mdf_data": "\\lx apple\n\\ge fruit"},
@@ -289,6 +513,14 @@ class TestLinguisticService(unittest.TestCase):
         expected = "\\lx apple\n\\ge fruit\n\n\\lx banana\n\\ge fruit"
         self.assertEqual(bundle, expected)
 
+    def test_bundle_records_to_mdf_fetches_missing_in_one_call(self):
+        records = [{"id": 1, "mdf_data": "\\lx a"}, {"id": 2}, {"id": 3}]
+        fetched = [{"id": 3, "mdf_data": "\\lx c"}, {"id": 2, "mdf_data": "\\lx b"}]
+        with patch.object(LinguisticService, "get_records", return_value=fetched) as mock_get:
+            bundle = LinguisticService.bundle_records_to_mdf(records)
+        mock_get.assert_called_once_with([2, 3])
+        self.assertEqual(bundle, "\\lx a\n\n\\lx b\n\n\\lx c")
+
     def test_create_record(self):
         fields = {"lx": "test", "source_id": self.source_id, "mdf_data": "\\lx test"}
         with self._patch_session():
@@ -324,6 +556,25 @@ class TestLinguisticService(unittest.TestCase):
         self.assertIsNotNone(history)
         self.assertEqual(history.user_email, "editor@example.com")
 
+    def test_raw_mdf_update_marks_parsed_stale(self):
+        """SQL that rewrites mdf_data clears parsed_version; ORM edits keep it current."""
+        record = Record(lx="wôk", source_id=self.source_id, mdf_data="\\lx wôk\n\\ge corn")
+        self.session.add(record)
+        self.session.commit()
+
+        record.mdf_data = "\\lx wôk\n\\ge maize"
+        self.session.commit()
+        self.session.refresh(record)
+        self.assertEqual(record.parsed_version, PARSER_VERSION)
+
+        self.session.execute(
+            text("UPDATE records SET mdf_data = :mdf WHERE id = :id"), {"mdf": "\\lx wôk\n\\ge grain", "id": record.id}
+        )
+        self.session.commit()
+        self.session.refresh(record)
+        self.assertIsNone(record.parsed_version)
+        self.assertEqual(parsed_entry(record)["ge"], "grain")
+
     def test_get_edit_history(self):
         record = Record(lx="history", source_id=self.source_id, mdf_data="\\lx history")
         self.session.add(record)
@@ -354,6 +605,39 @@ class TestLinguisticService(unittest.TestCase):
         self.assertEqual(res[0]["version"], 1)
         self.assertEqual(res[0]["user_email"], "editor@example.com")
 
+    def test_edit_history_compacted_on_write(self):
+        record = Record(lx="chain", source_id=self.source_id, mdf_data="\\lx chain")
+        self.session.add(record)
+        self.session.flush()
+        self.session.add(
+            history_entry(record_id=record.id, user_email="editor@example.com", version=1, current_data="\\lx chain")
+        )
+        self.session.commit()
+
+        edits = KEYFRAME_INTERVAL + 4
+        for i in range(edits):
+            with self._patch_session():
+                self.assertTrue(
+                    LinguisticService.update_record(
+                        record.id, "editor@example.com", mdf_data=f"\\lx chain\n\\ge gloss {i}"
+                    )
+                )
+
+        self.session.expire_all()
+        rows = self.session.query(EditHistory).filter_by(record_id=record.id).order_by(EditHistory.id).all()
+        keyframes = {0, KEYFRAME_INTERVAL, len(rows) - 1}
+        self.assertEqual(
+            [r.storage for r in rows],
+            [STORAGE_KEYFRAME if pos in keyframes else STORAGE_DELTA for pos in range(len(rows))],
+        )
+        # Already in the layout a full compaction would produce
+        self.assertEqual(compact_record_history(self.session, [record.id]), 0)
+
+        snapshots = load_history_data(self.session, rows)
+        for older, newer in zip(rows, rows[1:], strict=False):
+            self.assertEqual(snapshots[newer.id].prev_data, snapshots[older.id].current_data)
+        self.assertEqual(snapshots[rows[-1].id].current_data, self.session.get(Record, record.id).mdf_data)
+
     def test_soft_delete_record(self):
         record = Record(lx="todelete", source_id=self.source_id, mdf_data="\\lx todelete")
         self.session.add(record)
@@ -464,6 +748,52 @@ class TestLinguisticService(unittest.TestCase):
             self.assertEqual(len(recent), 1)
             self.assertEqual(recent[0]["lx"], "apple")
 
+    def test_statistics_snapshot_reused_until_records_change(self):
+        """Snapshot is served as-is until a tracked table is written, then recomputed."""
+        self.session.add(Record(lx="one", ps="n", source_id=self.source_id, mdf_data="\\lx one"))
+        self.session.commit()
+
+        with self._patch_stats_session():
+            first = StatisticsService.get_snapshot()
+        with self._patch_stats_session():
+            second = StatisticsService.get_snapshot()
+        self.assertEqual(first["computed_at"], second["computed_at"])
+        self.assertEqual(second["summary"]["records"], 1)
+
+        self.session.add(Record(lx="two", ps="v", source_id=self.source_id, mdf_data="\\lx two"))
+        self.session.commit()
+
+        with self._patch_stats_session():
+            third = StatisticsService.get_snapshot()
+        self.assertGreater(third["computed_at"], second["computed_at"])
+        self.assertEqual(third["summary"]["records"], 2)
+        with self._patch_stats_session():
+            self.assertEqual(StatisticsService.get_top_parts_of_speech(limit=1), {"n": 1})
+
+    def test_statistics_snapshot_ignores_uncommitted_writes(self):
+        """A snapshot computed while a write is in flight must not be stamped as covering it."""
+        with self.Session() as writer:
+            writer.add(Record(lx="pending", source_id=self.source_id, mdf_data="\\lx pending"))
+            writer.flush()
+            with self._patch_stats_session():
+                self.assertEqual(StatisticsService.get_snapshot()["summary"]["records"], 0)
+            writer.commit()
+
+        with self._patch_stats_session():
+            self.assertEqual(StatisticsService.get_snapshot()["summary"]["records"], 1)
+
+    def test_statistics_helpers_read_a_given_snapshot(self):
+        self.session.add(Record(lx="one", ps="n", source_id=self.source_id, mdf_data="\\lx one"))
+        self.session.commit()
+        with self._patch_stats_session():
+            snapshot = StatisticsService.get_snapshot()
+
+        with patch.object(StatisticsService, "get_snapshot") as get_snapshot:
+            self.assertEqual(StatisticsService.get_summary_stats(snapshot)["records"], 1)
+            self.assertEqual(StatisticsService.get_top_parts_of_speech(snapshot=snapshot), {"n": 1})
+            self.assertEqual(StatisticsService.get_recent_activity(snapshot=snapshot), [])
+        get_snapshot.assert_not_called()
+
     def test_hard_delete_record_with_search_entries(self):
         record = Record(
             lx="nup", hm=1, ps="v", ge="die", source_id=self.source_id, mdf_data="\\lx nup\n\\va nut\n\\ge die"
@@ -1098,3 +1428,24 @@ class TestLinguisticService(unittest.TestCase):
         self.assertEqual(
             len(result.records), 0, "Punctuation-only term should not match via FTS without ILIKE fallback"
         )
+
+
+class TestCopyTextDecoding(unittest.TestCase):
+    """COPY text-format decoding used by the copy export engine (no DB required)."""
+
+    def test_unescape_copy_text(self):
+        self.assertEqual(_unescape_copy_text("\\\\lx a\\n\\\\ge b"), "\\lx a\n\\ge b")
+        self.assertEqual(_unescape_copy_text("a\\tb\\rc"), "a\tb\rc")
+        # An escaped backslash followed by "n" is a literal backslash-n, not a newline
+        self.assertEqual(_unescape_copy_text("x\\\\ny"), "x\\ny")
+
+    def test_sink_joins_rows_with_blank_lines(self):
+        import io
+
+        out = io.StringIO()
+        sink = _CopyMdfSink(out)
+        # Rows may arrive split across writes
+        sink.write(b"\\\\lx one\\n\\\\ge fi")
+        sink.write(b"rst\n\\\\lx tw")
+        sink.write(b"o\n")
+        self.assertEqual(out.getvalue(), "\\lx one\n\\ge first\n\n\\lx two")
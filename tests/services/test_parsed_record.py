@@ -0,0 +1,81 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Register every model so Record's relationships can be configured
+from src.database.models import core, identity, iso639, meta, search, workflow  # noqa: F401
+from src.database.models.core import Record
+from src.mdf.parser import PARSER_VERSION, parse_record
+from src.services.parsed_record import parsed_entry, refresh_stale_parsed
+
+MDF = "\\lx wôk\n\\va wauk\n\\ps n\n\\ge corn"
+
+
+class TestParseRecord(unittest.TestCase):
+    def test_drops_raw_text(self):
+        entry = parse_record(MDF)
+        self.assertEqual(entry["lx"], "wôk")
+        self.assertEqual(entry["va"], ["wauk"])
+        self.assertNotIn("mdf_data", entry)
+
+    def test_unparseable_is_none(self):
+        self.assertIsNone(parse_record("\\ge no headword"))
+        self.assertIsNone(parse_record(""))
+        self.assertIsNone(parse_record(None))
+
+
+class TestWriteMaintenance(unittest.TestCase):
+    def test_constructor_and_assignment_refresh_cache(self):
+        record = Record(lx="wôk", source_id=1, mdf_data=MDF)
+        self.assertEqual(record.parsed["ge"], "corn")
+        self.assertEqual(record.parsed_version, PARSER_VERSION)
+
+        record.mdf_data = MDF.replace("corn", "maize")
+        self.assertEqual(record.parsed["ge"], "maize")
+
+
+class TestParsedEntry(unittest.TestCase):
+    def test_current_cache_is_not_reparsed(self):
+        record = Record(lx="wôk", source_id=1, mdf_data=MDF)
+        with patch("src.services.parsed_record.parse_record") as reparse:
+            self.assertEqual(parsed_entry(record)["lx"], "wôk")
+        reparse.assert_not_called()
+
+    def test_stale_cache_is_rederived_and_written_back(self):
+        record = Record(id=7, lx="wôk", source_id=1, mdf_data=MDF)
+        record.parsed, record.parsed_version = {"lx": "old"}, PARSER_VERSION - 1
+        session = MagicMock()
+        with patch("src.services.parsed_record.object_session", return_value=session):
+            entry = parsed_entry(record)
+        self.assertEqual(entry["lx"], "wôk")
+        self.assertEqual(record.parsed_version, PARSER_VERSION)
+        params = session.execute.call_args[0][1]
+        self.assertEqual(params, [{"_id": 7, "_parsed": entry}])
+        # Write-back must not touch the optimistic-lock version
+        self.assertNotIn("current_version", str(session.execute.call_args[0][0]))
+
+    def test_detached_record_is_rederived_without_write(self):
+        record = Record(lx="wôk", source_id=1, mdf_data=MDF)
+        record.parsed_version = None
+        self.assertEqual(parsed_entry(record)["ps"], "n")
+
+
+class TestRefreshStaleParsed(unittest.TestCase):
+    def test_batch_updates_and_resume_point(self):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [(3, MDF), (9, "\\ge bad")]
+        self.assertEqual(refresh_stale_parsed(session, batch_size=2), (2, 9))
+        params = session.execute.call_args_list[1][0][1]
+        self.assertEqual([p["_id"] for p in params], [3, 9])
+        self.assertIsNone(params[1]["_parsed"])
+
+    def test_nothing_stale(self):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = []
+        self.assertEqual(refresh_stale_parsed(session, after_id=9), (0, None))
+        self.assertEqual(session.execute.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,16 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from sqlalchemy.dialects import postgresql
+
 from src.database.models.identity import UserPreference
+from src.services import preference_service
 from src.services.preference_service import PreferenceService
 
+# Bound through the package attribute: UI tests under test/ replace the
+# sys.modules entry, which string patch targets would resolve to.
+_PreferenceService = preference_service.PreferenceService
+
 
 class TestPreferenceService(unittest.TestCase):
     """Unit tests for PreferenceService."""
@@ -93,5 +100,98 @@ class TestPreferenceService(unittest.TestCase):
         mock_session.close.assert_called_once()
 
 
+class TestPreferenceSnapshot(unittest.TestCase):
+    """Session snapshot reads and deferred, coalesced writes."""
+
+    def setUp(self):
+        self.state = {}
+        patcher = patch.object(preference_service.st, "session_state", self.state)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.object(preference_service, "get_session")
+    def test_load_preferences_groups_by_view(self, mock_get_session):
+        mock_session = MagicMock()
+        mock_session.query.return_value.filter.return_value.all.return_value = [
+            ("records", "page_size", "50"),
+            ("global", "selection_contents", "[1]"),
+        ]
+        mock_get_session.return_value = mock_session
+
+        prefs = _PreferenceService.load_preferences("a@b.c", ["records", "global", "direct_entry"])
+
+        self.assertEqual(
+            prefs,
+            {"records": {"page_size": "50"}, "global": {"selection_contents": "[1]"}, "direct_entry": {}},
+        )
+        mock_session.query.assert_called_once()
+        mock_session.close.assert_called_once()
+
+    @patch.object(_PreferenceService, "load_preferences")
+    def test_prefetch_loads_each_view_once(self, mock_load):
+        mock_load.return_value = {"records": {"page_size": "50"}, "global": {}}
+
+        _PreferenceService.prefetch_preferences("a@b.c", ("records", "global"))
+        self.assertEqual(_PreferenceService.get_cached_preference("a@b.c", "records", "page_size", "25"), "50")
+        self.assertEqual(_PreferenceService.get_cached_preference("a@b.c", "global", "missing", "[]"), "[]")
+
+        mock_load.assert_called_once_with("a@b.c", ["records", "global"])
+
+    @patch.object(_PreferenceService, "load_preferences", return_value=None)
+    def test_failed_load_returns_default_and_retries(self, mock_load):
+        self.assertEqual(_PreferenceService.get_cached_preference("a@b.c", "records", "page_size", "25"), "25")
+        _PreferenceService.get_cached_preference("a@b.c", "records", "page_size", "25")
+        self.assertEqual(mock_load.call_count, 2)
+
+    @patch.object(_PreferenceService, "save_preferences", return_value=True)
+    @patch.object(_PreferenceService, "load_preferences")
+    def test_deferred_writes_coalesce_into_one_save(self, mock_load, mock_save):
+        mock_load.return_value = {"records": {"page_size": "25"}}
+
+        _PreferenceService.set_preference_deferred("a@b.c", "records", "page_size", "25")  # unchanged
+        _PreferenceService.set_preference_deferred("a@b.c", "records", "page_size", "50")
+        _PreferenceService.set_preference_deferred("a@b.c", "records", "page_size", "100")
+        mock_load.return_value = {"global": {}}
+        _PreferenceService.set_preference_deferred("a@b.c", "global", "selection_contents", "[3]")
+
+        self.assertEqual(_PreferenceService.get_cached_preference("a@b.c", "records", "page_size"), "100")
+        mock_save.assert_not_called()
+
+        self.assertTrue(_PreferenceService.flush_deferred_preferences())
+        mock_save.assert_called_once_with(
+            "a@b.c", {("records", "page_size"): "100", ("global", "selection_contents"): "[3]"}
+        )
+        self.assertTrue(_PreferenceService.flush_deferred_preferences())
+        mock_save.assert_called_once()
+
+    @patch.object(_PreferenceService, "save_preferences", return_value=False)
+    @patch.object(_PreferenceService, "load_preferences", return_value={"records": {}})
+    def test_failed_flush_keeps_changes_queued(self, _mock_load, mock_save):
+        _PreferenceService.set_preference_deferred("a@b.c", "records", "page_size", "50")
+
+        self.assertFalse(_PreferenceService.flush_deferred_preferences())
+        self.assertFalse(_PreferenceService.flush_deferred_preferences())
+        self.assertEqual(mock_save.call_count, 2)
+
+    @patch.object(preference_service, "get_session")
+    def test_save_preferences_single_upsert(self, mock_get_session):
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        ok = _PreferenceService.save_preferences("a@b.c", {("records", "page_size"): "50", ("global", "x"): "1"})
+
+        self.assertTrue(ok)
+        mock_session.execute.assert_called_once()
+        sql = str(mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        self.assertIn("ON CONFLICT ON CONSTRAINT uix_user_pref_view_key DO UPDATE", sql)
+        mock_session.commit.assert_called_once()
+        mock_session.close.assert_called_once()
+
+    @patch.object(preference_service, "get_session")
+    def test_save_preferences_empty_is_noop(self, mock_get_session):
+        self.assertTrue(_PreferenceService.save_preferences("a@b.c", {}))
+        mock_get_session.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,97 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from src.services import query_stats
+from src.services.query_stats import SLOW_QUERY_ENV, QueryStats, fingerprint
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_bound_values_and_literals_collapse(self):
+        self.assertEqual(
+            fingerprint("SELECT *  FROM records\n WHERE id = %(id_1)s AND lx = 'Wôk' LIMIT 50"),
+            "SELECT * FROM records WHERE id = ? AND lx = ? LIMIT ?",
+        )
+
+    def test_in_lists_of_any_length_match(self):
+        self.assertEqual(
+            fingerprint("SELECT 1 FROM t WHERE id IN (%(p_1)s, %(p_2)s)"),
+            fingerprint("SELECT 1 FROM t WHERE id IN (%(p_1)s, %(p_2)s, %(p_3)s)"),
+        )
+
+    def test_identifiers_with_digits_are_kept(self):
+        self.assertIn("iso_639_3", fingerprint("SELECT * FROM iso_639_3"))
+
+
+class TestQueryStats(unittest.TestCase):
+    def test_aggregates_per_statement_caller_and_page(self):
+        stats = QueryStats()
+        for ms in range(1, 21):
+            stats.record("SELECT * FROM records WHERE id = %(id)s", float(ms), 1, "svc.get", "records")
+        stats.record("SELECT * FROM records WHERE id = %(id)s", 5.0, 1, "svc.get", "upload_mdf")
+
+        rows = stats.snapshot()
+        self.assertEqual(len(rows), 2)
+        top = rows[0]
+        self.assertEqual((top["caller"], top["page"], top["count"]), ("svc.get", "records", 20))
+        self.assertEqual(top["total_ms"], 210.0)
+        self.assertEqual(top["p95_ms"], 20.0)
+        self.assertEqual(top["rows"], 20)
+
+    def test_unknown_rowcount_is_not_counted(self):
+        stats = QueryStats()
+        stats.record("UPDATE t SET x = 1", 1.0, -1, "-", "-")
+        self.assertEqual(stats.snapshot()[0]["rows"], 0)
+
+    def test_reset(self):
+        stats = QueryStats()
+        stats.record("SELECT 1", 1.0, 1, "-", "-")
+        stats.reset()
+        self.assertEqual(stats.snapshot(), [])
+
+
+class TestCursorHooks(unittest.TestCase):
+    def setUp(self):
+        query_stats.query_stats.reset()
+        self.addCleanup(query_stats.query_stats.reset)
+
+    def _execute(self, statement, elapsed):
+        conn, cursor = MagicMock(), MagicMock(rowcount=3)
+        conn.info = {}
+        with patch("src.services.query_stats.time.perf_counter", side_effect=[0.0, elapsed]):
+            query_stats._before_cursor_execute(conn, cursor, statement, {}, None, False)
+            query_stats._after_cursor_execute(conn, cursor, statement, {}, None, False)
+
+    def test_records_timing_and_caller(self):
+        self._execute("SELECT 1", 0.002)
+        (row,) = query_stats.query_stats.snapshot()
+        self.assertEqual(row["mean_ms"], 2.0)
+        self.assertEqual(row["rows"], 3)
+        self.assertEqual(row["page"], "-")
+
+    def test_slow_statement_is_logged(self):
+        with patch.dict(os.environ, {SLOW_QUERY_ENV: "100"}), patch.object(query_stats.logger, "warning") as warn:
+            self._execute("SELECT 1", 0.05)
+            warn.assert_not_called()
+            self._execute("SELECT 1", 0.25)
+            warn.assert_called_once()
+
+    def test_failed_statement_drops_its_start_time(self):
+        query_stats.install()
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            with self.assertRaises(OperationalError):
+                conn.execute(text("SELECT * FROM missing_table"))
+            self.assertEqual(conn.info["query_stats_start"], [])
+            conn.execute(text("SELECT 1"))
+        (row,) = query_stats.query_stats.snapshot()
+        self.assertEqual(row["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
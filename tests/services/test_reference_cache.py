@@ -0,0 +1,39 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import unittest
+from unittest.mock import MagicMock
+
+from src.services.reference_cache import ReferenceCache
+
+
+class TestReferenceCache(unittest.TestCase):
+    def test_same_version_is_served_from_cache(self):
+        cache = ReferenceCache()
+        load = MagicMock(return_value=["a"])
+        self.assertEqual(cache.get_or_load("k", 3, load), ["a"])
+        self.assertEqual(cache.get_or_load("k", 3, load), ["a"])
+        load.assert_called_once()
+
+    def test_new_version_reloads(self):
+        cache = ReferenceCache()
+        cache.get_or_load("k", 3, lambda: ["old"])
+        self.assertEqual(cache.get_or_load("k", 4, lambda: ["new"]), ["new"])
+        self.assertEqual(cache.get_or_load("k", 4, lambda: ["unused"]), ["new"])
+
+    def test_older_load_does_not_replace_newer_entry(self):
+        cache = ReferenceCache()
+        cache.get_or_load("k", 5, lambda: ["v5"])
+        self.assertEqual(cache.get_or_load("k", 4, lambda: ["v4"]), ["v4"])
+        self.assertEqual(cache.get_or_load("k", 5, lambda: ["unused"]), ["v5"])
+
+    def test_keys_are_independent_and_clear_empties(self):
+        cache = ReferenceCache()
+        cache.get_or_load("a", 1, lambda: 1)
+        cache.get_or_load("b", 1, lambda: 2)
+        self.assertEqual(cache.get_or_load("a", 1, lambda: 0), 1)
+        cache.clear()
+        self.assertEqual(cache.get_or_load("a", 1, lambda: 0), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import os
+import time
+import unittest
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.services import query_stats, render_profiler
+from src.services.render_profiler import RenderProfile, collapsed_stacks, flame_summary, profile_render
+
+
+class TestProfileRender(unittest.TestCase):
+    def setUp(self):
+        render_profiler.clear_profiles()
+        self.addCleanup(render_profiler.clear_profiles)
+        self.addCleanup(render_profiler.set_enabled, render_profiler.is_enabled())
+
+    def test_disabled_records_nothing(self):
+        render_profiler.set_enabled(False)
+        with profile_render("Records"):
+            pass
+        self.assertEqual(render_profiler.recent_profiles(), [])
+
+    def test_records_timings_and_queries(self):
+        render_profiler.set_enabled(True)
+        conn, cursor = MagicMock(rowcount=1), MagicMock(rowcount=1)
+        conn.info = {}
+        with patch.dict("os.environ", {render_profiler.INTERVAL_ENV: "1"}), profile_render("Records"):
+            query_stats._before_cursor_execute(conn, cursor, "SELECT 1", {}, None, False)
+            query_stats._after_cursor_execute(conn, cursor, "SELECT 1", {}, None, False)
+            deadline = time.perf_counter() + 0.05
+            while time.perf_counter() < deadline:
+                pass
+
+        (profile,) = render_profiler.recent_profiles()
+        self.assertEqual(profile.page, "Records")
+        self.assertEqual(profile.queries, 1)
+        self.assertGreaterEqual(profile.wall_ms, 50)
+        self.assertGreater(profile.cpu_ms, 0)
+        self.assertGreater(profile.samples, 0)
+        self.assertEqual(sum(profile.areas.values()), profile.samples)
+
+    def test_interrupted_run_is_still_recorded(self):
+        render_profiler.set_enabled(True)
+        with self.assertRaises(RuntimeError), profile_render("Upload MDF"):
+            raise RuntimeError("st.rerun")
+        self.assertEqual(len(render_profiler.recent_profiles()), 1)
+
+
+class TestSampler(unittest.TestCase):
+    @staticmethod
+    def _frames(filenames):
+        """A fake frame chain, outermost filename first; returns the innermost frame."""
+        frame = None
+        for i, filename in enumerate(filenames):
+            code = SimpleNamespace(co_filename=filename, co_name=f"f{i}")
+            frame = SimpleNamespace(f_code=code, f_globals={"__name__": "m"}, f_back=frame)
+        return frame
+
+    def test_area_comes_from_frames_below_the_depth_limit(self):
+        page = os.path.join(render_profiler._PAGES_DIR, "records.py")
+        app = os.path.join(render_profiler._SRC_ROOT, "services", "svc.py")
+        parser = os.path.join(render_profiler._MDF_DIR, "parser.py")
+        innermost = self._frames([page] + [app] * (render_profiler._MAX_DEPTH + 10) + [parser])
+        profile = RenderProfile(page="p", started=0.0)
+
+        render_profiler._Sampler(0, profile, 1.0).sample(innermost)
+
+        self.assertEqual(profile.areas, Counter({"parsing": 1}))
+        (stack,) = profile.stacks
+        self.assertEqual(len(stack), render_profiler._MAX_DEPTH)
+
+
+class TestFlameSummary(unittest.TestCase):
+    def _profile(self, stacks):
+        return RenderProfile(page="p", started=0.0, stacks=Counter(stacks))
+
+    def test_merges_stacks_heaviest_first(self):
+        profiles = [
+            self._profile({("records:<module>", "records:records", "svc:search"): 6}),
+            self._profile({("records:<module>", "records:records", "ui:render"): 3, ("records:<module>",): 1}),
+        ]
+        self.assertEqual(
+            [(depth, label, count) for depth, label, count, _ in flame_summary(profiles)],
+            [
+                (0, "records:<module>", 10),
+                (1, "records:records", 9),
+                (2, "svc:search", 6),
+                (2, "ui:render", 3),
+            ],
+        )
+
+    def test_small_subtrees_are_dropped(self):
+        profile = self._profile({("a", "b"): 99, ("a", "c"): 1})
+        self.assertNotIn("c", [label for _, label, _, _ in flame_summary([profile], min_share=0.05)])
+
+    def test_collapsed_format(self):
+        profile = self._profile({("a", "b"): 2})
+        self.assertEqual(collapsed_stacks([profile, profile]), "a;b 4\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
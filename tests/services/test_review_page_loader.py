@@ -0,0 +1,80 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import unittest
+from unittest.mock import MagicMock
+
+from src.services.review_page_loader import (
+    LX_BASE_FORM_FROM,
+    LX_BASE_FORM_TO,
+    load_review_page_context,
+    lx_base_form,
+    parse_uploaded_record_id,
+)
+
+
+def _row(id, lx, mdf_data="", suggested_record_id=None):
+    row = MagicMock()
+    row.id = id
+    row.lx = lx
+    row.mdf_data = mdf_data or f"\\lx {lx}"
+    row.suggested_record_id = suggested_record_id
+    return row
+
+
+def _session(suggested=(), owners=(), matches=()):
+    """Mock session answering the loader's queries in the order it issues them."""
+    suggested_q = MagicMock()
+    suggested_q.filter.return_value.all.return_value = list(suggested)
+    owners_q = MagicMock()
+    owners_q.join.return_value.filter.return_value.all.return_value = list(owners)
+    matches_q = MagicMock()
+    matches_q.join.return_value.filter.return_value.distinct.return_value.all.return_value = list(matches)
+    session = MagicMock()
+    session.query.side_effect = ([suggested_q] if suggested else []) + ([owners_q] if owners else []) + [matches_q]
+    return session
+
+
+class TestLoadReviewPageContext(unittest.TestCase):
+    def test_one_query_per_concern_for_whole_page(self):
+        rec = MagicMock()
+        rec.id = 10
+        rows = [
+            _row(1, "ēsh", suggested_record_id=10),
+            _row(2, "wik", "\\lx wik\n\\nt Record: 77"),
+            _row(3, "none"),
+        ]
+        session = _session(
+            suggested=[rec],
+            owners=[(77, "Other B"), (77, "Other A")],
+            matches=[("esh", "esh", "Trumbull"), ("wik", "wik", "Nicholson")],
+        )
+
+        ctx = load_review_page_context(session, rows, source_id=1)
+
+        self.assertEqual(session.query.call_count, 3)
+        self.assertEqual(ctx.suggested_records, {10: rec})
+        self.assertEqual(ctx.uploaded_record_ids, {2: 77})
+        self.assertEqual(ctx.record_id_conflicts, {2: ["Other A", "Other B"]})
+        # "ēsh" matches "esh" through the diacritic-folded base form
+        self.assertEqual(ctx.cross_sources, {1: ["Trumbull"], 2: ["Nicholson"]})
+
+    def test_no_id_query_without_uploaded_record_ids(self):
+        session = _session()
+        ctx = load_review_page_context(session, [_row(1, "a")], source_id=1)
+        self.assertEqual(session.query.call_count, 1)
+        self.assertEqual(ctx.record_id_conflicts, {})
+        self.assertEqual(ctx.cross_sources, {})
+
+
+class TestHelpers(unittest.TestCase):
+    def test_lx_base_form_folds_diacritics_and_case(self):
+        self.assertEqual(lx_base_form("Ēsh"), "esh")
+        self.assertEqual(len(LX_BASE_FORM_FROM), len(LX_BASE_FORM_TO))
+
+    def test_parse_uploaded_record_id(self):
+        self.assertEqual(parse_uploaded_record_id("\\lx a\n  \\nt Record: 12"), 12)
+        self.assertIsNone(parse_uploaded_record_id("\\lx a\n\\nt Record: x"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,13 @@ from src.database.models.core import Language, Record, Source
 from src.database.models.identity import User
 from src.database.models.search import GlossSearchEntry, HeadwordSearchEntry, SearchEntry
 from src.database.models.workflow import EditHistory
+from src.services.history_store import (
+    STORAGE_DELTA,
+    STORAGE_KEYFRAME,
+    compact_history_tail,
+    history_entry,
+    load_history_data,
+)
 from src.services.upload_service import UploadService
 
 
@@ -190,6 +197,48 @@ class TestRollbackService(unittest.TestCase):
         r_final = self.session.get(Record, initial_id)
         self.assertEqual(r_final.lx, "bird")
 
+    def test_rollback_keeps_deltas_based_on_deleted_rows(self):
+        """A later row stored as a delta against a rolled-back row survives as a keyframe."""
+        rec = self._add_record("owl", "\\lx owl")
+        session_id = str(uuid.uuid4())
+        versions = [
+            (None, "Creation", "\\lx owl"),
+            (session_id, "Upload", "\\lx owl\n\\ge owl"),
+            (None, "Record locked", "\\lx owl\n\\ge owl"),
+            (session_id, "Upload again", "\\lx owl\n\\ge great owl"),
+        ]
+        prev = None
+        for version, (sid, summary, data) in enumerate(versions, 1):
+            compact_history_tail(self.session, [rec.id])
+            self.session.add(
+                history_entry(
+                    record_id=rec.id,
+                    user_email=self.user_email,
+                    session_id=sid,
+                    version=version,
+                    change_summary=summary,
+                    prev_data=prev,
+                    current_data=data,
+                )
+            )
+            self.session.commit()
+            prev = data
+        rec.mdf_data = prev
+        self.session.commit()
+        lock_row = self.session.query(EditHistory).filter_by(change_summary="Record locked").one()
+        self.assertEqual(lock_row.storage, STORAGE_DELTA)
+
+        result = UploadService.rollback_session(session_id, user_email=self.user_email)
+
+        self.assertEqual(result["rolled_back_count"], 1)
+        self.session.expire_all()
+        self.assertEqual(self.session.get(Record, rec.id).mdf_data, "\\lx owl")
+        remaining = self.session.query(EditHistory).filter_by(record_id=rec.id).order_by(EditHistory.id).all()
+        self.assertEqual([h.change_summary for h in remaining], ["Creation", "Record locked"])
+        self.assertEqual(remaining[1].storage, STORAGE_KEYFRAME)
+        snapshot = load_history_data(self.session, remaining)[remaining[1].id]
+        self.assertEqual(snapshot.current_data, "\\lx owl\n\\ge owl")
+
     def test_revert_batch_changes_no_post_import_edits(self):
         """Records with no post-import edits are counted as already_current."""
         session_id = str(uuid.uuid4())
@@ -0,0 +1,120 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Register every model so Record's relationships can be configured
+from src.database.models import core, identity, iso639, meta, search, workflow  # noqa: F401
+from src.mdf.parser import parse_record
+from src.services import search_index
+from src.services.search_index import (
+    KIND_FTS,
+    KIND_GLOSS,
+    KIND_HEADWORD,
+    KIND_SEARCH,
+    SEARCH_MAINTENANCE_ENV,
+    SearchRow,
+    cross_check_search_rows,
+    search_rows,
+    sync_search_triggers,
+)
+from src.services.sort_key import combining_mark_ranges, sort_key, sort_key_function_sql
+
+MDF = "\\lx Wôk\n\\va wauk\n\\se wôkash\n\\va wauk\n\\se wôkash\n\\ge corn"
+
+
+class TestSearchRows(unittest.TestCase):
+    def test_rows_per_table(self):
+        rows = search_rows(parse_record(MDF), MDF)
+        self.assertEqual(
+            rows[:5],
+            [
+                SearchRow(KIND_SEARCH, "lx", "Wôk", "wok"),
+                SearchRow(KIND_SEARCH, "va", "wauk", "wauk"),
+                SearchRow(KIND_SEARCH, "se", "wôkash", "wokash"),
+                SearchRow(KIND_HEADWORD, "lx", "Wôk", "wok"),
+                SearchRow(KIND_HEADWORD, "va", "wauk", "wauk"),
+            ],
+        )
+        # The va after \se is a variant of the subentry, not of the headword
+        self.assertEqual([r.kind for r in rows[5:]], [KIND_GLOSS, KIND_FTS])
+        self.assertEqual(rows[-1].term, sort_key(MDF))
+
+    def test_unparsed_record_has_no_rows(self):
+        self.assertEqual(search_rows(None, "\\ge orphan"), [])
+
+    def test_fts_can_be_skipped(self):
+        self.assertNotIn(KIND_FTS, {r.kind for r in search_rows(parse_record(MDF), MDF, with_fts=False)})
+
+
+class TestSortKeySql(unittest.TestCase):
+    def test_marks_come_from_unicodedata(self):
+        ranges = combining_mark_ranges()
+        self.assertTrue(any(lo <= 0x0301 <= hi for lo, hi in ranges))
+        self.assertFalse(any(lo <= ord("a") <= hi for lo, hi in ranges))
+
+    def test_function_encodes_every_rule(self):
+        sql = sort_key_function_sql()
+        self.assertIn("snea_sort_key(p_text text)", sql)
+        self.assertIn("IMMUTABLE", sql)
+        self.assertIn("'∞', 'oozzz'", sql)
+        self.assertIn("'✔', ''", sql)
+        self.assertIn("[\u0300-\u034e", sql)
+        # Straight single quotes inside the translate() target are doubled
+        self.assertIn("'''''", sql)
+
+
+class TestSyncSearchTriggers(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(setattr, search_index, "_triggers_active", False)
+
+    def _conn(self, existing):
+        conn = MagicMock()
+        conn.execute.return_value = [(name,) for name in existing]
+        return conn
+
+    def test_installs_missing_triggers(self):
+        conn = self._conn(["trg_records_search_insert"])
+        with patch.dict(os.environ, {SEARCH_MAINTENANCE_ENV: "trigger"}):
+            self.assertTrue(sync_search_triggers(conn))
+        statements = [str(c[0][0]) for c in conn.execute.call_args_list[1:]]
+        self.assertEqual(len(statements), 1)
+        self.assertIn("CREATE TRIGGER trg_records_search_update", statements[0])
+        self.assertTrue(search_index.search_triggers_active())
+
+    def test_app_mode_drops_installed_triggers(self):
+        conn = self._conn(["trg_records_search_insert", "trg_records_search_update"])
+        with patch.dict(os.environ, {SEARCH_MAINTENANCE_ENV: "app"}):
+            self.assertFalse(sync_search_triggers(conn))
+        statements = [str(c[0][0]) for c in conn.execute.call_args_list[1:]]
+        self.assertEqual(len(statements), 2)
+        self.assertTrue(all(s.startswith("DROP TRIGGER") for s in statements))
+
+    def test_app_mode_without_triggers_is_one_query(self):
+        conn = self._conn([])
+        with patch.dict(os.environ, {SEARCH_MAINTENANCE_ENV: ""}):
+            sync_search_triggers(conn)
+        self.assertEqual(conn.execute.call_count, 1)
+
+
+class TestCrossCheck(unittest.TestCase):
+    def test_reports_only_differences(self):
+        parsed = parse_record(MDF)
+        session = MagicMock()
+        session.query.return_value.filter.return_value = [(1, parsed, MDF), (2, parsed, MDF)]
+        sql_rows = [(1, *row) for row in search_rows(parsed, MDF)]
+        sql_rows += [(2, *row) for row in search_rows(parsed, MDF) if row.kind != KIND_GLOSS]
+        sql_rows.append((2, KIND_GLOSS, None, "corn", "CORN"))
+        session.execute.return_value = sql_rows
+
+        mismatches = cross_check_search_rows(session, [1, 2])
+
+        self.assertEqual(list(mismatches), [2])
+        only_python, only_sql = mismatches[2]
+        self.assertEqual(list(only_python), [SearchRow(KIND_GLOSS, None, "corn", "corn")])
+        self.assertEqual(list(only_sql), [SearchRow(KIND_GLOSS, None, "corn", "CORN")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import unittest
+from unittest.mock import MagicMock
+
+from src.services.upload_parse_cache import UploadParseCache, content_digest
+
+
+def _parse(content):
+    return [
+        {"lx": line.split(" ", 1)[1], "mdf_data": line} for line in content.splitlines() if line.startswith("\\lx ")
+    ]
+
+
+class TestUploadParseCache(unittest.TestCase):
+    def test_hit_skips_reparse(self):
+        cache = UploadParseCache()
+        parse = MagicMock(side_effect=_parse)
+        first = cache.get_or_parse("\\lx a\n\\ge b", parse)
+        second = cache.get_or_parse("\\lx a\n\\ge b", parse)
+        self.assertIs(first, second)
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(first.digest, content_digest("\\lx a\n\\ge b"))
+        self.assertEqual(first.summary_rows, [{"lx": "a", "ps": "", "ge": ""}])
+
+    def test_different_parser_is_a_miss(self):
+        cache = UploadParseCache()
+        cache.get_or_parse("\\lx a", _parse)
+        other = MagicMock(return_value=[])
+        self.assertEqual(cache.get_or_parse("\\lx a", other).entries, [])
+        other.assert_called_once()
+
+    def test_value_error_is_cached(self):
+        cache = UploadParseCache()
+        parse = MagicMock(side_effect=ValueError("No valid MDF entries found"))
+        result = cache.get_or_parse("junk", parse)
+        cache.get_or_parse("junk", parse)
+        self.assertEqual(result.error, "No valid MDF entries found")
+        self.assertEqual(result.entries, [])
+        self.assertEqual(parse.call_count, 1)
+
+    def test_evicts_least_recently_used_by_count(self):
+        cache = UploadParseCache(max_items=2)
+        cache.get_or_parse("\\lx a", _parse)
+        cache.get_or_parse("\\lx b", _parse)
+        cache.get_or_parse("\\lx a", _parse)  # refresh a
+        cache.get_or_parse("\\lx c", _parse)  # evicts b
+        self.assertEqual(len(cache), 2)
+        misses = cache.misses
+        cache.get_or_parse("\\lx a", _parse)
+        self.assertEqual(cache.misses, misses)
+        cache.get_or_parse("\\lx b", _parse)
+        self.assertEqual(cache.misses, misses + 1)
+
+    def test_evicts_by_total_size(self):
+        cache = UploadParseCache(max_chars=12)
+        cache.get_or_parse("\\lx aaaa", _parse)  # 8 chars
+        cache.get_or_parse("\\lx bbbb", _parse)  # 16 total: evicts the first
+        self.assertEqual(len(cache), 1)
+        cache.get_or_parse("\\lx " + "c" * 20, _parse)  # larger than the cap: not stored
+        self.assertEqual(len(cache), 1)
+
+    def test_clear(self):
+        cache = UploadParseCache()
+        cache.get_or_parse("\\lx a", _parse)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestPreviewPage(unittest.TestCase):
+    def test_pages_without_splitting(self):
+        content = "\n".join(f"line {i}" for i in range(5))
+        parsed = UploadParseCache().get_or_parse(content, _parse)
+        self.assertEqual(parsed.line_count, 5)
+        self.assertEqual(parsed.preview_page(content, 0, 2), "line 0\nline 1")
+        self.assertEqual(parsed.preview_page(content, 2, 2), "line 4")
+        self.assertEqual(parsed.preview_page(content, 3, 2), "")
+
+    def test_trailing_newline(self):
+        content = "a\nb\n"
+        parsed = UploadParseCache().get_or_parse(content, _parse)
+        self.assertEqual(parsed.preview_page(content, 0, 2), "a\nb")
+        self.assertEqual(parsed.preview_page(content, 1, 2), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import unittest
+
+from benchmarks.compare import compare
+from benchmarks.corpus import CorpusSpec, generate_corpus, generate_records
+from src.mdf.parser import parse_mdf
+
+
+class TestBenchmarkCorpus(unittest.TestCase):
+    def setUp(self):
+        self.spec = CorpusSpec(records=300)
+        self.entries = parse_mdf(generate_corpus(self.spec))
+
+    def test_deterministic(self):
+        self.assertEqual(generate_corpus(self.spec), generate_corpus(CorpusSpec(records=300)))
+        self.assertNotEqual(generate_corpus(self.spec), generate_corpus(CorpusSpec(records=300, seed=1)))
+
+    def test_every_record_parses(self):
+        self.assertEqual(len(self.entries), 300)
+        self.assertEqual([e["record_id"] for e in self.entries], list(range(1, 301)))
+
+    def test_features_present(self):
+        self.assertTrue(any(e["hm"] > 1 for e in self.entries))
+        self.assertTrue(any(e["lg"] for e in self.entries))
+        self.assertTrue(any(e["se"] for e in self.entries))
+        self.assertTrue(any("∞" in e["lx"] for e in self.entries))
+        self.assertTrue(any(c in e["lx"] for e in self.entries for c in "ôâêû"))
+
+    def test_revision_keeps_headwords(self):
+        revised = generate_records(CorpusSpec(records=300, revision=2))
+        original = generate_records(self.spec)
+        self.assertEqual([r.split("\n", 2)[:2] for r in revised], [r.split("\n", 2)[:2] for r in original])
+        self.assertNotEqual(revised, original)
+
+    def test_no_record_ids(self):
+        self.assertNotIn("\\nt Record:", generate_corpus(CorpusSpec(records=20, record_ids=False)))
+
+
+class TestCompare(unittest.TestCase):
+    def test_ratios(self):
+        old = {"results": {"a": {"median_s": 2.0}, "b": {"median_s": 1.0}}}
+        new = {"results": {"a": {"median_s": 3.0}, "c": {"median_s": 1.0}}}
+        self.assertEqual(compare(old, new), [("a", 2.0, 3.0, 1.5), ("b", 1.0, None, None), ("c", None, 1.0, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
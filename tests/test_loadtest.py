@@ -0,0 +1,53 @@
+# Copyright (c) 2026 Brothertown Language
+# <!-- CRITICAL: NO EDITS WITHOUT APPROVED PLAN (Wait for "Go", "Proceed", or "Approved") -->
+import argparse
+import logging
+import unittest
+
+from benchmarks.loadtest import Recorder, _ErrorLogClassifier, classify, parse_mix
+
+
+class TestLoadTestHelpers(unittest.TestCase):
+    def test_classify(self):
+        self.assertEqual(
+            classify("UPDATE statement on table 'records' expected to update 1 row(s); 0 were matched."), "stale_data"
+        )
+        self.assertEqual(classify("(psycopg2.errors.DeadlockDetected) deadlock detected"), "deadlock")
+        self.assertEqual(
+            classify("QueuePool limit of size 0 overflow 10 reached, connection timed out"), "pool_timeout"
+        )
+        self.assertIsNone(classify("Updated record 3"))
+
+    def test_parse_mix(self):
+        self.assertEqual(parse_mix("search=6,edit=3,upload=1"), {"search": 6, "edit": 3, "upload": 1})
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_mix("browse=1")
+
+
+class TestRecorder(unittest.TestCase):
+    def test_false_result_and_exceptions_fail(self):
+        rec = Recorder()
+        rec.timed("op", lambda: True)
+        rec.timed("op", lambda: False)
+        rec.timed("op", lambda: (_ for _ in ()).throw(RuntimeError("deadlock detected")))
+        self.assertEqual(len(rec.latencies["op"]), 3)
+        self.assertEqual(rec.failures["op"], {"failed": 2, "deadlock": 1})
+
+    def test_swallowed_errors_are_attributed_from_logs(self):
+        logger = logging.getLogger("snea.loadtest_probe")
+        handler = _ErrorLogClassifier(level=logging.WARNING)
+        logger.addHandler(handler)
+        self.addCleanup(logger.removeHandler, handler)
+
+        def update_record():
+            logger.error("Failed to update record 1: UPDATE statement on table 'records' expected to update 1 row(s)")
+            return False
+
+        rec = Recorder()
+        rec.timed("update_record", update_record)
+        logger.error("expected to update 1 row(s), outside any operation")
+        self.assertEqual(rec.failures["update_record"], {"failed": 1, "stale_data": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()